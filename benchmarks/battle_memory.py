@@ -0,0 +1,176 @@
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict
+
+from robopy.api.events import ScannedRobotEvent
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.events import EventCore, EventKind
+from robopy.core.execution import BattleState, Command, Scheduler, TurnPhase
+from robopy.core.objects import BattlefieldCore, BulletCore
+from robopy.wrapper.robot import RobotWrapper
+
+#: Measures the memory of a reference battle (ROBOTS robots for TURNS turns): the tracemalloc
+#: peak of the whole battle, and the memory allocated within each tick (the peak of the tick
+#: above the memory traced at its start). Turns are driven from this thread with scripted
+#: commands (robots spin their radar, wander and fire weak bullets so all of them survive),
+#: and every robot consumes all of its events, so runs are deterministic and comparable.
+#: Then the same battle is run again to count the blocks allocated by the turn logic of every
+#: SNAPSHOT_TURNS-th tick (the snapshot after the logic against the snapshot before it, by count, so
+#: events waiting to be consumed are counted), as snapshots are traced themselves. The TOP sites by count
+#: are reported. The traced size of the most created objects is measured too.
+#: Usage (from the repository root): PYTHONPATH=. python benchmarks/battle_memory.py [turns] [--vectorized]
+
+ROBOTS: int = 10
+TURNS: int = 1000
+SEED: int = 0
+SNAPSHOT_TURNS: int = 50
+TOP: int = 5
+
+#: The blocks allocated by tracemalloc (i.e. its snapshots) aren't counted.
+FILTERS: tuple = (tracemalloc.Filter(False, tracemalloc.__file__),)
+
+
+class Scripted(Robot):
+    def _run(self):
+        pass
+
+
+def command(turn: int) -> dict:
+    return dict(
+        move=random.uniform(-100, 100),
+        turn=random.uniform(-1, 1),
+        turn_radar=1.0,
+        fire=0.1 if turn % 20 == 0 else 0.0,
+        scan=True
+    )
+
+
+def setup(vectorized: bool) -> tuple:
+    random.seed(SEED)
+
+    battle = Battle((800, 600), [Scripted] * ROBOTS, scheduler=Scheduler.FIXED, turn_time=None, vectorized=vectorized,
+                    seed=SEED)
+    battle.statistics.battle_state = BattleState.RUNNING
+    battle._setup()
+
+    #: Robots consume every kind of events.
+    event_managers = []
+    for robot in battle.robots:
+        robot.subscriptions.update(EventKind)
+        event_managers.append(RobotWrapper(robot).event_manager)
+    return battle, event_managers
+
+
+def logic(battle: Battle, turn: int):
+    battle.robot_order.reset()
+    battle.bullet_order.reset()
+    battle.phase = TurnPhase.EXECUTION
+
+    robots = tuple(robot for robot in battle.robots if not robot.dead)
+    for robot in robots:
+        robot.command.apply(command(turn))
+    battle._logic(robots)
+
+
+def consume(event_managers: list) -> int:
+    events = 0
+    for event_manager in event_managers:
+        event_manager.process()
+        while not event_manager.empty:
+            event_manager.consume()
+            events += 1
+    return events
+
+
+def benchmark(vectorized: bool):
+    tracemalloc.start()
+    battle, event_managers = setup(vectorized)
+
+    tick_allocations = []
+    events = 0
+    start = time.perf_counter()
+    for turn in range(TURNS):
+        if battle.statistics.battle_state is not BattleState.RUNNING:
+            break
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        logic(battle, turn)
+        events += consume(event_managers)
+
+        _, peak = tracemalloc.get_traced_memory()
+        tick_allocations.append(peak - traced)
+    elapsed = time.perf_counter() - start
+
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    turns = len(tick_allocations)
+    print(f"{'vectorized' if vectorized else 'scalar'}: {turns} turns, {events} events, "
+          f"{sum(not robot.dead for robot in battle.robots)} robots alive, {1e3 * elapsed / turns:.2f} ms/turn")
+    print(f"  peak {peak / 1024:.0f} KiB, retained {current / 1024:.0f} KiB, "
+          f"allocated per tick {sum(tick_allocations) / turns / 1024:.1f} KiB "
+          f"(max {max(tick_allocations) / 1024:.1f} KiB)")
+
+
+def allocation_counts(vectorized: bool):
+    tracemalloc.start()
+    battle, event_managers = setup(vectorized)
+
+    sites: Dict[str, int] = {}
+    blocks = 0
+    ticks = 0
+    for turn in range(TURNS):
+        if battle.statistics.battle_state is not BattleState.RUNNING:
+            break
+        if turn % SNAPSHOT_TURNS != 0:
+            logic(battle, turn)
+            consume(event_managers)
+            continue
+
+        before = tracemalloc.take_snapshot().filter_traces(FILTERS)
+        logic(battle, turn)
+        after = tracemalloc.take_snapshot().filter_traces(FILTERS)
+        consume(event_managers)
+
+        for statistic in after.compare_to(before, "lineno"):
+            if statistic.count_diff > 0:
+                frame = statistic.traceback[0]
+                site = f"{frame.filename}:{frame.lineno}"
+                sites[site] = sites.get(site, 0) + statistic.count_diff
+                blocks += statistic.count_diff
+        ticks += 1
+    tracemalloc.stop()
+
+    print(f"  blocks allocated per tick {blocks / ticks:.0f} (alive once the logic ends, {ticks} ticks)")
+    for site, count in sorted(sites.items(), key=lambda item: item[1], reverse=True)[:TOP]:
+        print(f"    {count / ticks:.1f} {site}")
+
+
+def object_sizes(count: int = 10000):
+    battlefield = BattlefieldCore((800, 600))
+    for name, create in (
+            ("EventCore", lambda: EventCore(0, EventKind.ScannedRobot, ())),
+            ("BulletCore", lambda: BulletCore(battlefield, 0.0, 0.0, 0.0, None, 1.0)),
+            ("Command", Command),
+            ("ScannedRobotEvent", lambda: ScannedRobotEvent(0, "robot", 0.0, 100.0, 8.0, 0.5, 200.0)),
+    ):
+        tracemalloc.start()
+        objects = [create() for _ in range(count)]
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        #: The list itself holds a pointer per object.
+        print(f"  {name}: {(traced - 8 * len(objects)) / count:.0f} B")
+
+
+if __name__ == "__main__":
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith("--")]
+    if len(arguments) > 0:
+        TURNS = int(arguments[0])
+
+    benchmark("--vectorized" in sys.argv)
+    allocation_counts("--vectorized" in sys.argv)
+    object_sizes()
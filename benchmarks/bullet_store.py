@@ -0,0 +1,92 @@
+import random
+import sys
+import time
+from typing import Tuple
+
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import BattleState, Scheduler, TurnPhase
+
+#: Compares the bullet updates of the scalar engine (BulletCore.update, bullet by bullet) and of the vectorized
+#: engine (BulletStore.update): the time of each turn's BULLETS phase of battles of ROBOTS robots (each count in turn)
+#: on a DIMENSIONS battlefield, for TURNS turns. Robots barely move and fire the weakest bullets as often as they can,
+#: so hundreds of bullets fly at once. Both engines index robots and bullets within this phase.
+#: Each battle is run REPEATS times and the fastest run is reported.
+#: Usage (from the repository root): PYTHONPATH=. python benchmarks/bullet_store.py [turns] [robots...]
+
+ROBOTS: tuple = (10, 50, 100, 200)
+TURNS: int = 300
+DIMENSIONS: tuple = (4000, 4000)
+SEED: int = 0
+REPEATS: int = 3
+
+
+class Scripted(Robot):
+    def _run(self):
+        pass
+
+
+class TimedBattle(Battle):
+    #: Accumulates the time spent in the BULLETS phase.
+    bullets_time: float = 0.0
+
+    @property
+    def phase(self) -> TurnPhase:
+        return self.__phase
+
+    @phase.setter
+    def phase(self, phase: TurnPhase):
+        now = time.perf_counter()
+        if getattr(self, "_TimedBattle__phase", None) is TurnPhase.BULLETS:
+            self.bullets_time += now - self.__started
+        self.__phase, self.__started = phase, now
+
+
+def command(rng: random.Random) -> dict:
+    return dict(
+        move=rng.uniform(-10, 10),
+        turn_gun=rng.uniform(-0.5, 0.5),
+        fire=0.1,
+    )
+
+
+def benchmark(robots: int, vectorized: bool) -> Tuple[float, int]:
+    #: Returns the time of the BULLETS phase (ms per turn) and the number of bullets left.
+    rng = random.Random(SEED)
+    battle = TimedBattle(DIMENSIONS, [Scripted] * robots, scheduler=Scheduler.FIXED, turn_time=None,
+                         vectorized=vectorized, seed=SEED)
+    battle.statistics.battle_state = BattleState.RUNNING
+    battle._setup()
+
+    turns = 0
+    for turn in range(TURNS):
+        if battle.statistics.battle_state is not BattleState.RUNNING:
+            break
+        battle.robot_order.reset()
+        battle.bullet_order.reset()
+        battle.phase = TurnPhase.EXECUTION
+
+        alive = tuple(robot for robot in battle.robots if not robot.dead)
+        for robot in alive:
+            robot.command.apply(command(rng))
+
+        battle._logic(alive)
+        turns += 1
+
+        for robot in battle.robots:
+            robot.events.swap()
+    return 1e3 * battle.bullets_time / turns, len(battle.bullets)
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    if len(arguments) > 0:
+        TURNS = int(arguments[0])
+    if len(arguments) > 1:
+        ROBOTS = tuple(int(argument) for argument in arguments[1:])
+
+    for count in ROBOTS:
+        scalar, bullets = min(benchmark(count, False) for _ in range(REPEATS))
+        vectorized, _ = min(benchmark(count, True) for _ in range(REPEATS))
+        print(f"{count} robots ({bullets} bullets): scalar {scalar:.2f} ms/turn, vectorized {vectorized:.2f} ms/turn "
+              f"({scalar / vectorized:.2f}x)")
@@ -0,0 +1,70 @@
+import math
+import sys
+import time
+
+from robopy.api.robot import CooperativeRobot, Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import BattleState, Scheduler
+
+#: Compares the turns per second of battles of blocking robots (each one running on its own thread)
+#: against battles of the same robots written as generators and coroutines (resumed by the battle thread),
+#: with the BARRIER scheduler, so each turn lasts as long as the robots take to submit their commands.
+#: Robots submit a command every turn (short moves and turns, so the engine never performs them on its own),
+#: thus every robot is handed the control of the battle once per turn. They don't fire, so the battles last
+#: TURNS turns (then they're stopped).
+#: Usage (from the repository root): PYTHONPATH=. python benchmarks/cooperative_robots.py [turns] [robots]
+
+TURNS: int = 2000
+ROBOTS: int = 10
+
+
+class Blocking(Robot):
+    def _run(self):
+        while True:
+            self.turn_radar(math.radians(45))
+            self.turn(math.radians(self.random.uniform(-5, 5)))
+            self.move(self.random.uniform(-5, 5))
+            self.execute()
+
+
+class Generator(CooperativeRobot):
+    def _run(self):
+        while True:
+            self.turn_radar(math.radians(45))
+            self.turn(math.radians(self.random.uniform(-5, 5)))
+            self.move(self.random.uniform(-5, 5))
+            yield from self.execute()
+
+
+class Coroutine(CooperativeRobot):
+    async def _run(self):
+        while True:
+            self.turn_radar(math.radians(45))
+            self.turn(math.radians(self.random.uniform(-5, 5)))
+            self.move(self.random.uniform(-5, 5))
+            await self.execute()
+
+
+def benchmark(robot_class) -> float:
+    battle = Battle((800, 600), [robot_class] * ROBOTS, scheduler=Scheduler.BARRIER, turn_time=1.0)
+
+    start = time.perf_counter()
+    battle.start()
+    while battle.statistics.time < TURNS and battle.statistics.battle_state is not BattleState.ENDED:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    turns = battle.statistics.time
+    battle.stop()
+    battle.join()
+
+    return turns / elapsed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        TURNS = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        ROBOTS = int(sys.argv[2])
+
+    for robot_class in (Blocking, Generator, Coroutine):
+        print(f"{robot_class.__name__}: {benchmark(robot_class):.0f} turns/s ({ROBOTS} robots)")
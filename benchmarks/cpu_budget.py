@@ -0,0 +1,54 @@
+import sys
+import time
+
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import BattleState, Scheduler
+from robopy.sample.crazy import Crazy
+from robopy.sample.spin_bot import SpinBot
+from robopy.sample.track_fire import TrackFire
+from robopy.sample.walls import Walls
+
+#: Compares the turns per second of a battle with a robot spending SLOW_CPU_TIME of CPU time on every
+#: command, with the BARRIER scheduler, without and with the CPU time per command (so its commands
+#: skip turns, until it's disabled and no longer waited for). The battles are stopped after TURNS turns,
+#: then the CPU time per command of each robot is reported.
+#: Usage (from the repository root): PYTHONPATH=. python benchmarks/cpu_budget.py [turns]
+
+TURNS: int = 500
+SLOW_CPU_TIME: float = 0.03
+
+
+class Slow(Robot):
+    def _run(self):
+        while True:
+            end = time.thread_time() + SLOW_CPU_TIME
+            while time.thread_time() < end:
+                pass
+            self.turn(0.3)
+            self.move(30, execute=True)
+
+
+def benchmark(cpu_time):
+    battle = Battle((800, 600), [Slow, TrackFire, Walls, SpinBot, Crazy], scheduler=Scheduler.BARRIER, turn_time=1.0,
+                    cpu_time=cpu_time)
+
+    start = time.perf_counter()
+    battle.start()
+    while battle.statistics.time < TURNS and battle.statistics.battle_state is BattleState.RUNNING:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    turns = battle.statistics.time
+    battle.stop()
+    battle.join()
+
+    print(f"CPU time per command {cpu_time}: {turns / elapsed:.0f} turns/s")
+    print(battle.latency_report())
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        TURNS = int(sys.argv[1])
+
+    benchmark(None)
+    benchmark(0.01)
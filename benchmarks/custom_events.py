@@ -0,0 +1,91 @@
+import sys
+import time
+
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import BattleState, Scheduler, TurnPhase
+
+#: Measures the custom events evaluation of a battle of ROBOTS robots, each one with the same
+#: CONDITIONS conditions, written either as callables (evaluated one by one) or as declarative
+#: conditions (evaluated at once for all robots), and callables along with a slow one (which
+#: is dropped once it keeps exceeding the time budget). Turns are driven from this thread
+#: (robots don't move), so only the evaluation of the conditions differs between runs.
+#: Usage (from the repository root): PYTHONPATH=. python benchmarks/custom_events.py [turns] [--vectorized]
+
+ROBOTS: int = 20
+TURNS: int = 2000
+CONDITIONS: dict = {
+    "low energy": "energy < 20",
+    "gun ready": "gun_heat == 0",
+    "near wall": "wall_distance < 50",
+    "stopped": "velocity == 0 and move == 0",
+    "left half": "x < 400",
+}
+SLOW_CONDITION_TIME: float = 0.005
+
+
+class Listener(Robot):
+    def _run(self):
+        pass
+
+    def handle_custom(self, event):
+        pass
+
+
+def callables(robot) -> dict:
+    return {
+        "low energy": lambda: robot.energy < 20,
+        "gun ready": lambda: robot.gun_heat == 0,
+        "near wall": lambda: min(robot.x, robot.y, 800 - robot.x, 600 - robot.y) - 18 < 50,
+        "stopped": lambda: robot.velocity == 0 and robot.status["action_status"]["move"] == 0,
+        "left half": lambda: robot.x < 400,
+    }
+
+
+def slow() -> bool:
+    #: Conditions are timed by CPU time, thus it must be spent (sleeping doesn't count).
+    deadline = time.thread_time() + SLOW_CONDITION_TIME
+    while time.thread_time() < deadline:
+        pass
+    return False
+
+
+def slow_callables(robot) -> dict:
+    return {**callables(robot), "slow": slow}
+
+
+def benchmark(name: str, conditions, vectorized: bool):
+    battle = Battle((800, 600), [Listener] * ROBOTS, scheduler=Scheduler.FIXED, turn_time=None, vectorized=vectorized)
+    battle.statistics.battle_state = BattleState.RUNNING
+    battle._setup()
+    for robot, thread in battle.robot_threads.items():
+        for event_name, condition in conditions(thread).items():
+            robot.custom_events.add(event_name, condition)
+
+    turn_times = []
+    robots = tuple(battle.robots)
+    for _ in range(TURNS):
+        battle.robot_order.reset()
+        battle.bullet_order.reset()
+        battle.phase = TurnPhase.EXECUTION
+
+        start = time.perf_counter()
+        battle._logic(robots)
+        turn_times.append(time.perf_counter() - start)
+        for robot in robots:
+            robot.events.swap()
+
+    remaining = sum(len(robot.custom_events) for robot in robots)
+    print(f"{name}: {1e6 * sum(turn_times) / TURNS:.0f} us/turn "
+          f"(first turn {1e3 * turn_times[0]:.2f} ms, {remaining} conditions left)")
+
+
+if __name__ == "__main__":
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith("--")]
+    if len(arguments) > 0:
+        TURNS = int(arguments[0])
+
+    vectorized = "--vectorized" in sys.argv
+    benchmark("callables", callables, vectorized)
+    benchmark("declarative", lambda robot: CONDITIONS, vectorized)
+    benchmark("callables and a slow one", slow_callables, vectorized)
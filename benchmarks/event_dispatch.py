@@ -0,0 +1,102 @@
+import sys
+import time
+
+from robopy.api.robot import Robot
+from robopy.core.events import EventKind
+from robopy.core.execution import Statistics
+from robopy.core.objects import BattlefieldCore, BulletCore, RobotCore
+from robopy.wrapper.robot import RobotWrapper
+
+#: Measures the event delivery of a robot: the battle thread publishing a melee-like
+#: turn of events, and the robot thread queueing, building and dispatching them
+#: to its handlers (which either ignore or read the bullets of the events).
+#: Usage (from the repository root): PYTHONPATH=. python benchmarks/event_dispatch.py [turns]
+
+TURNS: int = 20000
+SCANNED_ROBOTS: int = 8
+
+
+class Handler(Robot):
+    def _run(self):
+        pass
+
+    def handle_bullet_hit(self, event):
+        self.handled += 1
+
+    def handle_bullet_hit_bullet(self, event):
+        self.handled += 1
+
+    def handle_bullet_missed(self, event):
+        self.handled += 1
+
+    def handle_hit_by_bullet(self, event):
+        self.handled += 1
+
+    def handle_hit_robot(self, event):
+        self.handled += 1
+
+    def handle_hit_wall(self, event):
+        self.handled += 1
+
+    def handle_scanned_robot(self, event):
+        self.handled += 1
+
+    def handle_status(self, event):
+        self.handled += 1
+
+
+class BulletReader(Handler):
+    def handle_bullet_hit(self, event):
+        self.handled += event.bullet.power > 0
+
+    def handle_bullet_hit_bullet(self, event):
+        self.handled += event.bullet.power >= event.hit_bullet.power
+
+    def handle_bullet_missed(self, event):
+        self.handled += event.bullet.power > 0
+
+    def handle_hit_by_bullet(self, event):
+        self.handled += event.bullet.power > 0
+
+
+def benchmark(robot_class) -> float:
+    statistics = Statistics(2)
+    battlefield = BattlefieldCore((800, 600))
+    core = RobotCore("robot", statistics, battlefield, ())
+    enemy = RobotCore("enemy", statistics, battlefield, (core,))
+    robot = robot_class(RobotWrapper(core))
+    robot.handled = 0
+    #: Robots only process their events from their own thread.
+    process_events = getattr(robot, "_Robot__process_events")
+
+    start = time.perf_counter()
+    for turn in range(TURNS):
+        bullet = BulletCore(battlefield, core.x, core.y, core.heading, core, 1.0)
+        enemy_bullet = BulletCore(battlefield, enemy.x, enemy.y, enemy.heading, enemy, 1.0)
+
+        core.add_event(EventKind.Status, (core.status,))
+        for _ in range(SCANNED_ROBOTS):
+            core.add_event(EventKind.ScannedRobot, ("enemy", 0.0, 100.0, 8.0, 0.5, 200.0))
+        core.add_event(EventKind.BulletHit, ("enemy", 100.0, bullet))
+        core.add_event(EventKind.BulletHitBullet, (bullet, enemy_bullet))
+        core.add_event(EventKind.BulletMissed, (bullet,))
+        core.add_event(EventKind.HitByBullet, (0.5, enemy_bullet))
+        core.add_event(EventKind.HitRobot, ("enemy", 100.0, 0.5, True))
+        core.add_event(EventKind.HitWall, (0.5,))
+
+        statistics.tick()
+        core.invalidate_status()
+        process_events(refresh_queue=True)
+    elapsed = time.perf_counter() - start
+
+    assert robot.handled == TURNS * (SCANNED_ROBOTS + 7)
+    return elapsed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        TURNS = int(sys.argv[1])
+
+    for name, robot_class in (("handlers ignoring bullets", Handler), ("handlers reading bullets", BulletReader)):
+        elapsed = benchmark(robot_class)
+        print(f"{name}: {1e6 * elapsed / TURNS:.1f} us/turn ({SCANNED_ROBOTS + 7} events per turn)")
@@ -0,0 +1,69 @@
+import sys
+import time
+from threading import Thread
+
+from robopy.utils.threading import List as ThreadingList, Mailbox
+
+#: Compares the event queues of robots: the former ThreadingList (drained under its lock)
+#: against the Mailbox (swapped once per turn), with the battle thread writing
+#: EVENTS events per turn and the robot thread reading them.
+#: Usage (from the repository root): PYTHONPATH=. python benchmarks/event_mailbox.py [turns]
+
+TURNS: int = 20000
+EVENTS: int = 40
+
+
+def drain_list(events: ThreadingList) -> list:
+    with events:
+        items = list(events)
+        events.clear()
+    return items
+
+
+def drain_mailbox(events: Mailbox) -> list:
+    return events.swap()
+
+
+def sequential(events, drain) -> float:
+    start = time.perf_counter()
+    for turn in range(TURNS):
+        for event in range(EVENTS):
+            events.append(event)
+        assert len(drain(events)) == EVENTS
+    return time.perf_counter() - start
+
+
+def concurrent(events, drain) -> float:
+    #: The writer and the reader run on different threads, as the battle and the robots do.
+    received = []
+
+    def read():
+        while len(received) < TURNS * EVENTS:
+            received.extend(drain(events))
+            #: Let the writer run, as robots do between turns.
+            time.sleep(0)
+
+    reader = Thread(target=read)
+    start = time.perf_counter()
+    reader.start()
+    for turn in range(TURNS):
+        for event in range(EVENTS):
+            events.append(turn * EVENTS + event)
+    reader.join()
+    elapsed = time.perf_counter() - start
+
+    #: Nothing is lost nor reordered.
+    assert received == list(range(TURNS * EVENTS))
+    return elapsed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        TURNS = int(sys.argv[1])
+
+    for name, benchmark in (("sequential", sequential), ("concurrent", concurrent)):
+        list_time = benchmark(ThreadingList(), drain_list)
+        mailbox_time = benchmark(Mailbox(), drain_mailbox)
+        print(f"{name}: ThreadingList {1e9 * list_time / (TURNS * EVENTS):.0f} ns/event, "
+              f"Mailbox {1e9 * mailbox_time / (TURNS * EVENTS):.0f} ns/event "
+              f"({list_time / mailbox_time:.1f}x)")
@@ -0,0 +1,79 @@
+import random
+import sys
+import time
+
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import BattleState, Scheduler, TurnPhase
+
+#: Compares the scalar and the vectorized engines: the time of each turn's logic (all of its phases)
+#: of battles of ROBOTS robots (each count in turn) on a DIMENSIONS battlefield, for TURNS turns.
+#: Turns are driven from this thread with the same scripted commands for both engines (robots
+#: wander, turn their gun and radar and fire now and then), so only the engine differs between runs.
+#: Each battle is run REPEATS times and the fastest run is reported, as turns take a few milliseconds.
+#: Usage (from the repository root): PYTHONPATH=. python benchmarks/physics_engines.py [turns] [robots...]
+
+ROBOTS: tuple = (10, 50, 100, 200)
+TURNS: int = 300
+DIMENSIONS: tuple = (2000, 2000)
+SEED: int = 0
+REPEATS: int = 3
+
+
+class Scripted(Robot):
+    def _run(self):
+        pass
+
+
+def command(rng: random.Random, turn: int) -> dict:
+    return dict(
+        move=rng.uniform(-100, 100),
+        turn=rng.uniform(-1, 1),
+        turn_gun=rng.uniform(-0.5, 0.5),
+        turn_radar=1.0,
+        fire=rng.choice([0.5, 1.0, 2.0]) if turn % 10 == 0 else 0.0,
+    )
+
+
+def benchmark(robots: int, vectorized: bool) -> float:
+    rng = random.Random(SEED)
+    battle = Battle(DIMENSIONS, [Scripted] * robots, scheduler=Scheduler.FIXED, turn_time=None,
+                    vectorized=vectorized, seed=SEED)
+    battle.statistics.battle_state = BattleState.RUNNING
+    battle._setup()
+
+    elapsed = 0.0
+    turns = 0
+    for turn in range(TURNS):
+        if battle.statistics.battle_state is not BattleState.RUNNING:
+            break
+        battle.robot_order.reset()
+        battle.bullet_order.reset()
+        battle.phase = TurnPhase.EXECUTION
+
+        alive = tuple(robot for robot in battle.robots if not robot.dead)
+        for robot in alive:
+            robot.command.apply(command(rng, turn))
+
+        start = time.perf_counter()
+        battle._logic(alive)
+        elapsed += time.perf_counter() - start
+        turns += 1
+
+        for robot in battle.robots:
+            robot.events.swap()
+    return 1e3 * elapsed / turns
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    if len(arguments) > 0:
+        TURNS = int(arguments[0])
+    if len(arguments) > 1:
+        ROBOTS = tuple(int(argument) for argument in arguments[1:])
+
+    for count in ROBOTS:
+        scalar = min(benchmark(count, False) for _ in range(REPEATS))
+        vectorized = min(benchmark(count, True) for _ in range(REPEATS))
+        print(f"{count} robots: scalar {scalar:.2f} ms/turn, vectorized {vectorized:.2f} ms/turn "
+              f"({scalar / vectorized:.2f}x)")
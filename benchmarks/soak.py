@@ -0,0 +1,78 @@
+import gc
+import os
+import resource
+import sys
+import threading
+import time
+
+from robopy.api.robot import CooperativeRobot, Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import BattleState, Scheduler
+from robopy.sample.crazy import Crazy
+from robopy.sample.spin_bot import SpinBot
+from robopy.sample.walls import Walls
+
+#: Runs BATTLES consecutive battles (each one stopped after TURNS turns) on the same process, as a long-lived
+#: tournament worker does, and reports its thread count and resident memory every REPORT battles, which must
+#: stay flat: robots blocked on its execution, robots looping without executing, and cooperative robots
+#: must all be stopped (and their resources released) by each battle.
+#: Usage (from the repository root): PYTHONPATH=. python benchmarks/soak.py [battles] [turns]
+
+BATTLES: int = 1000
+TURNS: int = 20
+REPORT: int = 100
+
+
+class Spinner(Robot):
+    #: Loops without executing anymore, thus it must be forced to stop.
+    def _run(self):
+        self.execute()
+        while True:
+            pass
+
+
+class Generator(CooperativeRobot):
+    def _run(self):
+        while True:
+            yield from self.move(50, execute=True)
+            yield from self.turn(1.0, execute=True)
+
+
+def rss() -> float:
+    #: Resident memory (in MiB), or its peak if the current one isn't available.
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+def battle_round() -> int:
+    battle = Battle((800, 600), [Spinner, Generator, Walls, SpinBot, Crazy], scheduler=Scheduler.BARRIER,
+                    turn_time=0.01)
+    battle.start()
+    while battle.statistics.time < TURNS and battle.statistics.battle_state is BattleState.RUNNING:
+        time.sleep(0.001)
+    if battle.statistics.battle_state is not BattleState.STOPPED:
+        battle.stop()
+    battle.join()
+    return sum(robot.robot_statistics.abandoned for robot in battle.robots)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        BATTLES = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        TURNS = int(sys.argv[2])
+
+    #: The spinners are forced to stop, so they don't need long.
+    Battle.STOP_TIME = Battle.FORCED_STOP_TIME = 0.05
+
+    abandoned = 0
+    start = time.perf_counter()
+    for battle in range(1, BATTLES + 1):
+        abandoned += battle_round()
+        if battle % REPORT == 0 or battle == BATTLES:
+            gc.collect()
+            print(f"battle {battle}: {threading.active_count()} threads, {rss():.1f} MiB, "
+                  f"{abandoned} robots abandoned, {time.perf_counter() - start:.0f} s")
@@ -1,56 +1,110 @@
-from robopy.api.objects import Bullet
+from typing import Dict, Type, Union
+
+from robopy.api.objects import Bullet, wrap_bullet
+from robopy.core.events import EventKind
+from robopy.core.execution import RobotStatus
+from robopy.core.objects import BulletCore
 
 
 class Event:
+    __slots__ = ("time",)
+
     def __init__(self, time: int):
         self.time: int = time
 
 
 class BulletHitEvent(Event):
-    def __init__(self, time: int, name: str, energy: float, bullet: Bullet):
+    __slots__ = ("name", "energy", "__bullet")
+
+    def __init__(self, time: int, name: str, energy: float, bullet: Union[Bullet, BulletCore]):
         super().__init__(time)
 
         self.name: str = name
         self.energy: float = energy
-        self.bullet: Bullet = bullet
+        #: Bullets are wrapped when read only.
+        self.__bullet: Union[Bullet, BulletCore] = bullet
+
+    @property
+    def bullet(self) -> Bullet:
+        return wrap_bullet(self.__bullet)
 
 
 class BulletHitBulletEvent(Event):
-    def __init__(self, time: int, bullet: Bullet, hit_bullet: Bullet):
+    __slots__ = ("__bullet", "__hit_bullet")
+
+    def __init__(self, time: int, bullet: Union[Bullet, BulletCore], hit_bullet: Union[Bullet, BulletCore]):
         super().__init__(time)
 
-        self.bullet: Bullet = bullet
-        self.hit_bullet: Bullet = hit_bullet
+        self.__bullet: Union[Bullet, BulletCore] = bullet
+        self.__hit_bullet: Union[Bullet, BulletCore] = hit_bullet
+
+    @property
+    def bullet(self) -> Bullet:
+        return wrap_bullet(self.__bullet)
+
+    @property
+    def hit_bullet(self) -> Bullet:
+        return wrap_bullet(self.__hit_bullet)
 
 
 class BulletMissedEvent(Event):
-    def __init__(self, time: int, bullet: Bullet):
+    __slots__ = ("__bullet",)
+
+    def __init__(self, time: int, bullet: Union[Bullet, BulletCore]):
         super().__init__(time)
 
-        self.bullet = bullet
+        self.__bullet: Union[Bullet, BulletCore] = bullet
+
+    @property
+    def bullet(self) -> Bullet:
+        return wrap_bullet(self.__bullet)
 
 
 class DeathEvent(Event):
+    __slots__ = ()
+
     def __init__(self, time: int):
         super().__init__(time)
 
 
 class CustomEvent(Event):
+    __slots__ = ("name",)
+
     def __init__(self, time: int, name: str):
         super().__init__(time)
 
         self.name = name
 
 
+class ConditionDroppedEvent(Event):
+    #: The callable condition (of a custom event, or of the waits when named "wait") isn't evaluated
+    #: by the engine anymore, since it failed or kept exceeding its CPU time budget. Dropped waits
+    #: are evaluated by the robot on its own since then, thus it's woken up every turn.
+    __slots__ = ("name",)
+
+    def __init__(self, time: int, name: str):
+        super().__init__(time)
+
+        self.name: str = name
+
+
 class HitByBulletEvent(Event):
-    def __init__(self, time: int, bearing: float, bullet: Bullet):
+    __slots__ = ("bearing", "__bullet")
+
+    def __init__(self, time: int, bearing: float, bullet: Union[Bullet, BulletCore]):
         super().__init__(time)
 
         self.bearing: float = bearing
-        self.bullet: Bullet = bullet
+        self.__bullet: Union[Bullet, BulletCore] = bullet
+
+    @property
+    def bullet(self) -> Bullet:
+        return wrap_bullet(self.__bullet)
 
 
 class HitRobotEvent(Event):
+    __slots__ = ("name", "energy", "bearing", "guilty")
+
     def __init__(self, time: int, name: str, energy: float, bearing: float, guilty: bool):
         super().__init__(time)
 
@@ -61,6 +115,8 @@ class HitRobotEvent(Event):
 
 
 class HitWallEvent(Event):
+    __slots__ = ("bearing",)
+
     def __init__(self, time: int, bearing: float):
         super().__init__(time)
 
@@ -68,6 +124,8 @@ class HitWallEvent(Event):
 
 
 class RobotDeathEvent(Event):
+    __slots__ = ("name",)
+
     def __init__(self, time: int, name: str):
         super().__init__(time)
 
@@ -75,6 +133,8 @@ class RobotDeathEvent(Event):
 
 
 class ScannedRobotEvent(Event):
+    __slots__ = ("name", "heading", "energy", "velocity", "bearing", "distance")
+
     def __init__(self, time: int, name: str, heading: float, energy: float, velocity: float, bearing: float, distance: float):
         super().__init__(time)
 
@@ -87,6 +147,8 @@ class ScannedRobotEvent(Event):
 
 
 class SkippedTurnEvent(Event):
+    __slots__ = ("turn",)
+
     def __init__(self, time: int, turn: int):
         super().__init__(time)
 
@@ -94,12 +156,35 @@ class SkippedTurnEvent(Event):
 
 
 class StatusEvent(Event):
-    def __init__(self, time: int, status: dict):
+    __slots__ = ("status",)
+
+    def __init__(self, time: int, status: RobotStatus):
         super().__init__(time)
 
-        self.status: dict = status
+        self.status: RobotStatus = status
 
 
 class VictoryEvent(Event):
+    __slots__ = ()
+
     def __init__(self, time: int):
         super().__init__(time)
+
+
+#: Kind of the core events that each event is built from.
+EVENT_KINDS: Dict[Type[Event], EventKind] = {
+    BulletHitEvent: EventKind.BulletHit,
+    BulletHitBulletEvent: EventKind.BulletHitBullet,
+    BulletMissedEvent: EventKind.BulletMissed,
+    DeathEvent: EventKind.Death,
+    CustomEvent: EventKind.Custom,
+    ConditionDroppedEvent: EventKind.ConditionDropped,
+    HitByBulletEvent: EventKind.HitByBullet,
+    HitRobotEvent: EventKind.HitRobot,
+    HitWallEvent: EventKind.HitWall,
+    RobotDeathEvent: EventKind.RobotDeath,
+    ScannedRobotEvent: EventKind.ScannedRobot,
+    SkippedTurnEvent: EventKind.SkippedTurn,
+    StatusEvent: EventKind.Status,
+    VictoryEvent: EventKind.Victory,
+}
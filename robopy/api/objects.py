@@ -1,4 +1,5 @@
 from typing import Union
+from weakref import WeakValueDictionary
 
 from robopy.core.objects import BattlefieldCore, BulletCore
 
@@ -45,3 +46,18 @@ class Bullet:
         if self.__core.victim is not None:
             return self.__core.victim.name
         return None
+
+
+#: Wrappers of the bullets (by id of the core), shared by every event that refers to each bullet.
+#: Wrappers keep their cores alive, thus ids aren't reused while their wrappers are cached.
+_bullets: 'WeakValueDictionary[int, Bullet]' = WeakValueDictionary()
+
+
+def wrap_bullet(bullet: Union[Bullet, BulletCore]) -> Bullet:
+    if isinstance(bullet, Bullet):
+        return bullet
+
+    wrapper = _bullets.get(id(bullet))
+    if wrapper is None:
+        wrapper = _bullets[id(bullet)] = Bullet(bullet)
+    return wrapper
@@ -0,0 +1,68 @@
+import math
+from typing import Any, Dict, List
+
+import robopy.core.rules as rules
+from robopy.core.execution import Step
+
+
+class Plan:
+    #: Ordered steps performed by the engine over many turns (e.g. move, then turn, then fire once the gun
+    #: is cool), without waking up the robot until the plan is done (or it receives events).
+    #: Each step waits for its action to be done, while actions that aren't waited for
+    #: (and settings) are changed along with the next step.
+    def __init__(self):
+        self.__steps: List[Step] = []
+        self.__changes: Dict[str, Any] = {}
+
+    @property
+    def steps(self) -> List[Step]:
+        if len(self.__changes) > 0:
+            return self.__steps + [Step(dict(self.__changes))]
+        return list(self.__steps)
+
+    def __change(self, field: str, value: Any, wait: bool = False) -> 'Plan':
+        self.__changes[field] = value
+
+        if wait:
+            self.__steps.append(Step(self.__changes, field))
+            self.__changes = {}
+        return self
+
+    def move(self, distance: float, wait: bool = True) -> 'Plan':
+        return self.__change("move", 0.0 if math.isnan(distance) else distance, wait)
+
+    def turn(self, radians: float, wait: bool = True) -> 'Plan':
+        return self.__change("turn", 0.0 if math.isnan(radians) else radians, wait)
+
+    def turn_gun(self, radians: float, wait: bool = True) -> 'Plan':
+        return self.__change("turn_gun", 0.0 if math.isnan(radians) else radians, wait)
+
+    def turn_radar(self, radians: float, wait: bool = True) -> 'Plan':
+        return self.__change("turn_radar", 0.0 if math.isnan(radians) else radians, wait)
+
+    def fire(self, power: float, wait: bool = True) -> 'Plan':
+        #: Waits for the gun to be cool, then fires (the step lasts the turn of the shot).
+        if wait:
+            self.__steps.append(Step(self.__changes, "gun_heat"))
+            self.__changes = {}
+            self.__steps.append(Step({"fire": 0.0 if math.isnan(power) else power}))
+            return self
+        return self.__change("fire", 0.0 if math.isnan(power) else power)
+
+    def scan(self) -> 'Plan':
+        return self.__change("scan", True)
+
+    def set_max_velocity(self, velocity: float) -> 'Plan':
+        return self.__change("max_velocity", min(abs(velocity), rules.MAX_VELOCITY))
+
+    def set_max_turn_rate(self, turn_rate: float) -> 'Plan':
+        return self.__change("max_turn_rate", min(abs(turn_rate), rules.MAX_TURN_RATE))
+
+    def lock_gun_body(self, locked: bool) -> 'Plan':
+        return self.__change("lock_gun_body", locked)
+
+    def lock_radar_gun(self, locked: bool) -> 'Plan':
+        return self.__change("lock_radar_gun", locked)
+
+    def lock_radar_body(self, locked: bool) -> 'Plan':
+        return self.__change("lock_radar_body", locked)
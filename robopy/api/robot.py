@@ -1,14 +1,64 @@
+import random
+import traceback
 from abc import ABC, abstractmethod
 from threading import Thread
-from typing import Callable
+from typing import Any, Callable, Dict, Iterator, Type, Union
 
 from robopy.api import events as events
 from robopy.api.objects import Battlefield
-from robopy.core.execution import InterruptedExecutionException
+from robopy.api.plan import Plan
+from robopy.core.events import EventKind
+from robopy.core.execution import InterruptedExecutionException, RobotStatus
 from robopy.wrapper.execution import Statistics
 from robopy.wrapper.robot import RobotWrapper
 
 
+#: Handler method of each kind of events.
+HANDLERS: Dict[EventKind, str] = {
+    EventKind.BulletHit: "handle_bullet_hit",
+    EventKind.BulletHitBullet: "handle_bullet_hit_bullet",
+    EventKind.BulletMissed: "handle_bullet_missed",
+    EventKind.Death: "handle_death",
+    EventKind.Custom: "handle_custom",
+    EventKind.ConditionDropped: "handle_condition_dropped",
+    EventKind.HitByBullet: "handle_hit_by_bullet",
+    EventKind.HitRobot: "handle_hit_robot",
+    EventKind.HitWall: "handle_hit_wall",
+    EventKind.RobotDeath: "handle_robot_death",
+    EventKind.ScannedRobot: "handle_scanned_robot",
+    EventKind.SkippedTurn: "handle_skipped_turn",
+    EventKind.Status: "handle_status",
+    EventKind.Victory: "handle_victory",
+}
+
+
+#: Handler method of each event.
+EVENT_HANDLERS: Dict[Type[events.Event], str] = {
+    event_class: HANDLERS[kind] for event_class, kind in events.EVENT_KINDS.items()
+}
+
+
+class Execution:
+    #: Execution of a cooperative robot, made of one or more steps (i.e. turns).
+    #: Generators must yield from it and coroutines must await it, otherwise it isn't performed.
+
+    def __init__(self, steps: Iterator[None]):
+        self.__steps: Iterator[None] = steps
+
+    def __iter__(self) -> Iterator[None]:
+        return self.__steps
+
+    def __await__(self) -> Iterator[None]:
+        return self.__steps
+
+
+def _steps(execution: Any) -> Iterator[None]:
+    #: Steps of an execution, a generator or a coroutine.
+    if hasattr(execution, "__await__"):
+        return execution.__await__()
+    return iter(execution)
+
+
 class Robot(ABC, Thread):
     def __init__(self, wrapper: RobotWrapper):
         super().__init__(name=f"{wrapper.name}_RobotThread")
@@ -16,6 +66,12 @@ class Robot(ABC, Thread):
         self.__wrapper: RobotWrapper = wrapper
         self.__processing_events: bool = False
 
+        #: Robots are subscribed to the events they handle only (i.e. the overridden handlers),
+        #: thus the rest of events are never built.
+        self.__wrapper.unsubscribe({
+            kind for kind, handler in HANDLERS.items() if getattr(type(self), handler) is getattr(Robot, handler)
+        })
+
     @property
     def battlefield(self) -> Battlefield:
         return self.__wrapper.battlefield
@@ -65,9 +121,18 @@ class Robot(ABC, Thread):
         return self.__wrapper.disabled
 
     @property
-    def status(self) -> dict:
+    def status(self) -> RobotStatus:
         return self.__wrapper.status
 
+    @property
+    def planning(self) -> bool:
+        return self.__wrapper.planning
+
+    @property
+    def random(self) -> random.Random:
+        #: Robots should draw from it (instead of the random module), so seeded battles are reproducible.
+        return self.__wrapper.random
+
     def run(self):
         try:
             #: Some events such as Status event must occur before the robot has started running.
@@ -78,6 +143,9 @@ class Robot(ABC, Thread):
         except InterruptedExecutionException:
             #: Stops the execution politely.
             pass
+        finally:
+            #: However the robot ends (even by an error), the battle doesn't wait for it anymore.
+            self.__wrapper.depart()
 
     @abstractmethod
     def _run(self):
@@ -88,98 +156,145 @@ class Robot(ABC, Thread):
         if not self.__processing_events:
             self.__process_events()
 
+    def _perform(self, steps: Iterator[None]):
+        #: Performs an action, executing once per step.
+        for _ in steps:
+            self.execute()
+
+    def _execute_steps(self, steps: Iterator[None]) -> Iterator[None]:
+        #: Same as _perform, but yielding (to the battle thread) instead of blocking
+        #: until the command of each step is processed.
+        for _ in steps:
+            self.__wrapper.execute(blocking=False)
+            yield
+
+            self.__wrapper.event_manager.process()
+            if not self.__processing_events:
+                yield from self._handle_events()
+
+    def __until(self, condition: Callable[[], bool], wait: Union[Callable[[], bool], str, None] = None) \
+            -> Iterator[None]:
+        #: Steps until the condition is met (at least one). Meanwhile the battle thread evaluates
+        #: the wait condition (the condition itself by default), so the robot isn't woken up every turn.
+        self.__wrapper.wait(wait if wait is not None else condition)
+        yield
+        while not condition():
+            self.__wrapper.wait(wait if wait is not None else condition)
+            yield
+
+    def __until_done(self, action: str) -> Iterator[None]:
+        #: The engine waits until the action of the command is done on its own.
+        return self.__until(lambda: self.status["action_status"][action] == 0, action)
+
     def move(self, distance: float, execute: bool = False):
         self.__wrapper.move(distance)
 
         if execute:
-            self.execute()
-            while self.status["action_status"]["move"] != 0:
-                self.execute()
+            return self._perform(self.__until_done("move"))
 
     def turn(self, radians: float, execute: bool = False):
         self.__wrapper.turn(radians)
 
         if execute:
-            self.execute()
-            while self.status["action_status"]["turn"] != 0:
-                self.execute()
+            return self._perform(self.__until_done("turn"))
 
     def turn_gun(self, radians: float, execute: bool = False):
         self.__wrapper.turn_gun(radians)
 
         if execute:
-            self.execute()
-            while self.status["action_status"]["turn_gun"] != 0:
-                self.execute()
+            return self._perform(self.__until_done("turn_gun"))
 
     def turn_radar(self, radians: float, execute: bool = False):
         self.__wrapper.turn_radar(radians)
 
         if execute:
-            self.execute()
-            while self.status["action_status"]["turn_radar"] != 0:
-                self.execute()
+            return self._perform(self.__until_done("turn_radar"))
 
     def fire(self, power: float, execute: bool = False):
         self.__wrapper.fire(power)
 
         if execute:
-            self.execute()
+            return self.execute()
 
     def scan(self, execute: bool = False):
         self.__wrapper.scan()
 
         if execute:
-            self.execute()
+            return self.execute()
 
     def set_max_velocity(self, velocity: float, execute: bool = False):
         self.__wrapper.set_max_velocity(velocity)
 
         if execute:
-            self.execute()
+            return self.execute()
 
     def set_max_turn_rate(self, turn_rate: float, execute: bool = False):
         self.__wrapper.set_max_turn_rate(turn_rate)
 
         if execute:
-            self.execute()
+            return self.execute()
 
     def lock_gun_body(self, locked: bool, execute: bool = False):
         self.__wrapper.lock_gun_body(locked)
 
         if execute:
-            self.execute()
+            return self.execute()
 
     def lock_radar_gun(self, locked: bool, execute: bool = False):
         self.__wrapper.lock_radar_gun(locked)
 
         if execute:
-            self.execute()
+            return self.execute()
 
     def lock_radar_body(self, locked: bool, execute: bool = False):
         self.__wrapper.lock_radar_body(locked)
 
         if execute:
-            self.execute()
+            return self.execute()
 
     def wait(self, condition: Callable[[], bool]):
-        self.__wrapper.wait(condition)
+        return self._perform(self.__until(condition))
 
-        self.execute()
-        while not condition():
-            self.execute()
+    def __planning(self) -> Iterator[None]:
+        #: The engine performs the plan on its own, waking up the robot only when it's done (or on events).
+        yield
+        while self.__wrapper.planning:
+            yield
+
+    def perform(self, plan: Plan, execute: bool = False):
+        #: The plan replaces the current one (an empty plan cancels it) since the next execution.
+        self.__wrapper.perform(plan.steps)
+
+        if execute:
+            return self._perform(self.__planning())
 
-    def add_custom_event(self, name: str, condition: Callable[[], bool], execute: bool = False):
+    def add_custom_event(self, name: str, condition: Union[str, Callable[[], bool]], execute: bool = False):
+        #: Declarative conditions (e.g. "energy < 20 and wall_distance < 50") are evaluated by the engine
+        #: at once for all robots, while callables are evaluated one by one within a time budget.
         self.__wrapper.add_custom_event(name, condition)
 
         if execute:
-            self.execute()
+            return self.execute()
 
     def remove_custom_event(self, name: str, execute: bool = False):
         self.__wrapper.remove_custom_event(name)
 
         if execute:
-            self.execute()
+            return self.execute()
+
+    def subscribe(self, *event_classes: Type[events.Event]):
+        #: Handlers can be replaced at runtime, thus subscriptions can be changed explicitly.
+        self.__wrapper.subscribe({events.EVENT_KINDS[event_class] for event_class in event_classes})
+
+    def unsubscribe(self, *event_classes: Type[events.Event]):
+        self.__wrapper.unsubscribe({events.EVENT_KINDS[event_class] for event_class in event_classes})
+
+    def __dispatch(self, event: events.Event) -> Any:
+        handler = EVENT_HANDLERS.get(type(event))
+        if handler is None:
+            raise Exception("unknown event instance")
+        #: Handlers are looked up by name, so they can be replaced at runtime.
+        return getattr(self, handler)(event)
 
     def __process_events(self, refresh_queue: bool = False):
         assert not self.__processing_events
@@ -189,36 +304,19 @@ class Robot(ABC, Thread):
 
         self.__processing_events = True
         while not self.__wrapper.event_manager.empty:
-            event = self.__wrapper.event_manager.consume()
-
-            if isinstance(event, events.BulletHitEvent):
-                self.handle_bullet_hit(event)
-            elif isinstance(event, events.BulletHitBulletEvent):
-                self.handle_bullet_hit_bullet(event)
-            elif isinstance(event, events.BulletMissedEvent):
-                self.handle_bullet_missed(event)
-            elif isinstance(event, events.DeathEvent):
-                self.handle_death(event)
-            elif isinstance(event, events.CustomEvent):
-                self.handle_custom(event)
-            elif isinstance(event, events.HitByBulletEvent):
-                self.handle_hit_by_bullet(event)
-            elif isinstance(event, events.HitRobotEvent):
-                self.handle_hit_robot(event)
-            elif isinstance(event, events.HitWallEvent):
-                self.handle_hit_wall(event)
-            elif isinstance(event, events.RobotDeathEvent):
-                self.handle_robot_death(event)
-            elif isinstance(event, events.ScannedRobotEvent):
-                self.handle_scanned_robot(event)
-            elif isinstance(event, events.SkippedTurnEvent):
-                self.handle_skipped_turn(event)
-            elif isinstance(event, events.StatusEvent):
-                self.handle_status(event)
-            elif isinstance(event, events.VictoryEvent):
-                self.handle_victory(event)
-            else:
-                raise Exception("unknown event instance")
+            self.__dispatch(self.__wrapper.event_manager.consume())
+        self.__processing_events = False
+
+    def _handle_events(self) -> Iterator[None]:
+        #: Same as __process_events, but the executions returned by handlers
+        #: (or handlers being generators or coroutines) are performed too.
+        assert not self.__processing_events
+
+        self.__processing_events = True
+        while not self.__wrapper.event_manager.empty:
+            execution = self.__dispatch(self.__wrapper.event_manager.consume())
+            if execution is not None:
+                yield from _steps(execution)
         self.__processing_events = False
 
     def handle_bullet_hit(self, event: events.BulletHitEvent):
@@ -236,6 +334,9 @@ class Robot(ABC, Thread):
     def handle_custom(self, event: events.CustomEvent):
         pass
 
+    def handle_condition_dropped(self, event: events.ConditionDroppedEvent):
+        pass
+
     def handle_hit_by_bullet(self, event: events.HitByBulletEvent):
         pass
 
@@ -259,3 +360,69 @@ class Robot(ABC, Thread):
 
     def handle_victory(self, event: events.VictoryEvent):
         pass
+
+
+class CooperativeRobot(Robot):
+    #: Robots whose _run is a generator (yielding from each execution) or a coroutine (awaiting each execution),
+    #: thus every execution returns an Execution instead of blocking. They don't run on their own thread,
+    #: but they're resumed by the battle thread until their next execution, once their command is processed.
+
+    def __init__(self, wrapper: RobotWrapper):
+        super().__init__(wrapper)
+
+        self.__steps: Union[Iterator[None], None] = None
+
+    def start(self):
+        self.__steps = self.__main()
+        self.resume()
+
+    def is_alive(self) -> bool:
+        return self.__steps is not None
+
+    def join(self, timeout: Union[float, None] = None):
+        #: There's no thread to wait for.
+        pass
+
+    def close(self):
+        #: Ends the robot at its current execution (its pending code isn't run).
+        if self.__steps is None:
+            return
+
+        steps, self.__steps = self.__steps, None
+        try:
+            steps.close()
+        except Exception:
+            traceback.print_exc()
+
+    def resume(self):
+        #: Runs the robot until its next execution (or its end).
+        if self.__steps is None:
+            return
+
+        try:
+            next(self.__steps)
+        except StopIteration:
+            self.__steps = None
+        except Exception:
+            #: Errors of the robot end the robot only, as they'd end its thread.
+            self.__steps = None
+            traceback.print_exc()
+
+    def __main(self) -> Iterator[None]:
+        try:
+            #: Some events such as Status event must occur before the robot has started running.
+            #: Thus the robot must process the first events from the first turn.
+            yield from self._handle_events()
+
+            execution = self._run()
+            if execution is not None:
+                yield from _steps(execution)
+        except InterruptedExecutionException:
+            #: Stops the execution politely.
+            pass
+
+    def execute(self) -> Execution:
+        return self._perform(iter((None,)))
+
+    def _perform(self, steps: Iterator[None]) -> Execution:
+        return Execution(self._execute_steps(steps))
@@ -1,17 +1,33 @@
 import random
 import time
-from threading import Thread, Semaphore
-from typing import Dict, List, Tuple, Type
+from threading import Thread, Semaphore, get_ident
+from typing import Dict, List, Tuple, Type, Union
 
-from robopy.api.robot import Robot
+import robopy.core.rules as rules
+from robopy.api.robot import CooperativeRobot, Robot
+from robopy.core import conditions, radar
+from robopy.core.conditions import CustomEvents
 from robopy.core.events import EventKind
-from robopy.core.execution import Statistics, BattleState
+from robopy.core.execution import Statistics, BattleState, InterruptedExecutionException, Scheduler, TurnPhase
 from robopy.core.objects import BattlefieldCore, BulletCore, RobotCore
+from robopy.core.pairwise import PairwiseMatrix
+from robopy.core.physics import PhysicsEngine, RobotView
+from robopy.core.spatial import SpatialGrid, SweepAndPrune
+from robopy.utils.permutation import Permutations, PermutationView
+from robopy.utils.threading import TurnBarrier, interrupt
 from robopy.wrapper.robot import RobotWrapper
 
 
 class Battle(Thread):
-    def __init__(self, battlefield_dimensions: Tuple[int, int], robot_classes: List[Type[Robot]]):
+    #: Time (in seconds) robot threads have to stop once the battle stops,
+    #: and then to stop once they're forced to.
+    STOP_TIME: float = 0.5
+    FORCED_STOP_TIME: float = 0.5
+
+    def __init__(self, battlefield_dimensions: Tuple[int, int], robot_classes: List[Type[Robot]],
+                 scheduler: Scheduler = Scheduler.FIXED, turn_time: Union[float, None] = 0.1, vectorized: bool = False,
+                 cpu_time: Union[float, None] = rules.MAX_TURN_CPU_TIME, seed: Union[int, None] = None,
+                 max_turns: Union[int, None] = None):
         super().__init__(name="BattleThread")
 
         self.robot_classes: List[Type[Robot]] = robot_classes
@@ -19,29 +35,87 @@ class Battle(Thread):
         self.statistics: Statistics = Statistics(len(robot_classes))
         self.battlefield: BattlefieldCore = BattlefieldCore(battlefield_dimensions)
 
+        #: All the randomness of the battle (placement and orders) is drawn from its own generator,
+        #: so battles of the same seed (with the SYNCHRONOUS scheduler) follow the same turns.
+        self.seed: Union[int, None] = seed
+        self.random: random.Random = random.Random(seed)
+
+        #: Battles lasting max_turns turns (unless it's None) are ended without winner.
+        self.max_turns: Union[int, None] = max_turns
+
+        #: With the FIXED scheduler every turn lasts exactly turn_time seconds.
+        #: With the BARRIER scheduler a turn ends as soon as every alive robot
+        #: has submitted its command, or when turn_time (the deadline) expires.
+        #: With the SYNCHRONOUS scheduler a turn ends once every alive robot has submitted its command
+        #: (however long it takes), and the time of robots isn't enforced, so turns don't depend on timing.
+        self.scheduler = scheduler  #: TODO how to typify enum?
+        self.turn_time: Union[float, None] = turn_time if scheduler is not Scheduler.SYNCHRONOUS else None
+        self.barrier: Union[TurnBarrier, None] = TurnBarrier() if scheduler is not Scheduler.FIXED else None
+        #: Robots taking longer than cpu_time (CPU time of its own) to compute a command skip the turn
+        #: (the command is processed the next turn instead), unless it's None.
+        self.cpu_time: Union[float, None] = cpu_time if scheduler is not Scheduler.SYNCHRONOUS else None
+
+        #: With the vectorized engine the state of all robots and bullets
+        #: is kept (and updated at once) in NumPy arrays.
+        self.physics: Union[PhysicsEngine, None] = None
+        if vectorized:
+            self.physics = PhysicsEngine(len(robot_classes), self.battlefield, self.random)
+
         self.robots: List[RobotCore] = []
         self.robot_threads: Dict[RobotCore, Robot] = {}
-        self.bullets: List[BulletCore] = []
+        #: Robots without thread, resumed by the battle thread.
+        self.cooperative_robots: Dict[RobotCore, CooperativeRobot] = {}
+        self.__bullets: List[BulletCore] = []
+
+        #: Indexes of robots and bullets (rebuilt every turn), so each bullet
+        #: is only checked for collisions against the robots and bullets near it.
+        self.robot_grid: SpatialGrid = SpatialGrid(self.battlefield.width, self.battlefield.height, self.random)
+        self.bullet_grid: SpatialGrid = SpatialGrid(self.battlefield.width, self.battlefield.height, self.random)
+
+        #: Index of alive robots (kept sorted between turns, as robots barely move),
+        #: so each robot is only checked for collisions against the robots near it.
+        self.robot_sweep: SweepAndPrune = SweepAndPrune(RobotCore.WIDTH, self.random)
+
+        #: Angles and distances between each scanner and its targets (computed at once every turn,
+        #: after robots move), shared by the scan computations.
+        self.pairwise: PairwiseMatrix = PairwiseMatrix()
+
+        #: Declarative conditions of custom events of all robots, evaluated at once every turn.
+        #: Callable conditions are evaluated afterwards, each robot's within the time budget.
+        self.conditions: conditions.ConditionBatch = conditions.ConditionBatch()
+        self.condition_time: Union[float, None] = \
+            conditions.TIME_BUDGET if scheduler is not Scheduler.SYNCHRONOUS else None
+
+        #: Robots and bullets are processed in a random order (drawn once per phase of each turn),
+        #: so neither of them is favored by its position in the lists.
+        self.phase = TurnPhase.SETUP  #: TODO how to typify enum?
+        self.robot_order: Permutations = Permutations(self.random)
+        self.bullet_order: Permutations = Permutations(self.random)
 
         self.semaphore: Semaphore = Semaphore()
 
+    @property
+    def bullets(self) -> Tuple[BulletCore]:
+        if self.physics is not None:
+            #: Views of the bullets stored by the vectorized engine.
+            return self.physics.bullet_store.bullets
+        return tuple(self.__bullets)
+
     @property
     def shuffled_robot_classes(self) -> Tuple[Type[Robot]]:
         robot_classes = list(self.robot_classes)
-        random.shuffle(robot_classes)
+        self.random.shuffle(robot_classes)
         return tuple(robot_classes)
 
+    #: The shuffled views are read by the battle thread only (the thread setting up the battle),
+    #: other threads (e.g. the GUI) read robots and bullets instead, in a stable order.
     @property
-    def shuffled_robots(self) -> Tuple[RobotCore]:
-        robots = list(self.robots)
-        random.shuffle(robots)
-        return tuple(robots)
+    def shuffled_robots(self) -> PermutationView:
+        return self.robot_order.view(self.phase, self.robots)
 
     @property
-    def shuffled_bullets(self) -> Tuple[BulletCore]:
-        bullets = list(self.bullets)
-        random.shuffle(bullets)
-        return tuple(bullets)
+    def shuffled_bullets(self) -> PermutationView:
+        return self.bullet_order.view(self.phase, self.bullets if self.physics is not None else self.__bullets)
 
     def run(self):
         assert self.statistics.battle_state is None
@@ -51,18 +125,76 @@ class Battle(Thread):
         self._setup()
         self._main()
 
-        self.stop()
+        #: The battle could've been stopped already (e.g. by the GUI).
+        if self.statistics.battle_state is not BattleState.STOPPED:
+            self.stop()
+
+        #: Robots are stopped by the battle thread (even if the battle was stopped by another thread).
+        self._teardown()
 
     def stop(self):
         assert self.statistics.battle_state in (BattleState.RUNNING, BattleState.ENDED)
 
+        #: The battle thread stops the robots once it leaves its main loop
+        #: (it's woken up if it's waiting for the robots' commands).
         self.statistics.battle_state = BattleState.STOPPED
-
-        #: TODO wait for robot threads to stop.
-        #: TODO force non-stopped threads to stop.
-        #: TODO apply penalties for those robots which prevented its thread from stopping.
+        if self.barrier is not None:
+            self.barrier.wake()
+
+    def _teardown(self):
+        #: Robots blocked on its execution are woken up, which raises InterruptedExecutionException since
+        #: the battle is stopped (as does any further execution). Robots that don't stop in time (e.g. looping
+        #: without executing) get the exception raised on its thread, and robots that don't stop even then
+        #: are abandoned (its daemon thread is left behind) and lose their scores of the battle.
+        threads = []
+        for robot, thread in self.robot_threads.items():
+            if robot in self.cooperative_robots:
+                self.cooperative_robots[robot].close()
+                continue
+            if robot.locked:
+                robot.release()
+            threads.append((robot, thread))
+
+        deadline = time.perf_counter() + Battle.STOP_TIME
+        for _, thread in threads:
+            thread.join(max(0.0, deadline - time.perf_counter()))
+
+        threads = [(robot, thread) for robot, thread in threads if thread.is_alive()]
+        for _, thread in threads:
+            interrupt(thread, InterruptedExecutionException)
+
+        deadline = time.perf_counter() + Battle.FORCED_STOP_TIME
+        for robot, thread in threads:
+            thread.join(max(0.0, deadline - time.perf_counter()))
+            if thread.is_alive():
+                robot.robot_statistics.abandoned = True
+                robot.robot_statistics.survival = 0
+                robot.robot_statistics.bullet_damage = 0.0
+                robot.robot_statistics.bullet_hits = 0
+                robot.robot_statistics.ram_damage = 0.0
+
+        #: Release what robots left pending.
+        for robot in self.robots:
+            robot.events.swap()
+            robot.plan.clear()
+            robot.step = None
+            robot.custom_events = CustomEvents()
+            robot.waits = None
+
+    def latency_report(self) -> str:
+        #: CPU time per command of each robot (in milliseconds) and its skipped turns.
+        lines = [f"{'robot':<20} {'commands':>8} {'p50':>8} {'p95':>8} {'max':>8} {'skipped':>8}"]
+        for robot in self.robots:
+            latency = robot.robot_statistics.latency
+            lines.append(
+                f"{robot.name:<20} {latency.count:>8} {1e3 * latency.p50:>8.3f} {1e3 * latency.p95:>8.3f} "
+                f"{1e3 * latency.max:>8.3f} {robot.robot_statistics.skipped_turns:>8}"
+            )
+        return "\n".join(lines)
 
     def _setup(self):
+        self.robot_order.owner = self.bullet_order.owner = get_ident()
+
         robot_names = {}
         for robot_class in self.shuffled_robot_classes:
             name = robot_class.__name__
@@ -72,67 +204,166 @@ class Battle(Thread):
                 robot_names[name] += 1
                 name = f"{name}({robot_names[name] - 1})"
 
-            robot = RobotCore(name, self.statistics, self.battlefield, self.shuffled_robots)
+            if self.physics is not None:
+                robot = RobotView(
+                    self.physics, name, self.statistics, self.battlefield, self.shuffled_robots, self.barrier, self.random
+                )
+            else:
+                robot = RobotCore(name, self.statistics, self.battlefield, self.shuffled_robots, self.barrier, self.random)
+            robot.condition_time = self.condition_time
             self.robots.append(robot)
+            self.robot_sweep.insert(robot, robot.box[0], robot.box[2])
 
             thread = robot_class(RobotWrapper(robot))
+            #: Robot threads must never keep the process alive after the battle.
+            thread.daemon = True
             self.robot_threads[robot] = thread
+            if isinstance(thread, CooperativeRobot):
+                self.cooperative_robots[robot] = thread
 
     def _main(self):
         #: Publish Status event of the first turn.
         for robot in self.shuffled_robots:
-            robot.add_event(EventKind.Status, (robot.status,))
+            if EventKind.Status in robot.subscriptions:
+                robot.add_event(EventKind.Status, (robot.status,))
 
         #: Start the control processing.
         for robot in self.shuffled_robots:
             self.robot_threads[robot].start()
 
         while self.statistics.battle_state is BattleState.RUNNING:
-            time.sleep(0.1)  #: TODO what's the best amount of time per turn.
-
             #: Usually there's a control step on the main loop of games.
             #: However the control step of this game is written by the competitors,
             #: inside the robots' run method.
 
-            #: Process alive robots that have locked robots only.
-            robots = tuple(r for r in self.shuffled_robots if not r.dead and r.locked)
+            #: Every turn draws new orders.
+            self.robot_order.reset()
+            self.bullet_order.reset()
+            self.phase = TurnPhase.EXECUTION
+
+            if self.barrier is not None:
+                #: Process alive robots that have submitted its command until the deadline only.
+                #: Robots disabled for skipping turns aren't waited for anymore (but they're processed if they arrive),
+                #: so a slow robot doesn't slow down every turn, nor robots whose thread ended
+                #: (they depart the barrier when it ends), nor any robot once the battle is stopped.
+                alive_robots = tuple(r for r in self.shuffled_robots if not r.dead)
+                self.barrier.wait(tuple(
+                    r for r in alive_robots
+                    if r.robot_statistics.consecutive_skipped_turns < rules.MAX_SKIPPED_TURNS
+                    and self.robot_threads[r].is_alive()
+                ), self.turn_time, lambda: self.statistics.battle_state is not BattleState.RUNNING)
+                robots = self.barrier.arrived(alive_robots)
+            else:
+                time.sleep(self.turn_time)
+
+                #: Process alive robots that have locked robots only.
+                robots = tuple(r for r in self.shuffled_robots if not r.dead and r.locked)
+
+            #: Commands exceeding the CPU time are processed next turn instead.
+            robots = self._account(robots)
 
             #: Logic step.
             self._logic(robots)
 
+            #: Plans of commands go on with their following steps.
+            for robot in robots:
+                if not robot.dead:
+                    robot.advance_plan()
+
+            #: Parked robots keep their command (it's processed again next turn) instead of being woken up.
+            robots = tuple(robot for robot in robots if not robot.parked)
+
+            #: The woken robots must submit a new command on the next turn.
+            if self.barrier is not None:
+                self.barrier.reset(robots)
+
             #: Wake up the processed robots.
             for robot in robots:
                 #: Even dead robots are released to process its death.
                 robot.release()
 
+            #: Run the woken cooperative robots until their next execution (timing their CPU time).
+            for robot in robots:
+                if robot in self.cooperative_robots and self.cooperative_robots[robot].is_alive():
+                    start = time.thread_time()
+                    self.cooperative_robots[robot].resume()
+                    robot.turn_cpu_time = time.thread_time() - start
+
+    def _account(self, robots: Tuple[RobotCore]) -> Tuple[RobotCore]:
+        #: Records the CPU time of the new commands, and returns the robots whose command is processed.
+        #: Only new commands computed within the CPU time end a streak of skipped turns
+        #: (the delayed commands of robots exceeding it every turn don't).
+        processed = []
+        for robot in robots:
+            cpu_time, robot.turn_cpu_time = robot.turn_cpu_time, None
+            if cpu_time is not None:
+                robot.robot_statistics.latency.record(cpu_time)
+                if self.cpu_time is not None and cpu_time > self.cpu_time:
+                    continue
+                robot.robot_statistics.consecutive_skipped_turns = 0
+            processed.append(robot)
+        return tuple(processed)
+
     def _logic(self, robots: Tuple[RobotCore]):
         #: Make sure that the battle rendering doesn't catch
         #: any semi-updated information from robots or battle statistics.
         self.semaphore.acquire()
+        listeners = ()
+
+        #: The processed robots are about to move, thus their angles and distances are outdated.
+        self.pairwise.invalidate(robots)
+
+        self.phase = TurnPhase.UPDATE
+        if self.physics is not None:
+            #: Fire bullets and update all robots at once.
+            self.physics.update(robots, self.shuffled_robots, self.robot_sweep)
+
+            #: Update all bullets at once.
+            #: Both engines draw the order of robots (then the order of bullets) only if there are bullets,
+            #: so they draw the same numbers from the battle's generator (thus seeded battles match).
+            self.phase = TurnPhase.BULLETS
+            if self.physics.bullet_store.size > 0:
+                self.physics.update_bullets(self.shuffled_robots)
+        else:
+            for robot in robots:
+                #: Robots can die during this loop,
+                #: thus they can't execute any action.
+                if robot.dead:
+                    continue
 
-        for robot in robots:
-            #: Robots can die during this loop,
-            #: thus they can't execute any action.
-            if robot.dead:
-                continue
-
-            #: Try to fire a bullet.
-            bullet = robot.fire()
-            if bullet is not None:
-                self.bullets.append(bullet)
-
-            #: Update the robot.
-            robot.update(self.shuffled_robots)
-
-        #: Update bullets.
-        bullets = []
-        for bullet in self.shuffled_bullets:
-            bullet.update(self.shuffled_robots, self.shuffled_bullets)
-            if not bullet.inactive:
-                bullets.append(bullet)
-        self.bullets = bullets
+                #: Try to fire a bullet.
+                bullet = robot.fire()
+                if bullet is not None:
+                    self.__bullets.append(bullet)
+
+                #: Update the robot.
+                robot.update(self.shuffled_robots, self.robot_sweep)
+
+            #: Index robots and bullets (within the bullets phase, as the vectorized engine does).
+            self.phase = TurnPhase.BULLETS
+            self.robot_grid.clear()
+            for robot in self.robots:
+                if not robot.dead:
+                    self.robot_grid.insert(robot, *robot.center)
+            self.bullet_grid.clear()
+            for bullet in self.__bullets:
+                self.bullet_grid.insert(bullet, *bullet.center)
+
+            #: Update bullets.
+            if len(self.__bullets) > 0:
+                shuffled_robots = self.shuffled_robots
+                for bullet in self.shuffled_bullets:
+                    bullet.update(shuffled_robots, self.__bullets, self.robot_grid, self.bullet_grid)
+                #: Bullets are kept in the order they were fired, as the vectorized engine does.
+                self.__bullets = [bullet for bullet in self.__bullets if not bullet.inactive]
+
+        #: Dead robots can't collide anymore.
+        for robot in self.robots:
+            if robot.dead and robot in self.robot_sweep:
+                self.robot_sweep.remove(robot)
 
         #: Compute alive robots.
+        self.phase = TurnPhase.EVENTS
         self.statistics.alive_robots = sum(int(not robot.dead) for robot in self.shuffled_robots)
 
         if self.statistics.alive_robots <= 1:
@@ -146,9 +377,16 @@ class Battle(Thread):
                         continue
                     winner = robot
                 assert winner is not None
+                winner.robot_statistics.turns = self.statistics.time
 
                 #: Publish Victory event.
                 winner.add_event(EventKind.Victory, ())
+        elif self.max_turns is not None and self.statistics.time >= self.max_turns:
+            #: The battle lasted too long, thus it's ended without winner.
+            self.statistics.battle_state = BattleState.ENDED
+            for robot in self.robots:
+                if not robot.dead:
+                    robot.robot_statistics.turns = self.statistics.time
         else:
             self.statistics.tick()
 
@@ -158,35 +396,65 @@ class Battle(Thread):
             #: game state of the following turn
             #: (e.g. robot position).
 
-            #: Perform scan.
-            for robot in robots:
-                #: Robots could've died during past updates,
-                #: thus they can't perform scan.
-                if robot.dead:
-                    continue
-                robot.scan(self.shuffled_robots)
+            #: Perform scan (the scan sectors of all robots are tested at once).
+            #: Robots could've died during past updates,
+            #: thus they can't perform scan.
+            self.phase = TurnPhase.SCAN
+            alive_robots = tuple(robot for robot in robots if not robot.dead)
+            scanners = tuple(
+                robot for robot in alive_robots
+                if robot.command.scan and EventKind.ScannedRobot in robot.subscriptions
+            )
+            targets = radar.scan(scanners, self.shuffled_robots)
+            if len(scanners) > 0:
+                self.pairwise.update(targets)
+            for robot in alive_robots:
+                robot.scan(self.shuffled_robots, targets.get(robot, []), self.pairwise)
 
             #: Publish Custom events.
-            for robot in robots:
-                #: Robots could've died during past updates,
-                #: thus they won't receive its custom events.
-                if robot.dead:
-                    continue
-                for name, condition in robot.custom_events.items():
-                    if condition():
-                        robot.add_event(EventKind.Custom, (name,))
+            #: Robots could've died during past updates,
+            #: thus they won't receive its custom events.
+            #: Conditions of robots that don't handle custom events aren't even tested.
+            self.phase = TurnPhase.EVENTS
+            listeners = tuple(
+                robot for robot in robots
+                if not robot.dead and EventKind.Custom in robot.subscriptions and len(robot.custom_events) > 0
+            )
+            for robot, name in self.conditions.evaluate(listeners, self.physics):
+                robot.add_event(EventKind.Custom, (name,))
 
             #: Publish Skipped Turn event.
+            #: Robots skipping too many turns in a row are disabled.
+            processed = set(robots)
             for robot in self.shuffled_robots:
-                if robot.dead or robot in robots:
+                if robot.dead or robot in processed:
                     continue
+                robot.robot_statistics.skipped_turns += 1
+                robot.robot_statistics.consecutive_skipped_turns += 1
+                if robot.robot_statistics.consecutive_skipped_turns >= rules.MAX_SKIPPED_TURNS:
+                    robot.energy = 0.0
                 robot.add_event(EventKind.SkippedTurn, (self.statistics.time - 1,))
 
-            #: Publish Status event with updated information.
+        #: Robots' status snapshots are outdated, even if the battle is ended
+        #: (the next read of each one takes a new snapshot).
+        for robot in self.robots:
+            robot.invalidate_status()
+
+        if self.statistics.battle_state is BattleState.RUNNING:
+            #: Publish Status event with updated information
+            #: (its snapshot is shared by the robot's reads during the following turn).
             for robot in self.shuffled_robots:
                 #: Dead robots won't receive this event anymore.
-                if robot.dead:
+                if robot.dead or EventKind.Status not in robot.subscriptions:
                     continue
                 robot.add_event(EventKind.Status, (robot.status,))
 
         self.semaphore.release()
+
+        #: Callable conditions (arbitrary code of robots) are evaluated without stalling the rendering.
+        for robot in listeners:
+            met, dropped = robot.custom_events.evaluate(self.condition_time)
+            for name in met:
+                robot.add_event(EventKind.Custom, (name,))
+            for name in dropped:
+                robot.add_event(EventKind.ConditionDropped, (name,))
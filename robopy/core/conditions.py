@@ -0,0 +1,233 @@
+import operator
+import re
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
+
+
+#: Fields of the robots that declarative conditions can test: its state, the remaining
+#: actions of its command and the distance from its edges to the closest wall.
+FIELDS: Tuple[str, ...] = (
+    "x", "y", "heading", "gun_heading", "radar_heading", "energy", "gun_heat", "velocity",
+    "move", "turn", "turn_gun", "turn_radar",
+    "wall_distance",
+)
+COMMAND_FIELDS: Tuple[str, ...] = ("move", "turn", "turn_gun", "turn_radar")
+
+#: Two characters operators go first, so they're matched before their prefixes.
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+
+TERM: re.Pattern = re.compile(
+    r"\s*([a-z_]+)\s*(" + "|".join(re.escape(symbol) for symbol in OPERATORS) + r")\s*([^\s]+)\s*"
+)
+
+#: CPU time (in seconds) that the callable conditions of a robot can spend per turn.
+TIME_BUDGET: float = 0.001
+#: Callable conditions exceeding the time budget on their own this many evaluations in a row are dropped.
+MAX_STRIKES: int = 3
+
+
+def field_values(robots: Tuple[Any], field: str, physics: Any = None) -> np.ndarray:
+    if field == "wall_distance":
+        x, y = field_values(robots, "x", physics), field_values(robots, "y", physics)
+        battlefield = robots[0].battlefield
+        return np.minimum(
+            np.minimum(x, battlefield.width - x) - robots[0].HALF_WIDTH,
+            np.minimum(y, battlefield.height - y) - robots[0].HALF_HEIGHT
+        )
+    elif physics is not None:
+        #: The vectorized engine stores every field of all robots in a single array.
+        return physics.values(robots, field)
+    elif field in COMMAND_FIELDS:
+        return np.array([getattr(robot.command, field) for robot in robots], dtype=float)
+    return np.array([getattr(robot, field) for robot in robots], dtype=float)
+
+
+class Condition:
+    #: Declarative condition on the fields of a robot (e.g. "energy < 20 and gun_heat == 0"), being a
+    #: conjunction of comparisons of a field against a number. It's compiled once, so the conditions
+    #: of all robots are evaluated at once (see ConditionBatch).
+    __slots__ = ("expression", "terms")
+
+    def __init__(self, expression: str):
+        self.expression: str = expression
+        #: Terms of (field, operator symbol, value).
+        self.terms: Tuple[Tuple[str, str, float], ...] = tuple(
+            Condition.compile(term, expression) for term in re.split(r"\s+and\s+", expression.strip())
+        )
+
+    @staticmethod
+    def compile(term: str, expression: str) -> Tuple[str, str, float]:
+        match = TERM.fullmatch(term)
+        if match is None or match.group(1) not in FIELDS:
+            raise ValueError(f"Invalid condition '{expression}' (expected terms such as 'energy < 20')")
+        try:
+            value = float(match.group(3))
+        except ValueError:
+            raise ValueError(f"Invalid condition '{expression}' ('{match.group(3)}' isn't a number)")
+        return match.group(1), match.group(2), value
+
+    def __call__(self, robot: Any) -> bool:
+        return all(
+            bool(OPERATORS[symbol](field_values((robot,), field)[0], value)) for field, symbol, value in self.terms
+        )
+
+    def __repr__(self) -> str:
+        return f"Condition({self.expression!r})"
+
+
+class CustomEvents:
+    #: Custom events of a robot: declarative conditions (evaluated in batch with those of every robot)
+    #: and arbitrary callables, evaluated one by one within a time budget.
+    __slots__ = ("conditions", "callables", "version", "cursor", "strikes")
+
+    def __init__(self):
+        self.conditions: Dict[str, Condition] = {}
+        self.callables: Dict[str, Callable[[], bool]] = {}
+        #: Changes of the declarative conditions, so batches are only rebuilt when needed.
+        self.version: int = 0
+        #: The callables of the next evaluation start where the last one stopped.
+        self.cursor: int = 0
+        self.strikes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.conditions) + len(self.callables)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.conditions or name in self.callables
+
+    def add(self, name: str, condition: Union[str, Callable[[], bool]]):
+        #: Declarative conditions are compiled (thus validated) right away, by the robot adding them.
+        compiled = Condition(condition) if isinstance(condition, str) else None
+        if name in self:
+            self.remove(name)
+
+        if compiled is not None:
+            self.conditions[name] = compiled
+            self.version += 1
+        else:
+            self.callables[name] = condition
+
+    def remove(self, name: str):
+        if name in self.conditions:
+            del self.conditions[name]
+            self.version += 1
+        else:
+            del self.callables[name]
+        self.strikes.pop(name, None)
+
+    def evaluate(self, budget: Union[float, None] = TIME_BUDGET) -> Tuple[List[str], List[str]]:
+        #: Evaluates the callables (starting where the last evaluation stopped) until the budget is spent,
+        #: so the remaining ones are evaluated next turn. Callables that fail, or keep exceeding
+        #: the budget on their own, are dropped so they can't stall the battle. Without budget, all of them
+        #: are evaluated. The robot may add or remove callables meanwhile, thus they're evaluated from a snapshot.
+        #: Returns the names of the met callables and of the dropped ones (so the robot is told about them).
+        #: Callables are timed by the CPU time of the evaluating thread, thus waiting for the GIL (or being
+        #: preempted) doesn't count against them.
+        callables = tuple(self.callables.items())
+        met, dropped = [], []
+        spent = 0.0
+        for i in range(len(callables)):
+            name, condition = callables[(self.cursor + i) % len(callables)]
+            start = time.thread_time()
+            try:
+                if condition():
+                    met.append(name)
+            except Exception:
+                traceback.print_exc()
+                self.__drop(name, condition, dropped)
+                continue
+            elapsed = time.thread_time() - start
+            if budget is None:
+                continue
+
+            #: Only overruns in a row count, a single on-time evaluation clears them.
+            if elapsed <= budget:
+                self.strikes.pop(name, None)
+            else:
+                self.strikes[name] = self.strikes.get(name, 0) + 1
+                if self.strikes[name] >= MAX_STRIKES:
+                    self.__drop(name, condition, dropped)
+
+            spent += elapsed
+            if spent > budget:
+                self.cursor = (self.cursor + i + 1) % len(callables)
+                break
+        return met, dropped
+
+    def __drop(self, name: str, condition: Callable[[], bool], dropped: List[str]):
+        #: Unless the robot replaced (or removed) the callable already.
+        if self.callables.get(name) is condition:
+            del self.callables[name]
+            dropped.append(name)
+        self.strikes.pop(name, None)
+
+
+class ConditionBatch:
+    #: Declarative conditions of many robots, flattened into arrays of terms (rebuilt only when
+    #: the robots or their conditions change), so all of them are evaluated at once.
+
+    def __init__(self):
+        self.key: Tuple[Tuple[Any, int], ...] = ()
+        #: Robot and name of each condition.
+        self.names: List[Tuple[Any, str]] = []
+        #: Fields tested by any condition.
+        self.fields: Tuple[str, ...] = ()
+        #: Field row, robot, operator and value of each term, and the first term of each condition.
+        self.rows: np.ndarray = np.empty(0, dtype=int)
+        self.owners: np.ndarray = np.empty(0, dtype=int)
+        self.values: np.ndarray = np.empty(0)
+        self.operators: List[Tuple[Callable[[Any, Any], Any], np.ndarray]] = []
+        self.starts: np.ndarray = np.empty(0, dtype=int)
+
+    def compile(self, robots: Tuple[Any]):
+        names, fields, owners, symbols, values, starts = [], [], [], [], [], []
+        for owner, robot in enumerate(robots):
+            for name, condition in tuple(robot.custom_events.conditions.items()):
+                names.append((robot, name))
+                starts.append(len(fields))
+                for field, symbol, value in condition.terms:
+                    fields.append(field)
+                    owners.append(owner)
+                    symbols.append(symbol)
+                    values.append(value)
+
+        self.names = names
+        self.fields = tuple(sorted(set(fields)))
+        self.rows = np.array([self.fields.index(field) for field in fields], dtype=int)
+        self.owners = np.array(owners, dtype=int)
+        self.values = np.array(values, dtype=float)
+        symbols = np.array(symbols, dtype=object)
+        self.operators = [
+            (function, symbols == symbol) for symbol, function in OPERATORS.items() if symbol in set(symbols)
+        ]
+        self.starts = np.array(starts, dtype=int)
+
+    def evaluate(self, robots: Tuple[Any], physics: Any = None) -> List[Tuple[Any, str]]:
+        #: The met conditions (as robot and name).
+        key = tuple((robot, robot.custom_events.version) for robot in robots)
+        if key != self.key:
+            self.compile(robots)
+            self.key = key
+        if len(self.names) == 0:
+            return []
+
+        table = np.empty((len(self.fields), len(robots)))
+        for row, field in enumerate(self.fields):
+            table[row] = field_values(robots, field, physics)
+        values = table[self.rows, self.owners]
+
+        terms = np.empty(len(values), dtype=bool)
+        for function, mask in self.operators:
+            terms[mask] = function(values[mask], self.values[mask])
+        met = np.logical_and.reduceat(terms, self.starts)
+        return [self.names[index] for index in np.flatnonzero(met)]
@@ -1,4 +1,5 @@
 import enum
+from typing import Dict
 
 
 @enum.unique
@@ -9,6 +10,7 @@ class EventKind(enum.IntEnum):
     BulletMissed = enum.auto()
     Death = enum.auto()
     Custom = enum.auto()
+    ConditionDropped = enum.auto()
     HitByBullet = enum.auto()
     HitRobot = enum.auto()
     HitWall = enum.auto()
@@ -19,73 +21,66 @@ class EventKind(enum.IntEnum):
     Victory = enum.auto()
 
 
+#: Critical events are processed before the rest of events of the same turn.
+CRITICAL: Dict[EventKind, bool] = {
+    EventKind.BulletHit: False,
+    EventKind.BulletHitBullet: False,
+    EventKind.BulletMissed: False,
+    EventKind.Death: True,
+    EventKind.Custom: True,
+    EventKind.ConditionDropped: True,
+    EventKind.HitByBullet: False,
+    EventKind.HitRobot: False,
+    EventKind.HitWall: False,
+    EventKind.RobotDeath: False,
+    EventKind.ScannedRobot: False,
+    EventKind.SkippedTurn: True,
+    EventKind.Status: False,
+    EventKind.Victory: True,
+}
+
+#: Events with higher priority are processed before the rest of events of the same turn and criticality.
+PRIORITIES: Dict[EventKind, int] = {
+    EventKind.BulletHit: 50,
+    EventKind.BulletHitBullet: 55,
+    EventKind.BulletMissed: 60,
+    EventKind.Death: -1,
+    EventKind.Custom: 80,
+    EventKind.ConditionDropped: 81,
+    EventKind.HitByBullet: 20,
+    EventKind.HitRobot: 40,
+    EventKind.HitWall: 30,
+    EventKind.RobotDeath: 70,
+    EventKind.ScannedRobot: 10,
+    EventKind.SkippedTurn: 100,
+    EventKind.Status: 99,
+    EventKind.Victory: 100,
+}
+
+#: Events of the same turn are processed in ascending order of these keys
+#: (critical events first, then higher priorities first).
+SORT_KEYS: Dict[EventKind, int] = {
+    kind: (0 if CRITICAL[kind] else 1000) - PRIORITIES[kind] for kind in EventKind
+}
+
+
 class EventCore:
+    __slots__ = ("time", "kind", "args", "sort_key")
+
     def __init__(self, time: int, kind, args: tuple):
         self.time: int = time
         self.kind = kind  #: TODO how to typify enum?
         self.args: tuple = args
 
+        self.sort_key: int = SORT_KEYS[kind]
+
     def __lt__(self, other: 'EventCore'):
-        return (self.time, other.critical, other.priority) < (other.time, self.critical, self.priority)
+        return (self.time, self.sort_key) < (other.time, other.sort_key)
 
     @property
     def critical(self) -> bool:
-        if self.kind is EventKind.BulletHit:
-            return False
-        elif self.kind is EventKind.BulletHitBullet:
-            return False
-        elif self.kind is EventKind.BulletMissed:
-            return False
-        elif self.kind is EventKind.Death:
-            return True
-        elif self.kind is EventKind.Custom:
-            return True
-        elif self.kind is EventKind.HitByBullet:
-            return False
-        elif self.kind is EventKind.HitRobot:
-            return False
-        elif self.kind is EventKind.HitWall:
-            return False
-        elif self.kind is EventKind.RobotDeath:
-            return False
-        elif self.kind is EventKind.ScannedRobot:
-            return False
-        elif self.kind is EventKind.SkippedTurn:
-            return True
-        elif self.kind is EventKind.Status:
-            return False
-        elif self.kind is EventKind.Victory:
-            return True
-        else:
-            raise Exception("unknown event kind")
+        return CRITICAL[self.kind]
 
     @property
     def priority(self) -> int:
-        if self.kind is EventKind.BulletHit:
-            return 50
-        elif self.kind is EventKind.BulletHitBullet:
-            return 55
-        elif self.kind is EventKind.BulletMissed:
-            return 60
-        elif self.kind is EventKind.Death:
-            return -1
-        elif self.kind is EventKind.Custom:
-            return 80
-        elif self.kind is EventKind.HitByBullet:
-            return 20
-        elif self.kind is EventKind.HitRobot:
-            return 40
-        elif self.kind is EventKind.HitWall:
-            return 30
-        elif self.kind is EventKind.RobotDeath:
-            return 70
-        elif self.kind is EventKind.ScannedRobot:
-            return 10
-        elif self.kind is EventKind.SkippedTurn:
-            return 100
-        elif self.kind is EventKind.Status:
-            return 99
-        elif self.kind is EventKind.Victory:
-            return 100
-        else:
-            raise Exception("unknown event kind")
+        return PRIORITIES[self.kind]
@@ -1,10 +1,14 @@
 import enum
-from typing import Callable, Dict, Union
+import math
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 import robopy.core.rules as rules
 
 
 class Statistics:
+    __slots__ = ("time", "battle_state", "robots", "alive_robots")
+
     def __init__(self, robots: int):
         self.time: int = 0
         self.battle_state = None  #: TODO how to typify enum?
@@ -16,7 +20,136 @@ class Statistics:
         self.time += 1
 
 
+class LatencyHistogram:
+    #: Histogram of latencies (in seconds) over log-spaced buckets (BUCKETS_PER_OCTAVE per doubling
+    #: since MIN_LATENCY), so it's of constant size and mergeable, while its percentiles are approximate
+    #: (the upper bound of their bucket). The maximum is exact.
+    MIN_LATENCY: float = 1e-6
+    BUCKETS_PER_OCTAVE: int = 4
+    BUCKETS: int = 100
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * LatencyHistogram.BUCKETS
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    @staticmethod
+    def bound(bucket: int) -> float:
+        return LatencyHistogram.MIN_LATENCY * 2 ** (bucket / LatencyHistogram.BUCKETS_PER_OCTAVE)
+
+    def record(self, latency: float):
+        if latency <= LatencyHistogram.MIN_LATENCY:
+            bucket = 0
+        else:
+            bucket = math.ceil(math.log2(latency / LatencyHistogram.MIN_LATENCY) * LatencyHistogram.BUCKETS_PER_OCTAVE)
+        self.counts[min(bucket, LatencyHistogram.BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def merge(self, other: 'LatencyHistogram'):
+        self.counts = [count + other_count for count, other_count in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percentage: float) -> float:
+        if self.count == 0:
+            return 0.0
+
+        rank, cumulative = math.ceil(self.count * percentage / 100), 0
+        for bucket, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(LatencyHistogram.bound(bucket), self.max)
+        return self.max
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(95)
+
+    def __repr__(self) -> str:
+        return f"LatencyHistogram(count={self.count}, p50={self.p50:.6f}, p95={self.p95:.6f}, max={self.max:.6f})"
+
+
+class RobotStatistics:
+    __slots__ = (
+        "bullet_damage", "bullet_hits", "ram_damage", "survival", "turns",
+        "skipped_turns", "consecutive_skipped_turns", "latency", "abandoned"
+    )
+
+    def __init__(self):
+        self.bullet_damage: float = 0.0
+        self.bullet_hits: int = 0
+        self.ram_damage: float = 0.0
+
+        #: Number of robots that died before this one.
+        self.survival: int = 0
+        #: Number of turns this robot has been alive.
+        self.turns: int = 0
+
+        #: Turns whose command wasn't submitted on time (or took too much CPU time).
+        self.skipped_turns: int = 0
+        self.consecutive_skipped_turns: int = 0
+        #: CPU time the robot took to compute each command.
+        self.latency: LatencyHistogram = LatencyHistogram()
+
+        #: Whether the robot thread didn't stop when the battle stopped (thus it lost its scores).
+        self.abandoned: bool = False
+
+
+class Snapshot(Mapping):
+    #: Immutable record of the given fields, also readable as a (read-only) dict.
+    FIELDS: Tuple[str, ...] = ()
+
+    __slots__ = ()
+
+    def __init__(self, *values):
+        assert len(values) == len(self.FIELDS)
+
+        for name, value in zip(self.FIELDS, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+
 class Command:
+    #: All the fields of a command, in the order of its snapshots.
+    FIELDS: Tuple[str, ...] = (
+        "move", "turn", "turn_gun", "turn_radar", "fire", "scan",
+        "max_velocity", "max_turn_rate",
+        "lock_gun_body", "lock_radar_gun", "lock_radar_body",
+        "wait"
+    )
+
+    __slots__ = FIELDS
+
     def __init__(self):
         self.move: float = 0.0
         self.turn: float = 0.0
@@ -32,25 +165,69 @@ class Command:
         self.lock_radar_gun: bool = True
         self.lock_radar_body: bool = True
 
-        self.wait: Union[Callable[[], bool], None] = None
+        #: The robot isn't woken up until the condition is met (or it receives events),
+        #: being either a callable or a field of the command (or the robot) to be zero.
+        self.wait: Union[Callable[[], bool], str, None] = None
 
     @property
-    def status(self) -> Dict[str, float]:
-        command_status = dict(
-            move=self.move,
-            turn=self.turn,
-            turn_gun=self.turn_gun,
-            turn_radar=self.turn_radar,
-            fire=self.fire,
-            scan=self.scan,
-            max_velocity=self.max_velocity,
-            max_turn_rate=self.max_turn_rate,
-            lock_gun_body=self.lock_gun_body,
-            lock_radar_gun=self.lock_radar_gun,
-            lock_radar_body=self.lock_radar_body,
-            wait=self.wait
+    def status(self) -> 'CommandStatus':
+        return CommandStatus(*self.snapshot())
+
+    def snapshot(self) -> tuple:
+        return (
+            self.move, self.turn, self.turn_gun, self.turn_radar, self.fire, self.scan,
+            self.max_velocity, self.max_turn_rate,
+            self.lock_gun_body, self.lock_radar_gun, self.lock_radar_body,
+            self.wait
         )
-        return command_status
+
+    def restore(self, snapshot: tuple):
+        self.move, self.turn, self.turn_gun, self.turn_radar, self.fire, self.scan, \
+            self.max_velocity, self.max_turn_rate, \
+            self.lock_gun_body, self.lock_radar_gun, self.lock_radar_body, \
+            self.wait = snapshot
+
+    def copy(self) -> 'Command':
+        command = Command.__new__(Command)
+        command.restore(self.snapshot())
+        return command
+
+    def __deepcopy__(self, memo: dict) -> 'Command':
+        #: The wait condition is shared (it's a callable of the robot).
+        return self.copy()
+
+    def apply(self, changes: Dict[str, Any]):
+        #: Overwrites the given fields only.
+        for name, value in changes.items():
+            setattr(self, name, value)
+
+
+class Step:
+    #: Step of a plan of commands: the command is changed, then the step lasts until
+    #: its wait condition is met (see Command.wait), or a turn if it hasn't any.
+    __slots__ = ("changes", "wait")
+
+    def __init__(self, changes: Dict[str, Any], wait: Union[Callable[[], bool], str, None] = None):
+        self.changes: Dict[str, Any] = changes
+        self.wait: Union[Callable[[], bool], str, None] = wait
+
+
+class CommandStatus(Snapshot):
+    FIELDS: Tuple[str, ...] = Command.FIELDS
+
+    __slots__ = FIELDS
+
+
+class RobotStatus(Snapshot):
+    FIELDS: Tuple[str, ...] = (
+        "time", "name",
+        "x", "y", "heading", "gun_heading", "radar_heading",
+        "energy", "gun_heat", "velocity",
+        "disabled", "dead",
+        "action_status"
+    )
+
+    __slots__ = FIELDS
 
 
 @enum.unique
@@ -61,6 +238,25 @@ class BattleState(enum.IntEnum):
     STOPPED = enum.auto()
 
 
+@enum.unique
+class Scheduler(enum.IntEnum):
+    #: TODO how to typify enum?
+    FIXED = enum.auto()
+    BARRIER = enum.auto()
+    SYNCHRONOUS = enum.auto()
+
+
+@enum.unique
+class TurnPhase(enum.IntEnum):
+    #: TODO how to typify enum?
+    SETUP = enum.auto()
+    EXECUTION = enum.auto()
+    UPDATE = enum.auto()
+    BULLETS = enum.auto()
+    SCAN = enum.auto()
+    EVENTS = enum.auto()
+
+
 @enum.unique
 class BulletState(enum.IntEnum):
     #: TODO how to typify enum?
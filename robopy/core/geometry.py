@@ -0,0 +1,198 @@
+import math
+from typing import Tuple, Union
+
+try:
+    import shapely.geometry as shapely_geometry
+except ImportError:  #: shapely is only required by the reference implementation.
+    shapely_geometry = None
+
+
+#: Boxes are axis-aligned (min_x, min_y, max_x, max_y) tuples.
+Box = Tuple[float, float, float, float]
+
+#: Segments are (x0, y0, x1, y1) tuples.
+Segment = Tuple[float, float, float, float]
+
+#: Triangles are ((x0, y0), (x1, y1), (x2, y2)) tuples.
+Triangle = Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]
+
+#: Sectors are (x, y, start_angle, end_angle, radius) tuples, spanning the smaller angle
+#: between both headings (headings are clockwise from the y axis, as the robots' ones).
+Sector = Tuple[float, float, float, float, float]
+
+#: All the tests below consider the boundaries as part of the shapes
+#: (e.g. boxes that share an edge intersect), as shapely's intersects does.
+
+
+def boxes_intersect(a: Box, b: Box) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def segment_intersects_box(segment: Segment, box: Box) -> bool:
+    #: Liang-Barsky clipping of the segment against the box.
+    x0, y0, x1, y1 = segment
+    dx, dy = x1 - x0, y1 - y0
+
+    t0, t1 = 0.0, 1.0
+    for p, q in ((-dx, x0 - box[0]), (dx, box[2] - x0), (-dy, y0 - box[1]), (dy, box[3] - y0)):
+        if p == 0:
+            #: The segment is parallel to this edge, thus it must be inside of it.
+            if q < 0:
+                return False
+        else:
+            t = q / p
+            if p < 0:
+                if t > t1:
+                    return False
+                if t > t0:
+                    t0 = t
+            else:
+                if t < t0:
+                    return False
+                if t < t1:
+                    t1 = t
+    return True
+
+
+def _orientation(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def _on_segment(ax: float, ay: float, bx: float, by: float, px: float, py: float) -> bool:
+    #: Whether the point p (collinear with a and b) lies on the segment ab.
+    return min(ax, bx) <= px <= max(ax, bx) and min(ay, by) <= py <= max(ay, by)
+
+
+def segment_intersection(a: Segment, b: Segment) -> Union[Tuple[float, float], None]:
+    #: Returns an intersection point of both segments (if any).
+    #: Overlapping collinear segments return the first point of the overlap.
+    ax0, ay0, ax1, ay1 = a
+    bx0, by0, bx1, by1 = b
+
+    #: Cheap rejection by the bounding boxes.
+    if max(ax0, ax1) < min(bx0, bx1) or max(bx0, bx1) < min(ax0, ax1) \
+            or max(ay0, ay1) < min(by0, by1) or max(by0, by1) < min(ay0, ay1):
+        return None
+
+    d1 = _orientation(bx0, by0, bx1, by1, ax0, ay0)
+    d2 = _orientation(bx0, by0, bx1, by1, ax1, ay1)
+    d3 = _orientation(ax0, ay0, ax1, ay1, bx0, by0)
+    d4 = _orientation(ax0, ay0, ax1, ay1, bx1, by1)
+
+    if ((d1 > 0 > d2) or (d1 < 0 < d2)) and ((d3 > 0 > d4) or (d3 < 0 < d4)):
+        #: Proper intersection.
+        t = d1 / (d1 - d2)
+        return ax0 + t * (ax1 - ax0), ay0 + t * (ay1 - ay0)
+
+    #: Touching or collinear segments.
+    if d1 == 0 and _on_segment(bx0, by0, bx1, by1, ax0, ay0):
+        return ax0, ay0
+    if d2 == 0 and _on_segment(bx0, by0, bx1, by1, ax1, ay1):
+        return ax1, ay1
+    if d3 == 0 and _on_segment(ax0, ay0, ax1, ay1, bx0, by0):
+        return bx0, by0
+    if d4 == 0 and _on_segment(ax0, ay0, ax1, ay1, bx1, by1):
+        return bx1, by1
+    return None
+
+
+def triangle_intersects_box(triangle: Triangle, box: Box) -> bool:
+    #: Separating axis test: the axes of the box and the normals of the triangle edges.
+    (x0, y0), (x1, y1), (x2, y2) = triangle
+
+    if max(x0, x1, x2) < box[0] or min(x0, x1, x2) > box[2] \
+            or max(y0, y1, y2) < box[1] or min(y0, y1, y2) > box[3]:
+        return False
+
+    corners = ((box[0], box[1]), (box[2], box[1]), (box[2], box[3]), (box[0], box[3]))
+    for ax, ay, bx, by, cx, cy in ((x0, y0, x1, y1, x2, y2), (x1, y1, x2, y2, x0, y0), (x2, y2, x0, y0, x1, y1)):
+        nx, ny = ay - by, bx - ax
+        if nx == 0 and ny == 0:
+            #: Degenerated edge.
+            continue
+
+        #: Project the triangle (edge a-b and the opposite vertex c) and the box corners.
+        edge = nx * ax + ny * ay
+        opposite = nx * cx + ny * cy
+        low, high = min(edge, opposite), max(edge, opposite)
+        projections = [nx * x + ny * y for x, y in corners]
+        if max(projections) < low or min(projections) > high:
+            return False
+    return True
+
+
+def ray_intersects_box(x: float, y: float, dx: float, dy: float, length: float, box: Box) -> bool:
+    #: Whether the ray from (x, y) along the unit direction (dx, dy) enters the box within the given length.
+    t0, t1 = 0.0, length
+    for origin, direction, low, high in ((x, dx, box[0], box[2]), (y, dy, box[1], box[3])):
+        if direction == 0:
+            if origin < low or origin > high:
+                return False
+        else:
+            a, b = (low - origin) / direction, (high - origin) / direction
+            t0, t1 = max(t0, min(a, b)), min(t1, max(a, b))
+            if t0 > t1:
+                return False
+    return True
+
+
+def sector_intersects_box(sector: Sector, box: Box) -> bool:
+    x, y, start_angle, end_angle, radius = sector
+
+    #: Range culling: the closest point of the box must be within the radius.
+    dx = min(max(x, box[0]), box[2]) - x
+    dy = min(max(y, box[1]), box[3]) - y
+    if dx * dx + dy * dy > radius * radius:
+        return False
+
+    #: If the closest point of the box is within the angles of the sector (or it's its apex),
+    #: then the box intersects the sector.
+    sx, sy = math.sin(start_angle), math.cos(start_angle)
+    ex, ey = math.sin(end_angle), math.cos(end_angle)
+    cross = sx * ey - sy * ex
+    if dx == 0 and dy == 0:
+        return True
+    if cross > 0 and sx * dy - sy * dx >= 0 and dx * ey - dy * ex >= 0:
+        return True
+    if cross < 0 and sx * dy - sy * dx <= 0 and dx * ey - dy * ex <= 0:
+        return True
+
+    #: Otherwise the closest point of the box within the angles of the sector
+    #: (which is convex) lies on one of its edges.
+    return ray_intersects_box(x, y, sx, sy, radius, box) or ray_intersects_box(x, y, ex, ey, radius, box)
+
+
+#: Reference implementations (backed by shapely), used to validate the tests above.
+
+
+def reference_boxes_intersect(a: Box, b: Box) -> bool:
+    return shapely_geometry.box(*a).intersects(shapely_geometry.box(*b))
+
+
+def reference_segment_intersects_box(segment: Segment, box: Box) -> bool:
+    line = shapely_geometry.LineString([segment[:2], segment[2:]])
+    return line.intersects(shapely_geometry.box(*box))
+
+
+def reference_segment_intersection(a: Segment, b: Segment) -> Union[Tuple[float, float], None]:
+    line_a = shapely_geometry.LineString([a[:2], a[2:]])
+    line_b = shapely_geometry.LineString([b[:2], b[2:]])
+    if not line_a.intersects(line_b):
+        return None
+    intersection = line_a.intersection(line_b)
+    return intersection.coords[0]
+
+
+def reference_triangle_intersects_box(triangle: Triangle, box: Box) -> bool:
+    return shapely_geometry.Polygon(triangle).intersects(shapely_geometry.box(*box))
+
+
+def reference_sector_intersects_box(sector: Sector, box: Box, resolution: int = 1024) -> bool:
+    #: The arc of the sector is approximated by a polyline.
+    x, y, start_angle, end_angle, radius = sector
+    sweep = (end_angle - start_angle + math.pi) % (2 * math.pi) - math.pi
+    angles = [start_angle + sweep * k / resolution for k in range(resolution + 1)]
+    points = [(x, y)] + [(x + radius * math.sin(angle), y + radius * math.cos(angle)) for angle in angles]
+    if sweep == 0:
+        return shapely_geometry.LineString(points).intersects(shapely_geometry.box(*box))
+    return shapely_geometry.Polygon(points).intersects(shapely_geometry.box(*box))
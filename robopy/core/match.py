@@ -0,0 +1,114 @@
+from typing import Dict, List, Tuple, Type, Union
+
+import robopy.core.rules as rules
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import BattleState, LatencyHistogram, Scheduler
+
+
+class RobotResults:
+    def __init__(self, name: str):
+        self.name: str = name
+
+        self.rounds: int = 0
+        self.wins: int = 0
+        #: Rounds ended without winner (e.g. lasting the maximum amount of turns).
+        self.draws: int = 0
+        self.survival: int = 0
+        self.bullet_damage: float = 0.0
+        self.bullet_hits: int = 0
+        self.ram_damage: float = 0.0
+        self.turns: int = 0
+        self.skipped_turns: int = 0
+        #: CPU time the robot took to compute each command (see p50, p95 and max).
+        self.latency: LatencyHistogram = LatencyHistogram()
+        #: Rounds whose robot thread didn't stop (thus it lost its scores of the round).
+        self.abandoned: int = 0
+
+    @property
+    def damage_dealt(self) -> float:
+        return self.bullet_damage + self.ram_damage
+
+    @property
+    def average_turns(self) -> float:
+        if self.rounds == 0:
+            return 0.0
+        return self.turns / self.rounds
+
+    def merge(self, other: 'RobotResults'):
+        assert self.name == other.name
+
+        self.rounds += other.rounds
+        self.wins += other.wins
+        self.draws += other.draws
+        self.survival += other.survival
+        self.bullet_damage += other.bullet_damage
+        self.bullet_hits += other.bullet_hits
+        self.ram_damage += other.ram_damage
+        self.turns += other.turns
+        self.skipped_turns += other.skipped_turns
+        self.latency.merge(other.latency)
+        self.abandoned += other.abandoned
+
+
+class Match:
+    def __init__(self, battlefield_dimensions: Tuple[int, int], robot_classes: List[Type[Robot]], rounds: int,
+                 scheduler: Scheduler = Scheduler.BARRIER, turn_time: Union[float, None] = 0.1,
+                 cpu_time: Union[float, None] = rules.MAX_TURN_CPU_TIME, seed: Union[int, None] = None,
+                 max_turns: Union[int, None] = rules.MAX_ROUND_TURNS):
+        assert rounds > 0
+
+        self.battlefield_dimensions: Tuple[int, int] = battlefield_dimensions
+        self.robot_classes: List[Type[Robot]] = robot_classes
+        self.rounds: int = rounds
+
+        self.scheduler = scheduler  #: TODO how to typify enum?
+        self.turn_time: Union[float, None] = turn_time
+        self.cpu_time: Union[float, None] = cpu_time
+        #: Each round is seeded by the following seed (if any).
+        self.seed: Union[int, None] = seed
+        #: Rounds lasting max_turns turns are ended as a draw, so robots that never meet can't stall the match.
+        self.max_turns: Union[int, None] = max_turns
+
+        self.round: int = 0
+        self.results: Dict[str, RobotResults] = {}
+
+    def run(self) -> Dict[str, RobotResults]:
+        while self.round < self.rounds:
+            self.run_round()
+        return self.results
+
+    def run_round(self) -> Battle:
+        assert self.round < self.rounds
+
+        battle = Battle(
+            self.battlefield_dimensions, self.robot_classes, self.scheduler, self.turn_time, cpu_time=self.cpu_time,
+            seed=self.seed + self.round if self.seed is not None else None, max_turns=self.max_turns
+        )
+
+        #: There's no GUI, thus the battle runs on the current thread
+        #: instead of spawning a battle thread for each round.
+        battle.run()
+        assert battle.statistics.battle_state is BattleState.STOPPED
+
+        for robot in battle.robots:
+            if robot.name not in self.results:
+                self.results[robot.name] = RobotResults(robot.name)
+            results = self.results[robot.name]
+
+            results.rounds += 1
+            if not robot.dead and battle.statistics.alive_robots == 1:
+                results.wins += 1
+            elif battle.statistics.alive_robots != 1:
+                results.draws += 1
+            results.survival += robot.robot_statistics.survival
+            results.bullet_damage += robot.robot_statistics.bullet_damage
+            results.bullet_hits += robot.robot_statistics.bullet_hits
+            results.ram_damage += robot.robot_statistics.ram_damage
+            results.turns += robot.robot_statistics.turns
+            results.skipped_turns += robot.robot_statistics.skipped_turns
+            results.latency.merge(robot.robot_statistics.latency)
+            results.abandoned += int(robot.robot_statistics.abandoned)
+
+        self.round += 1
+        return battle
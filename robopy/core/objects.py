@@ -1,18 +1,24 @@
 import math
 import random
+import time
+from collections import deque
 from threading import Lock
-from typing import Callable, Dict, Tuple, Union
+from typing import Any, Callable, Deque, Dict, List, Set, Tuple, Union
 
 import cv2
 import numpy as np
-import shapely.geometry as geometry
 
 import robopy.core.rules as rules
+from robopy.core import geometry
+from robopy.core.conditions import TIME_BUDGET, CustomEvents
 from robopy.core.events import EventCore, EventKind
-from robopy.core.execution import Statistics, Command, BattleState, BulletState, RobotState, InterruptedExecutionException
+from robopy.core.execution import Statistics, RobotStatistics, Command, BattleState, BulletState, RobotState, \
+    RobotStatus, Step, InterruptedExecutionException
+from robopy.core.pairwise import PairwiseMatrix, get_angle_distance
+from robopy.core.spatial import SpatialGrid, SweepAndPrune
 from robopy.utils import normalization
 from robopy.utils.math import sign
-from robopy.utils.threading import List as ThreadingList
+from robopy.utils.threading import Mailbox, TurnBarrier
 
 
 class BattlefieldCore:
@@ -28,6 +34,8 @@ class BattlefieldCore:
 class BulletCore:
     RADIUS: int = 3
 
+    __slots__ = ("battlefield", "owner", "power", "x", "y", "heading", "state", "victim", "line")
+
     def __init__(self, battlefield: BattlefieldCore, x: float, y: float, heading: float, owner: 'RobotCore', power: float):
         self.battlefield: BattlefieldCore = battlefield
         self.owner: RobotCore = owner
@@ -40,7 +48,7 @@ class BulletCore:
 
         self.state = BulletState.FIRED  #: TODO how to typify enum?
         self.victim: Union[RobotCore, None] = None
-        self.line: geometry.LineString = geometry.LineString([(x, y), (x, y)])
+        self.line: geometry.Segment = (x, y, x, y)
 
     @property
     def damage(self) -> float:
@@ -66,21 +74,31 @@ class BulletCore:
     def inactive(self) -> bool:
         return self.state is BulletState.INACTIVE
 
-    def update(self, robots: Tuple['RobotCore'], bullets: Tuple['BulletCore']):
+    @property
+    def center(self) -> Tuple[float, float]:
+        #: Center of the bullet line.
+        return (self.line[0] + self.line[2]) / 2, (self.line[1] + self.line[3]) / 2
+
+    def update(self, robots: Tuple['RobotCore'], bullets: Tuple['BulletCore'],
+               robot_grid: Union[SpatialGrid, None] = None, bullet_grid: Union[SpatialGrid, None] = None):
+        #: When grids are given, only the robots and bullets
+        #: near this bullet are checked for collisions.
         if self.active:
             #: Update coordinates.
             self.update_coordinates()
+            if bullet_grid is not None:
+                bullet_grid.move(self, *self.center)
 
             #: Check for wall collisions.
             self.check_wall_collision()
 
             #: Check for robot collisions.
             if self.active:
-                self.check_robot_collision(robots)
+                self.check_robot_collision(robots, robot_grid.query(*self.center) if robot_grid is not None else None)
 
             #: Check for bullet collisions.
             if self.active:
-                self.check_bullet_collision(bullets)
+                self.check_bullet_collision(bullet_grid.query(*self.center) if bullet_grid is not None else bullets)
         elif self.exploded:
             self.state = BulletState.INACTIVE
 
@@ -90,7 +108,7 @@ class BulletCore:
         self.x += self.velocity * math.sin(self.heading)
         self.y += self.velocity * math.cos(self.heading)
 
-        self.line = geometry.LineString([(last_x, last_y), (self.x, self.y)])
+        self.line = (last_x, last_y, self.x, self.y)
         self.state = BulletState.MOVING
 
     def check_wall_collision(self):
@@ -98,57 +116,66 @@ class BulletCore:
         max_x, max_y = self.battlefield.width - BulletCore.RADIUS, self.battlefield.height - BulletCore.RADIUS
 
         if not min_x <= self.x <= max_x or not min_y <= self.y <= max_y:
-            self.state = BulletState.HIT_WALL
-
-            #: Add BulletMissed event to the owner's process queue.
-            self.owner.add_event(EventKind.BulletMissed, (self,))
+            self.hit_wall()
 
-    def check_robot_collision(self, robots: Tuple['RobotCore']):
-        for robot in robots:
+    def check_robot_collision(self, robots: Tuple['RobotCore'], candidates: Union[List['RobotCore'], None] = None):
+        for robot in candidates if candidates is not None else robots:
             if robot is self.owner or robot.dead:
                 continue
-            elif self.line.intersects(robot.polygon):
-                robot.update_energy(-self.damage, True, robots)
-
-                self.owner.update_energy(self.hit_bonus)
-
-                self.victim = robot
-                self.state = BulletState.HIT_VICTIM
-
-                #: Add BulletHit event to the owner's process queue.
-                self.owner.add_event(EventKind.BulletHit, (robot.name, robot.energy, self))
-
-                #: Add HitByBullet event to the robot's process queue.
-                robot.add_event(
-                    EventKind.HitByBullet,
-                    (
-                        normalization.normalize_angle(self.heading + math.radians(180) - robot.heading, relative=True),
-                        self
-                    )
-                )
+            elif geometry.segment_intersects_box(self.line, robot.box):
+                self.hit_robot(robot, robots)
                 break
 
-    def check_bullet_collision(self, bullets: Tuple['BulletCore']):
+    def check_bullet_collision(self, bullets: Union[Tuple['BulletCore'], List['BulletCore']]):
         for bullet in bullets:
             if bullet is self or bullet.owner is self.owner or not bullet.active:
                 continue
-            elif self.line.intersects(bullet.line):
-                point = self.line.intersection(bullet.line)
+            point = geometry.segment_intersection(self.line, bullet.line)
+            if point is not None:
+                self.hit_bullet(bullet, point)
+                break
 
-                self.x = point.x
-                self.y = point.y
-                self.state = BulletState.HIT_BULLET
+    def hit_wall(self):
+        self.state = BulletState.HIT_WALL
 
-                bullet.x = point.x
-                bullet.y = point.y
-                bullet.state = BulletState.HIT_BULLET
+        #: Add BulletMissed event to the owner's process queue.
+        self.owner.add_event(EventKind.BulletMissed, (self,))
 
-                #: Add BulletHitBullet event to the owner's process queue.
-                self.owner.add_event(EventKind.BulletHitBullet, (self, bullet))
+    def hit_robot(self, robot: 'RobotCore', robots: Tuple['RobotCore']):
+        self.owner.robot_statistics.bullet_damage += min(self.damage, robot.energy)
+        self.owner.robot_statistics.bullet_hits += 1
 
-                #: Add BulletHitBullet event to the robot's process queue.
-                bullet.owner.add_event(EventKind.BulletHitBullet, (bullet, self))
-                break
+        robot.update_energy(-self.damage, True, robots)
+
+        self.owner.update_energy(self.hit_bonus)
+
+        self.victim = robot
+        self.state = BulletState.HIT_VICTIM
+
+        #: Add BulletHit event to the owner's process queue.
+        self.owner.add_event(EventKind.BulletHit, (robot.name, robot.energy, self))
+
+        #: Add HitByBullet event to the robot's process queue.
+        robot.add_event(
+            EventKind.HitByBullet,
+            (
+                normalization.normalize_angle(self.heading + math.radians(180) - robot.heading, relative=True),
+                self
+            )
+        )
+
+    def hit_bullet(self, bullet: 'BulletCore', point: Tuple[float, float]):
+        self.x, self.y = point
+        self.state = BulletState.HIT_BULLET
+
+        bullet.x, bullet.y = point
+        bullet.state = BulletState.HIT_BULLET
+
+        #: Add BulletHitBullet event to the owner's process queue.
+        self.owner.add_event(EventKind.BulletHitBullet, (self, bullet))
+
+        #: Add BulletHitBullet event to the robot's process queue.
+        bullet.owner.add_event(EventKind.BulletHitBullet, (bullet, self))
 
     def paint(self, screen: np.ndarray) -> np.ndarray:
         center = (int(self.x), int(self.y))
@@ -163,21 +190,43 @@ class RobotCore:
     HALF_WIDTH: int = WIDTH // 2
     HALF_HEIGHT: int = HEIGHT // 2
 
-    def __init__(self, name: str, statistics: Statistics, battlefield: BattlefieldCore, robots: Tuple['RobotCore']):
+    #: Name of the callable wait condition among the conditions evaluated by the battle thread.
+    WAIT: str = "wait"
+
+    __slots__ = (
+        "name", "statistics", "robot_statistics", "battlefield",
+        "x", "y", "heading", "gun_heading", "radar_heading",
+        "energy", "gun_heat", "velocity",
+        "in_collision", "over_driving",
+        "lock", "barrier", "state", "command", "plan", "step", "waits", "condition_time",
+        "events", "custom_events", "subscriptions", "__status",
+        "woken", "turn_cpu_time", "random",
+        "box", "scan_arc", "scan_sector"
+    )
+
+    def __init__(self, name: str, statistics: Statistics, battlefield: BattlefieldCore, robots: Tuple['RobotCore'],
+                 barrier: Union[TurnBarrier, None] = None, rng: Union[random.Random, None] = None):
+        #: The placement is drawn by the given generator (the battle's), while the robot draws
+        #: from its own one (seeded by the former), so its draws don't change the battle's.
+        if rng is None:
+            rng = random.Random()
+        self.random: random.Random = random.Random(rng.getrandbits(64))
+
         self.name: str = name
         self.statistics: statistics = statistics
+        self.robot_statistics: RobotStatistics = RobotStatistics()
         self.battlefield: BattlefieldCore = battlefield
 
         self.x: float = normalization.normalize(
-            random.random(), 0, 1,
+            rng.random(), 0, 1,
             0 + RobotCore.HALF_WIDTH, battlefield.width - RobotCore.HALF_WIDTH
         )
         self.y: float = normalization.normalize(
-            random.random(), 0, 1,
+            rng.random(), 0, 1,
             0 + RobotCore.HALF_HEIGHT, battlefield.height - RobotCore.HALF_HEIGHT
         )
 
-        heading = random.random() * math.radians(360)
+        heading = rng.random() * math.radians(360)
         self.heading: float = heading
         self.gun_heading: float = heading
         self.radar_heading: float = heading
@@ -190,12 +239,34 @@ class RobotCore:
         self.over_driving: bool = False
 
         self.lock: Lock = Lock()
+        self.barrier: Union[TurnBarrier, None] = barrier
+        if self.barrier is not None:
+            #: Under a turn barrier every execution (even the first one)
+            #: must wait until the battle thread processes the turn.
+            self.lock.acquire()
         self.state = RobotState.ACTIVE  #: TODO how to typify enum?
         self.command: Command = Command()
-        self.events: ThreadingList[EventCore] = ThreadingList()
-        self.custom_events: Dict[str, Callable[[], bool]] = {}
-
-        self.polygon: geometry.Polygon = geometry.box(
+        #: Pending steps of the plan of commands, and the step being performed.
+        self.plan: Deque[Step] = deque()
+        self.step: Union[Step, None] = None
+        #: Callable wait conditions are evaluated (as WAIT) by the battle thread within the time budget of
+        #: conditions (unless it's None), as callable custom events are. Once they fail or keep exceeding it
+        #: in a row, they aren't evaluated by the battle thread anymore (None), but by the robot on its own.
+        self.waits: Union[CustomEvents, None] = CustomEvents()
+        self.condition_time: Union[float, None] = TIME_BUDGET
+        #: Written by the battle thread, and read by the robot thread once per turn.
+        self.events: Mailbox = Mailbox()
+        self.custom_events: CustomEvents = CustomEvents()
+        #: Kinds of events the robot handles, the rest of events are never published.
+        self.subscriptions: Set[EventKind] = set(EventKind)
+        #: Snapshot of the status shared by every read until the battle invalidates it (once per turn).
+        self.__status: Union[RobotStatus, None] = None
+        #: CPU time of the robot thread when it was last woken up, and the CPU time it took
+        #: to compute its last command (until the battle thread accounts it).
+        self.woken: Union[float, None] = None
+        self.turn_cpu_time: Union[float, None] = None
+
+        self.box: geometry.Box = (
             int(self.x - RobotCore.HALF_WIDTH),
             int(self.y - RobotCore.HALF_HEIGHT),
             int(self.x + RobotCore.HALF_WIDTH),
@@ -206,24 +277,25 @@ class RobotCore:
         sin = math.sin(self.radar_heading)
         cos = math.cos(self.radar_heading)
         end = (int(center[0] + rules.RADAR_RANGE * sin), int(center[1] + rules.RADAR_RANGE * cos))
-        self.scan_arc: geometry.Polygon = geometry.Polygon([center, end, end])
+        self.scan_arc: geometry.Triangle = (center, end, end)
+        self.scan_sector: geometry.Sector = (self.x, self.y, self.radar_heading, self.radar_heading, rules.RADAR_RANGE)
 
         def valid_coordinates() -> bool:
             for robot in robots:
-                if self.polygon.intersects(robot.polygon):
+                if geometry.boxes_intersect(self.box, robot.box):
                     return False
             return True
 
         while not valid_coordinates():
             self.x: float = normalization.normalize(
-                random.random(), 0, 1,
+                rng.random(), 0, 1,
                 0 + RobotCore.HALF_WIDTH, battlefield.width - RobotCore.HALF_WIDTH
             )
             self.y: float = normalization.normalize(
-                random.random(), 0, 1,
+                rng.random(), 0, 1,
                 0 + RobotCore.HALF_HEIGHT, battlefield.height - RobotCore.HALF_HEIGHT
             )
-            self.update_polygon()
+            self.update_box()
             self.update_scan_arc(self.radar_heading)
 
     @property
@@ -235,23 +307,34 @@ class RobotCore:
         return self.state is RobotState.DEAD
 
     @property
-    def status(self) -> dict:
-        _status = dict(
-            time=self.statistics.time,
-            name=self.name,
-            x=self.x,
-            y=self.y,
-            heading=self.heading,
-            gun_heading=self.gun_heading,
-            radar_heading=self.radar_heading,
-            energy=self.energy,
-            gun_heat=self.gun_heat,
-            velocity=self.velocity,
-            disabled=self.disabled,
-            dead=self.dead,
-            action_status=self.command.status
-        )
-        return _status
+    def status(self) -> RobotStatus:
+        status = self.__status
+        if status is None:
+            status = RobotStatus(
+                self.statistics.time,
+                self.name,
+                self.x,
+                self.y,
+                self.heading,
+                self.gun_heading,
+                self.radar_heading,
+                self.energy,
+                self.gun_heat,
+                self.velocity,
+                self.disabled,
+                self.dead,
+                self.command.status
+            )
+            self.__status = status
+        return status
+
+    def invalidate_status(self):
+        self.__status = None
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        #: Center of the robot box.
+        return (self.box[0] + self.box[2]) / 2, (self.box[1] + self.box[3]) / 2
 
     @property
     def locked(self) -> bool:
@@ -260,17 +343,104 @@ class RobotCore:
     def release(self):
         self.lock.release()
 
-    def execute(self, command: Command):
+    def __met(self, wait: Union[Callable[[], bool], str, None]) -> bool:
+        if wait is None:
+            return True
+        elif isinstance(wait, str):
+            return getattr(self.command if wait in Command.FIELDS else self, wait) == 0
+
+        elif self.waits is None:
+            return True
+
+        #: The strikes of the robot's conditions add up (while they overrun in a row), even if the condition changes.
+        self.waits.callables[RobotCore.WAIT] = wait
+        met, dropped = self.waits.evaluate(self.condition_time)
+        if len(dropped) > 0:
+            self.waits = None
+            self.add_event(EventKind.ConditionDropped, (RobotCore.WAIT,))
+            return True
+        return len(met) > 0
+
+    @property
+    def waiting(self) -> bool:
+        #: Whether the wait condition of the command isn't met yet.
+        return not self.__met(self.command.wait)
+
+    @property
+    def planning(self) -> bool:
+        return self.step is not None or len(self.plan) > 0
+
+    @property
+    def parked(self) -> bool:
+        #: Robots waiting for a condition (or performing a plan) aren't woken up (thus their command is
+        #: processed again next turn) until it's done, they receive events, they die or the battle is not running.
+        return not self.dead and self.statistics.battle_state is BattleState.RUNNING \
+            and len(self.events) == 0 and (self.waiting or self.planning)
+
+    def __start_step(self):
+        while self.step is None and len(self.plan) > 0:
+            step = self.plan.popleft()
+            #: Steps without changes only wait, thus they're skipped if their condition is met already.
+            if len(step.changes) == 0 and self.__met(step.wait):
+                continue
+            self.command.apply(step.changes)
+            self.step = step
+
+    def advance_plan(self):
+        #: Called once the command of the turn is processed.
+        #: Disabled robots can't move nor fire (thus can't perform their plan).
+        if self.disabled:
+            self.plan.clear()
+            self.step = None
+        elif self.step is not None and self.__met(self.step.wait):
+            self.step = None
+        self.__start_step()
+
+    def execute(self, changes: Dict[str, Any], blocking: bool = True, plan: Union[List[Step], None] = None):
         #: Robots can't execute if they are dead or the battle is not running.
         if self.dead:
             raise InterruptedExecutionException("robot is dead")
         elif self.statistics.battle_state is not BattleState.RUNNING:
             raise InterruptedExecutionException("battle is not running")
 
+        #: The CPU time the robot thread took to compute this command (since it was woken up).
+        #: Cooperative robots are timed by the battle thread instead.
+        if self.woken is not None:
+            self.turn_cpu_time = time.thread_time() - self.woken
+            self.woken = None
+
+        #: Only the fields changed by the robot since its last execution are sent.
+        #: The command is replaced at once, so the battle thread never sees it half-changed.
+        #: Wait conditions hold for the execution that set them only.
+        command = self.command.copy()
+        command.wait = None
+        command.apply(changes)
         self.command = command
 
+        #: A new plan replaces the current one, starting on this turn.
+        if plan is not None:
+            self.plan = deque(plan)
+            self.step = None
+            self.__start_step()
+
+        #: Notify the battle thread that the command of this turn was submitted.
+        if self.barrier is not None:
+            self.barrier.arrive(self)
+
         #: Wait until the battle thread finish the updates.
-        self.lock.acquire()
+        #: Cooperative robots don't wait, they're resumed by the battle thread afterwards
+        #: (but the lock is still acquired if possible, so they're processed under the FIXED scheduler).
+        self.lock.acquire(blocking)
+        if blocking:
+            #: Robots blocked when the battle stops are woken up to be interrupted.
+            if self.statistics.battle_state is BattleState.STOPPED:
+                raise InterruptedExecutionException("battle is stopped")
+            self.woken = time.thread_time()
+
+    def depart(self):
+        #: Called once the robot thread ends, so the battle thread doesn't wait for it anymore.
+        if self.barrier is not None:
+            self.barrier.depart(self)
 
     def fire(self) -> Union[BulletCore, None]:
         assert not self.dead
@@ -285,17 +455,21 @@ class RobotCore:
         self.command.fire = 0.0
         return bullet
 
-    def scan(self, robots: Tuple['RobotCore']):
+    def scan(self, robots: Tuple['RobotCore'], targets: Union[List['RobotCore'], None] = None,
+             pairwise: Union[PairwiseMatrix, None] = None):
+        #: The targets (if given) are the robots already known to be within the scan sector.
         assert not self.dead
 
-        if self.command.scan:
-            for robot in robots:
+        if self.command.scan and EventKind.ScannedRobot in self.subscriptions:
+            for robot in targets if targets is not None else robots:
                 if robot is self or robot.dead:
                     continue
-                if self.scan_arc.intersects(robot.polygon):
-                    angle = math.atan2(robot.x - self.x, robot.y - self.y)
+                if targets is not None or geometry.sector_intersects_box(self.scan_sector, robot.box):
+                    if pairwise is not None:
+                        angle, distance = pairwise.get(self, robot)
+                    else:
+                        angle, distance = get_angle_distance(self, robot)
                     bearing = normalization.normalize_angle(angle - self.heading, relative=True)
-                    distance = math.sqrt((robot.x - self.x)**2 + (robot.y - self.y)**2)
 
                     #: Add ScannedRobot event to the process queue.
                     self.add_event(
@@ -311,7 +485,7 @@ class RobotCore:
                     )
         self.command.scan = False
 
-    def update(self, robots: Tuple['RobotCore']):
+    def update(self, robots: Tuple['RobotCore'], robot_sweep: Union[SweepAndPrune, None] = None):
         assert not self.dead
 
         self.state = RobotState.ACTIVE
@@ -345,7 +519,12 @@ class RobotCore:
             self.check_wall_collision()
 
             #: Check for robot collisions.
-            self.check_robot_collision(robots)
+            self.check_robot_collision(
+                robots, robot_sweep.query(self.box[0], self.box[2]) if robot_sweep is not None else None
+            )
+
+            if robot_sweep is not None:
+                robot_sweep.move(self, self.box[0], self.box[2])
 
         #: Update the scan arc.
         self.update_scan_arc(last_radar_heading)
@@ -373,7 +552,7 @@ class RobotCore:
         if self.velocity != 0:
             self.x += self.velocity * math.sin(self.heading)
             self.y += self.velocity * math.cos(self.heading)
-            self.update_polygon()
+            self.update_box()
         self.command.move -= self.velocity
 
     def update_heading(self):
@@ -417,14 +596,13 @@ class RobotCore:
             if kill:
                 self.kill(robots)
 
-    def update_polygon(self):
+    def update_box(self):
         center = (int(self.x), int(self.y))
 
         start = (int(center[0] - RobotCore.HALF_WIDTH), int(center[1] - RobotCore.HALF_HEIGHT))
         end = (int(center[0] + RobotCore.HALF_WIDTH), int(center[1] + RobotCore.HALF_HEIGHT))
-        bounds = (*start, *end)
 
-        self.polygon = geometry.box(*bounds)
+        self.box = (*start, *end)
 
     def update_scan_arc(self, start_angle: float):
         center = (int(self.x), int(self.y))
@@ -437,7 +615,8 @@ class RobotCore:
         cos = math.cos(self.radar_heading)
         end = (int(center[0] + rules.RADAR_RANGE * sin), int(center[1] + rules.RADAR_RANGE * cos))
 
-        self.scan_arc = geometry.Polygon([center, start, end])
+        self.scan_arc = (center, start, end)
+        self.scan_sector = (self.x, self.y, start_angle, self.radar_heading, rules.RADAR_RANGE)
 
     def check_wall_collision(self):
         min_x, min_y = 0 + RobotCore.HALF_WIDTH, 0 + RobotCore.HALF_HEIGHT
@@ -500,15 +679,15 @@ class RobotCore:
             self.command.move = 0.0
 
             self.state = RobotState.HIT_WALL
-            self.update_polygon()
+            self.update_box()
 
-    def check_robot_collision(self, robots: Tuple['RobotCore']):
+    def check_robot_collision(self, robots: Tuple['RobotCore'], candidates: Union[List['RobotCore'], None] = None):
         self.in_collision = False
-        for robot in robots:
+        for robot in candidates if candidates is not None else robots:
             if robot is self or robot.dead:
                 continue
-            elif self.polygon.intersects(robot.polygon):
-                angle = math.atan2(robot.x - self.x, robot.y - self.y)
+            elif geometry.boxes_intersect(self.box, robot.box):
+                angle, _ = get_angle_distance(self, robot)
                 bearing = normalization.normalize_angle(angle - self.heading, relative=True)
 
                 collision = (self.velocity > 0 and -math.radians(90) < bearing < math.radians(90)) \
@@ -520,9 +699,11 @@ class RobotCore:
                     #: Imagine if it hits more than one robot.
                     self.x -= self.velocity * math.sin(self.heading)
                     self.y -= self.velocity * math.cos(self.heading)
-                    #: TODO shouldn't update the polygon box here?
+                    #: TODO shouldn't update the box here?
                     #: Imagine if it hits another robot on the next loop iteration.
 
+                    self.robot_statistics.ram_damage += min(rules.ROBOT_HIT_DAMAGE, robot.energy)
+
                     self.update_energy(-rules.ROBOT_HIT_DAMAGE, True, robots)
                     robot.update_energy(-rules.ROBOT_HIT_DAMAGE, True, robots)
 
@@ -540,12 +721,13 @@ class RobotCore:
                     robot.add_event(EventKind.HitRobot, (self.name, self.energy, robot_bearing, False))
         if self.in_collision:
             self.state = RobotState.HIT_ROBOT
-            self.update_polygon()
+            self.update_box()
 
     def kill(self, robots: Tuple['RobotCore']):
         assert not self.dead
 
         self.state = RobotState.DEAD
+        self.robot_statistics.turns = self.statistics.time
 
         #: Add Death event to the process queue.
         self.add_event(EventKind.Death, ())
@@ -554,12 +736,13 @@ class RobotCore:
         for robot in robots:
             if robot is self or robot.dead:
                 continue
+            robot.robot_statistics.survival += 1
             robot.add_event(EventKind.RobotDeath, (self.name,))
 
     def paint(self, screen: np.ndarray) -> np.ndarray:
         center = (int(self.x), int(self.y))
 
-        min_x, min_y, max_x, max_y = self.polygon.bounds
+        min_x, min_y, max_x, max_y = self.box
         start, end = (int(min_x), int(min_y)), (int(max_x), int(max_y))
         screen = cv2.rectangle(screen, start, end, (0, 0, 255), 2)
 
@@ -579,10 +762,11 @@ class RobotCore:
         screen = cv2.line(screen, center, front, (255, 0, 0), 2)
 
         #: cv2.fillConvexPoly requires points in int32.
-        points = np.asarray(list(self.scan_arc.exterior.coords)[:3], "int32")
+        points = np.asarray(self.scan_arc, "int32")
         cv2.fillConvexPoly(screen, points, (255, 196, 191))
 
         return screen
 
     def add_event(self, kind: EventKind, args: tuple):
-        self.events.append(EventCore(self.statistics.time, kind, args))
+        if kind in self.subscriptions:
+            self.events.append(EventCore(self.statistics.time, kind, args))
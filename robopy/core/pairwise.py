@@ -0,0 +1,47 @@
+import math
+from typing import Any, Dict, List, Set, Tuple
+
+import numpy as np
+
+
+def get_angle_distance(a: Any, b: Any) -> Tuple[float, float]:
+    #: The absolute angle (clockwise from the y axis) and distance from robot a to robot b
+    #: (or any objects with coordinates).
+    dx, dy = b.x - a.x, b.y - a.y
+    return math.atan2(dx, dy), math.sqrt(dx * dx + dy * dy)
+
+
+class PairwiseMatrix:
+    #: Angles and distances between the pairs of robots a tick phase needs (e.g. each scanner and the robots
+    #: within its scan sector), computed at once when updated, so they're shared by its consumers
+    #: without computing every pair of robots. Robots that may have moved since the last update
+    #: are invalidated, thus the pairs involving them (and the pairs not computed) are computed on demand instead.
+
+    def __init__(self):
+        self.pairs: Dict[Tuple[Any, Any], Tuple[float, float]] = {}
+        self.moved: Set[Any] = set()
+
+    def invalidate(self, robots: Tuple[Any]):
+        self.moved.update(robots)
+
+    def update(self, pairs: Dict[Any, List[Any]]):
+        #: The pairs are given as the robots each robot needs (e.g. the targets of each scanner).
+        sources = [a for a, robots in pairs.items() for _ in robots]
+        targets = [b for robots in pairs.values() for b in robots]
+        self.pairs = {}
+        self.moved.clear()
+        if len(sources) == 0:
+            return
+
+        a = np.array([(robot.x, robot.y) for robot in sources], dtype=float)
+        b = np.array([(robot.x, robot.y) for robot in targets], dtype=float)
+        dx, dy = b[:, 0] - a[:, 0], b[:, 1] - a[:, 1]
+        self.pairs = dict(zip(
+            zip(sources, targets), zip(np.arctan2(dx, dy).tolist(), np.sqrt(dx * dx + dy * dy).tolist())
+        ))
+
+    def get(self, a: Any, b: Any) -> Tuple[float, float]:
+        pair = self.pairs.get((a, b)) if a not in self.moved and b not in self.moved else None
+        if pair is None:
+            return get_angle_distance(a, b)
+        return pair
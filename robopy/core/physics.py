@@ -0,0 +1,648 @@
+import math
+import random
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+import robopy.core.rules as rules
+from robopy.core import geometry
+from robopy.core.execution import Statistics, Command, BulletState, RobotState
+from robopy.core.objects import BattlefieldCore, BulletCore, RobotCore
+from robopy.core.spatial import SpatialGrid, SweepAndPrune
+from robopy.utils.threading import TurnBarrier
+
+
+#: Columns of the robot state array.
+#: Boolean fields are stored as 0.0 or 1.0.
+FIELDS: Tuple[str, ...] = (
+    #: Kinematic state.
+    "x",
+    "y",
+    "heading",
+    "gun_heading",
+    "radar_heading",
+    "energy",
+    "gun_heat",
+    "velocity",
+    "in_collision",
+    "over_driving",
+    #: Pending command.
+    "move",
+    "turn",
+    "turn_gun",
+    "turn_radar",
+    "fire",
+    "scan",
+    "max_velocity",
+    "max_turn_rate",
+    "lock_gun_body",
+    "lock_radar_gun",
+    "lock_radar_body",
+)
+
+X, Y, HEADING, GUN_HEADING, RADAR_HEADING, ENERGY, GUN_HEAT, VELOCITY, IN_COLLISION, OVER_DRIVING, \
+    MOVE, TURN, TURN_GUN, TURN_RADAR, FIRE, SCAN, MAX_VELOCITY, MAX_TURN_RATE, \
+    LOCK_GUN_BODY, LOCK_RADAR_GUN, LOCK_RADAR_BODY = range(len(FIELDS))
+
+COMMAND_FIELDS: Tuple[str, ...] = FIELDS[MOVE:]
+#: The command columns follow the order of the command snapshots (but the wait condition).
+assert COMMAND_FIELDS == Command.FIELDS[:-1]
+BOOL_FIELDS: Tuple[str, ...] = ("in_collision", "over_driving", "scan", "lock_gun_body", "lock_radar_gun", "lock_radar_body")
+
+#: Columns of the bullet state array.
+#: The bullet line goes from the last coordinates to the line end, which are the coordinates
+#: after its last move (even if a bullet collision moves the bullet afterwards, as BulletCore.line).
+BULLET_FIELDS: Tuple[str, ...] = (
+    "x", "y", "last_x", "last_y", "end_x", "end_y", "heading", "power", "velocity", "state", "owner"
+)
+
+BULLET_X, BULLET_Y, BULLET_LAST_X, BULLET_LAST_Y, BULLET_END_X, BULLET_END_Y, BULLET_HEADING, BULLET_POWER, \
+    BULLET_VELOCITY, BULLET_STATE, BULLET_OWNER = range(len(BULLET_FIELDS))
+
+#: Bullet states as stored in the bullet state array.
+FIRED, MOVING, INACTIVE = float(BulletState.FIRED), float(BulletState.MOVING), float(BulletState.INACTIVE)
+HIT_WALL, HIT_VICTIM, HIT_BULLET = \
+    float(BulletState.HIT_WALL), float(BulletState.HIT_VICTIM), float(BulletState.HIT_BULLET)
+
+FULL_ANGLE: float = math.radians(360)
+
+#: Robots end a turn within the box spanning their last and their new box, but for the adjustments of
+#: wall and robot collisions (which move them back less than their velocity), and the truncation of boxes.
+BOX_MARGIN: float = rules.MAX_VELOCITY + 2
+
+
+def _float_field(column: int) -> property:
+    def fget(self) -> float:
+        return float(self.physics.state[self.index, column])
+
+    def fset(self, value: float):
+        self.physics.state[self.index, column] = value
+
+    return property(fget, fset)
+
+
+def _bool_field(column: int) -> property:
+    def fget(self) -> bool:
+        return bool(self.physics.state[self.index, column])
+
+    def fset(self, value: bool):
+        self.physics.state[self.index, column] = value
+
+    return property(fget, fset)
+
+
+def _bullet_field(column: int) -> property:
+    def fget(self) -> float:
+        if self.store is None:
+            return float(self.detached[column])
+        return float(self.store.state[self.slot, column])
+
+    def fset(self, value: float):
+        if self.store is None:
+            self.detached[column] = value
+        else:
+            self.store.state[self.slot, column] = value
+
+    return property(fget, fset)
+
+
+def get_max_deceleration(velocity: np.ndarray) -> np.ndarray:
+    deceleration_time = velocity / rules.DECELERATION
+    acceleration_time = 1 - deceleration_time
+    return np.minimum(1.0, deceleration_time) * rules.DECELERATION + np.maximum(0.0, acceleration_time) * rules.ACCELERATION
+
+
+def get_max_velocity(distance: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore", over="ignore"):
+        deceleration_time = np.maximum(1, np.ceil((np.sqrt((4 * 2 / rules.DECELERATION) * distance + 1) - 1) / 2))
+        deceleration_distance = (deceleration_time / 2) * (deceleration_time - 1) * rules.DECELERATION
+        max_velocity = ((deceleration_time - 1) * rules.DECELERATION) + ((distance - deceleration_distance) / deceleration_time)
+    return np.where(np.isinf(deceleration_time), rules.MAX_VELOCITY, max_velocity)
+
+
+def get_velocity(velocity: np.ndarray, distance: np.ndarray, max_velocity: np.ndarray) -> np.ndarray:
+    #: Vectorized version of rules.get_velocity.
+    negative = distance < 0
+    velocity = np.where(negative, -velocity, velocity)
+    distance = np.abs(distance)
+
+    goal_velocity = np.where(np.isinf(distance), max_velocity, np.minimum(max_velocity, get_max_velocity(distance)))
+
+    result = np.where(
+        velocity >= 0,
+        np.maximum(velocity - rules.DECELERATION, np.minimum(goal_velocity, velocity + rules.ACCELERATION)),
+        np.maximum(velocity - rules.ACCELERATION, np.minimum(goal_velocity, velocity + get_max_deceleration(-velocity)))
+    )
+    return np.where(negative, -result, result)
+
+
+def get_distance_until_stop(velocity: np.ndarray, max_velocity: np.ndarray) -> np.ndarray:
+    #: Vectorized version of rules.get_distance_until_stop.
+    #: Without distance left, the goal velocity is 0 whatever the max velocity,
+    #: thus rules.get_velocity always decelerates (as much as possible).
+    distance, velocity = np.zeros_like(velocity), np.abs(velocity)
+    while np.any(velocity > 0):
+        velocity = np.maximum(velocity - rules.DECELERATION, 0.0)
+        distance += velocity
+    return distance
+
+
+class CommandView(Command):
+    move: float = _float_field(MOVE)
+    turn: float = _float_field(TURN)
+    turn_gun: float = _float_field(TURN_GUN)
+    turn_radar: float = _float_field(TURN_RADAR)
+    fire: float = _float_field(FIRE)
+    scan: bool = _bool_field(SCAN)
+
+    max_velocity: float = _float_field(MAX_VELOCITY)
+    max_turn_rate: float = _float_field(MAX_TURN_RATE)
+
+    lock_gun_body: bool = _bool_field(LOCK_GUN_BODY)
+    lock_radar_gun: bool = _bool_field(LOCK_RADAR_GUN)
+    lock_radar_body: bool = _bool_field(LOCK_RADAR_BODY)
+
+    __slots__ = ("physics", "index")
+
+    def __init__(self, physics: 'PhysicsEngine', index: int):
+        #: The fields are stored by the physics engine,
+        #: thus Command.__init__ must not be called.
+        self.physics: PhysicsEngine = physics
+        self.index: int = index
+
+        self.wait = None
+
+    def snapshot(self) -> tuple:
+        values = self.physics.state[self.index, MOVE:].tolist()
+        return tuple(bool(value) if name in BOOL_FIELDS else value for name, value in zip(COMMAND_FIELDS, values)) \
+            + (self.wait,)
+
+    def restore(self, snapshot: tuple):
+        self.physics.state[self.index, MOVE:] = snapshot[:-1]
+        self.wait = snapshot[-1]
+
+
+class RobotView(RobotCore):
+    x: float = _float_field(X)
+    y: float = _float_field(Y)
+
+    heading: float = _float_field(HEADING)
+    gun_heading: float = _float_field(GUN_HEADING)
+    radar_heading: float = _float_field(RADAR_HEADING)
+
+    energy: float = _float_field(ENERGY)
+    gun_heat: float = _float_field(GUN_HEAT)
+    velocity: float = _float_field(VELOCITY)
+
+    in_collision: bool = _bool_field(IN_COLLISION)
+    over_driving: bool = _bool_field(OVER_DRIVING)
+
+    __slots__ = ("physics", "index", "__command")
+
+    def __init__(self, physics: 'PhysicsEngine', name: str, statistics: Statistics, battlefield: BattlefieldCore,
+                 robots: Tuple[RobotCore], barrier: Union[TurnBarrier, None] = None,
+                 rng: Union[random.Random, None] = None):
+        #: The state must be allocated before RobotCore.__init__ assigns it.
+        self.physics: PhysicsEngine = physics
+        self.index: int = physics.allocate(self)
+        self.__command: CommandView = CommandView(physics, self.index)
+
+        super().__init__(name, statistics, battlefield, robots, barrier, rng)
+
+    @property
+    def command(self) -> CommandView:
+        return self.__command
+
+    @command.setter
+    def command(self, command: Command):
+        self.__command.restore(command.snapshot())
+
+
+class BulletView(BulletCore):
+    x: float = _bullet_field(BULLET_X)
+    y: float = _bullet_field(BULLET_Y)
+
+    heading: float = _bullet_field(BULLET_HEADING)
+    power: float = _bullet_field(BULLET_POWER)
+
+    __slots__ = ("store", "slot", "detached")
+
+    def __init__(self, store: 'BulletStore', slot: int):
+        #: The fields are stored by the bullet store,
+        #: thus BulletCore.__init__ must not be called.
+        self.store: Union[BulletStore, None] = store
+        self.slot: int = slot
+        self.detached: Union[np.ndarray, None] = None
+
+        self.battlefield: BattlefieldCore = store.battlefield
+        self.owner: RobotCore = store.robots[int(store.state[slot, BULLET_OWNER])]
+        self.victim: Union[RobotCore, None] = None
+
+    @property
+    def state(self):  #: TODO how to typify enum?
+        if self.store is None:
+            return BulletState(int(self.detached[BULLET_STATE]))
+        return BulletState(int(self.store.state[self.slot, BULLET_STATE]))
+
+    @state.setter
+    def state(self, state):  #: TODO how to typify enum?
+        if self.store is None:
+            self.detached[BULLET_STATE] = state
+        else:
+            self.store.state[self.slot, BULLET_STATE] = state
+
+    @property
+    def line(self) -> geometry.Segment:
+        values = self.store.state[self.slot] if self.store is not None else self.detached
+        return tuple(values[[BULLET_LAST_X, BULLET_LAST_Y, BULLET_END_X, BULLET_END_Y]].tolist())
+
+    def detach(self):
+        #: Keeps a copy of the fields, so the view outlives its slot
+        #: (e.g. while it's referenced by unprocessed events).
+        self.detached = self.store.state[self.slot].copy()
+        self.store = None
+
+
+class BulletStore:
+    def __init__(self, battlefield: BattlefieldCore, robots: List[RobotView], capacity: int = 64,
+                 rng: Union[random.Random, None] = None):
+        self.battlefield: BattlefieldCore = battlefield
+        self.robots: List[RobotView] = robots
+        #: Draws the order of the bullets (and of the queried items).
+        self.random: random.Random = rng if rng is not None else random.Random()
+
+        #: Column-major, so each field is a contiguous array.
+        #: Only the first size rows hold bullets.
+        self.state: np.ndarray = np.zeros((capacity, len(BULLET_FIELDS)), order="F")
+        self.size: int = 0
+
+        #: Views are built only when required (e.g. by events).
+        self.views: Dict[int, BulletView] = {}
+
+        #: Indexes of robots and bullet slots (rebuilt every turn), so each bullet
+        #: is only checked for collisions against the robots and bullets near it.
+        self.robot_grid: SpatialGrid = SpatialGrid(battlefield.width, battlefield.height, self.random)
+        self.slot_grid: SpatialGrid = SpatialGrid(battlefield.width, battlefield.height, self.random)
+
+    @property
+    def bullets(self) -> Tuple[BulletView]:
+        return tuple(self.view(slot) for slot in range(self.size))
+
+    def view(self, slot: int) -> BulletView:
+        assert slot < self.size
+
+        if slot not in self.views:
+            self.views[slot] = BulletView(self, slot)
+        return self.views[slot]
+
+    def add(self, x: float, y: float, heading: float, owner: RobotView, power: float):
+        if self.size == self.state.shape[0]:
+            state = np.zeros((2 * self.size, len(BULLET_FIELDS)), order="F")
+            state[:self.size] = self.state
+            self.state = state
+
+        self.state[self.size] = (
+            x, y, x, y, x, y, heading, power, rules.get_bullet_velocity(power), BulletState.FIRED, owner.index
+        )
+        self.size += 1
+
+    def update(self, robots: Tuple[RobotView]):
+        #: Performs the same steps of BulletCore.update for each bullet (in a random order),
+        #: but the coordinates and wall collisions of all bullets are computed at once, as well as
+        #: the robots each bullet may hit. Only robot and bullet collisions are resolved bullet by bullet.
+        if self.size == 0:
+            return
+
+        size, state = self.size, self.state
+        active = (state[:size, BULLET_STATE] == FIRED) | (state[:size, BULLET_STATE] == MOVING)
+
+        #: Update coordinates.
+        x = state[:size, BULLET_X] + state[:size, BULLET_VELOCITY] * np.sin(state[:size, BULLET_HEADING])
+        y = state[:size, BULLET_Y] + state[:size, BULLET_VELOCITY] * np.cos(state[:size, BULLET_HEADING])
+
+        #: Check for wall collisions.
+        min_x, min_y = 0 + BulletCore.RADIUS, 0 + BulletCore.RADIUS
+        max_x, max_y = self.battlefield.width - BulletCore.RADIUS, self.battlefield.height - BulletCore.RADIUS
+        hit_wall = ((x < min_x) | (x > max_x) | (y < min_y) | (y > max_y)).tolist()
+
+        #: Index robots and bullets (in their stable order, as the scalar engine does).
+        alive = [robot for robot in self.robots if not robot.dead]
+        self.robot_grid.clear()
+        for robot in alive:
+            self.robot_grid.insert(robot, *robot.center)
+        self.slot_grid.clear()
+        for slot, (last_x, last_y, end_x, end_y) in enumerate(
+                state[:size, [BULLET_LAST_X, BULLET_LAST_Y, BULLET_END_X, BULLET_END_Y]].tolist()):
+            self.slot_grid.insert(slot, (last_x + end_x) / 2, (last_y + end_y) / 2)
+
+        #: Robots don't move while bullets do, thus the bullets whose new line doesn't overlap any robot
+        #: (but their owner) aren't checked robot by robot. Their candidates are still queried though,
+        #: as it draws from the battle's generator.
+        near_robots = self.__near_robots(alive, state[:size, BULLET_X], state[:size, BULLET_Y], x, y).tolist()
+
+        order = list(range(size))
+        self.random.shuffle(order)
+
+        #: The loop reads and writes plain lists, while the state is written at once afterwards.
+        #: Only hits (which go through the views) need the state of their bullets up-to-date.
+        active, x, y = active.tolist(), x.tolist(), y.tolist()
+        states = state[:size, BULLET_STATE].tolist()
+        owners = state[:size, BULLET_OWNER].tolist()
+        lines = [tuple(line) for line in state[:size, [BULLET_LAST_X, BULLET_LAST_Y, BULLET_END_X, BULLET_END_Y]].tolist()]
+        moved = set()
+
+        def flush(slot: int):
+            if slot in moved:
+                moved.remove(slot)
+                state[slot, [BULLET_X, BULLET_Y, BULLET_LAST_X, BULLET_LAST_Y, BULLET_END_X, BULLET_END_Y]] = \
+                    (x[slot], y[slot]) + lines[slot]
+                state[slot, BULLET_STATE] = MOVING
+
+        for slot in order:
+            if active[slot] and states[slot] in (FIRED, MOVING):
+                #: Bullets can't be moved by previous bullets while they are active,
+                #: thus the precomputed coordinates are up-to-date.
+                line = lines[slot][2:] + (x[slot], y[slot])
+                lines[slot] = line
+                states[slot] = MOVING
+                moved.add(slot)
+
+                center = (line[0] + line[2]) / 2, (line[1] + line[3]) / 2
+                self.slot_grid.move(slot, *center)
+
+                if hit_wall[slot]:
+                    flush(slot)
+                    self.view(slot).hit_wall()
+                    states[slot] = HIT_WALL
+                    continue
+
+                owner = owners[slot]
+
+                #: Check for robot collisions.
+                hit = False
+                candidates = self.robot_grid.query(*center)
+                if near_robots[slot]:
+                    for robot in candidates:
+                        if robot.index == owner or robot.dead:
+                            continue
+                        elif geometry.segment_intersects_box(line, robot.box):
+                            flush(slot)
+                            self.view(slot).hit_robot(robot, robots)
+                            states[slot] = HIT_VICTIM
+                            hit = True
+                            break
+                if hit:
+                    continue
+
+                #: Check for bullet collisions.
+                #: The lines of the bullets that haven't moved yet are the lines of the last turn.
+                for other in self.slot_grid.query(*center):
+                    if other == slot or owners[other] == owner or states[other] not in (FIRED, MOVING):
+                        continue
+                    point = geometry.segment_intersection(line, lines[other])
+                    if point is not None:
+                        flush(slot)
+                        flush(other)
+                        self.view(slot).hit_bullet(self.view(other), point)
+                        states[slot] = states[other] = HIT_BULLET
+                        break
+            elif states[slot] != INACTIVE:
+                #: Exploded bullets.
+                state[slot, BULLET_STATE] = INACTIVE
+
+        if len(moved) > 0:
+            slots = sorted(moved)
+            state[slots, BULLET_X] = [x[slot] for slot in slots]
+            state[slots, BULLET_Y] = [y[slot] for slot in slots]
+            state[np.ix_(slots, [BULLET_LAST_X, BULLET_LAST_Y, BULLET_END_X, BULLET_END_Y])] = \
+                [lines[slot] for slot in slots]
+            state[slots, BULLET_STATE] = MOVING
+
+        self.clear()
+
+    def __near_robots(self, robots: List[RobotView], last_x: np.ndarray, last_y: np.ndarray,
+                      x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        #: Whether the bounding box of each bullet's new line overlaps the box of any robot but its owner
+        #: (as a segment can't intersect a box unless their bounding boxes overlap).
+        if len(robots) == 0:
+            return np.zeros(len(x), dtype=bool)
+        boxes = np.array([robot.box for robot in robots], dtype=float)
+        indexes = np.array([robot.index for robot in robots])
+
+        overlap = (np.minimum(last_x, x)[:, None] <= boxes[None, :, 2]) \
+            & (boxes[None, :, 0] <= np.maximum(last_x, x)[:, None]) \
+            & (np.minimum(last_y, y)[:, None] <= boxes[None, :, 3]) \
+            & (boxes[None, :, 1] <= np.maximum(last_y, y)[:, None])
+        overlap &= indexes[None, :] != self.state[:len(x), BULLET_OWNER][:, None]
+        return np.any(overlap, axis=1)
+
+    def clear(self):
+        #: Remove inactive bullets.
+        kept = self.state[:self.size, BULLET_STATE] != INACTIVE
+        if np.all(kept):
+            return
+
+        slots = np.cumsum(kept) - 1
+        views = {}
+        for slot, view in self.views.items():
+            if kept[slot]:
+                view.slot = int(slots[slot])
+                views[view.slot] = view
+            else:
+                view.detach()
+        self.views = views
+
+        size = int(np.count_nonzero(kept))
+        self.state[:size] = self.state[:self.size][kept]
+        self.size = size
+
+
+class PhysicsEngine:
+    def __init__(self, capacity: int, battlefield: BattlefieldCore, rng: Union[random.Random, None] = None):
+        #: Column-major, so each field is a contiguous array.
+        self.state: np.ndarray = np.zeros((capacity, len(FIELDS)), order="F")
+        self.robots: List[RobotView] = []
+
+        self.battlefield: BattlefieldCore = battlefield
+        self.bullet_store: BulletStore = BulletStore(battlefield, self.robots, rng=rng)
+
+    def allocate(self, robot: RobotView) -> int:
+        assert len(self.robots) < self.state.shape[0]
+
+        self.robots.append(robot)
+        return len(self.robots) - 1
+
+    def values(self, robots: Tuple[RobotView], field: str) -> np.ndarray:
+        return self.state[[robot.index for robot in robots], FIELDS.index(field)]
+
+    def update(self, robots: Tuple[RobotView], others: Tuple[RobotView], robot_sweep: Union[SweepAndPrune, None] = None):
+        #: Performs the same steps of RobotCore.fire and RobotCore.update for
+        #: each robot (in order), but the kinematic steps, boxes, wall checks and scan arcs
+        #: of all robots are computed at once. Only collisions are resolved robot by robot.
+        robots = tuple(robot for robot in robots if not robot.dead)
+        if len(robots) == 0:
+            return
+
+        last = self.state[[robot.index for robot in robots]]
+        state = last.copy()
+
+        #: Fire step.
+        power = np.minimum(np.minimum(rules.MAX_BULLET_POWER, state[:, ENERGY]), state[:, FIRE])
+        fired = (power >= rules.MIN_BULLET_POWER) & (state[:, GUN_HEAT] == 0)
+        if np.any(fired):
+            state[fired, ENERGY] = np.maximum(0, state[fired, ENERGY] - power[fired])
+            state[fired, GUN_HEAT] = [rules.get_gun_heat(p) for p in power[fired].tolist()]
+            drained = fired & (state[:, ENERGY] == 0)
+            state[drained, MOVE] = 0.0
+            state[drained, TURN] = 0.0
+        state[:, FIRE] = 0.0
+
+        disabled = state[:, ENERGY] == 0
+
+        #: Update the gun heat.
+        state[:, GUN_HEAT] = np.maximum(0.0, state[:, GUN_HEAT] - rules.GUN_COOLING_RATE)
+
+        #: Update the heading.
+        turning = ~disabled & (state[:, IN_COLLISION] == 0)
+        max_turn_rate = state[:, MAX_TURN_RATE] - np.radians(0.75 * np.abs(state[:, VELOCITY]))
+        angle = np.where(turning, np.minimum(max_turn_rate, np.maximum(-max_turn_rate, state[:, TURN])), 0.0)
+        state[:, HEADING] = np.where(turning, np.mod(state[:, HEADING] + angle, FULL_ANGLE), state[:, HEADING])
+        locked = turning & (state[:, LOCK_GUN_BODY] != 0)
+        state[:, GUN_HEADING] = np.where(locked, np.mod(state[:, GUN_HEADING] + angle, FULL_ANGLE), state[:, GUN_HEADING])
+        locked = turning & (state[:, LOCK_RADAR_BODY] != 0)
+        state[:, RADAR_HEADING] = np.where(locked, np.mod(state[:, RADAR_HEADING] + angle, FULL_ANGLE), state[:, RADAR_HEADING])
+        state[:, TURN] -= angle
+
+        #: Update the gun heading.
+        angle = np.minimum(rules.GUN_TURN_RATE, np.maximum(-rules.GUN_TURN_RATE, state[:, TURN_GUN]))
+        state[:, GUN_HEADING] = np.mod(state[:, GUN_HEADING] + angle, FULL_ANGLE)
+        locked = state[:, LOCK_RADAR_GUN] != 0
+        state[:, RADAR_HEADING] = np.where(locked, np.mod(state[:, RADAR_HEADING] + angle, FULL_ANGLE), state[:, RADAR_HEADING])
+        state[:, TURN_GUN] -= angle
+
+        #: Update the radar heading.
+        angle = np.minimum(rules.RADAR_TURN_RATE, np.maximum(-rules.RADAR_TURN_RATE, state[:, TURN_RADAR]))
+        state[:, RADAR_HEADING] = np.mod(state[:, RADAR_HEADING] + angle, FULL_ANGLE)
+        state[:, TURN_RADAR] -= angle
+
+        #: Update the velocity.
+        moving = ~disabled
+        velocity = np.where(moving, get_velocity(state[:, VELOCITY], state[:, MOVE], state[:, MAX_VELOCITY]), state[:, VELOCITY])
+        state[:, VELOCITY] = velocity
+
+        #: Update the coordinates.
+        stopped = moving & (velocity == 0) & (state[:, OVER_DRIVING] != 0)
+        state[stopped, MOVE] = 0.0
+        state[stopped, OVER_DRIVING] = 0.0
+        checked = moving & ~(state[:, MOVE] * velocity < 0)
+        over_driving = get_distance_until_stop(velocity, state[:, MAX_VELOCITY]) > np.abs(state[:, MOVE])
+        state[:, OVER_DRIVING] = np.where(checked, over_driving, state[:, OVER_DRIVING])
+        moved = moving & (velocity != 0)
+        state[:, X] = np.where(moved, state[:, X] + velocity * np.sin(state[:, HEADING]), state[:, X])
+        state[:, Y] = np.where(moved, state[:, Y] + velocity * np.cos(state[:, HEADING]), state[:, Y])
+        state[:, MOVE] = np.where(moving, state[:, MOVE] - velocity, state[:, MOVE])
+
+        #: The boxes and wall collisions of all robots (once moved) are computed at once too,
+        #: as each robot's only depend on its own state.
+        center_x, center_y = np.trunc(state[:, X]), np.trunc(state[:, Y])
+        boxes = np.stack((
+            center_x - RobotCore.HALF_WIDTH, center_y - RobotCore.HALF_HEIGHT,
+            center_x + RobotCore.HALF_WIDTH, center_y + RobotCore.HALF_HEIGHT
+        ), axis=1).astype(int).tolist()
+        min_x, min_y = 0 + RobotCore.HALF_WIDTH, 0 + RobotCore.HALF_HEIGHT
+        max_x, max_y = self.battlefield.width - RobotCore.HALF_WIDTH, self.battlefield.height - RobotCore.HALF_HEIGHT
+        hit_wall = (
+            (state[:, X] + 1e-10 < min_x) | (state[:, X] - 1e-10 > max_x)
+            | (state[:, Y] + 1e-10 < min_y) | (state[:, Y] - 1e-10 > max_y)
+        ).tolist()
+
+        #: Robots can only collide with the robots whose boxes may overlap theirs during the turn,
+        #: thus the rest of robots aren't checked one by one (but their candidates are still queried,
+        #: as it draws from the battle's generator).
+        isolated = self.__isolated(robots, np.array(boxes, dtype=float))
+        state[~disabled & isolated, IN_COLLISION] = 0.0
+        moved, disabled, isolated = (velocity != 0).tolist(), disabled.tolist(), isolated.tolist()
+
+        #: Robots whose precomputed step is performed.
+        performed = []
+        for k, robot in enumerate(robots):
+            #: Robots can die during this loop,
+            #: thus they can't execute any action.
+            if robot.dead:
+                continue
+
+            #: The energy of this robot was changed by a previous robot's collision,
+            #: thus its precomputed step is outdated and the scalar steps are used.
+            if self.state[robot.index, ENERGY] != last[k, ENERGY]:
+                bullet = robot.fire()
+                if bullet is not None:
+                    self.bullet_store.add(bullet.x, bullet.y, bullet.heading, robot, bullet.power)
+                robot.update(others, robot_sweep)
+                continue
+
+            if fired[k]:
+                self.bullet_store.add(last[k, X], last[k, Y], last[k, GUN_HEADING], robot, power[k])
+
+            self.state[robot.index] = state[k]
+            robot.state = RobotState.ACTIVE
+            performed.append(k)
+
+            if not disabled[k]:
+                if moved[k]:
+                    robot.box = tuple(boxes[k])
+
+                #: Check for wall collisions.
+                if hit_wall[k]:
+                    robot.check_wall_collision()
+
+                #: Check for robot collisions.
+                candidates = robot_sweep.query(robot.box[0], robot.box[2]) if robot_sweep is not None else None
+                if not isolated[k]:
+                    robot.check_robot_collision(others, candidates)
+
+                if robot_sweep is not None:
+                    robot_sweep.move(robot, robot.box[0], robot.box[2])
+
+        if len(performed) > 0:
+            self.__update_scan_arcs([robots[k] for k in performed], last[performed])
+
+    def __isolated(self, robots: Tuple[RobotView], boxes: np.ndarray) -> np.ndarray:
+        #: Whether each robot can't overlap any other alive robot, anywhere between their last and their new boxes.
+        spans = np.array([robot.box for robot in self.robots], dtype=float)
+        alive = np.array([not robot.dead for robot in self.robots])
+        indexes = [robot.index for robot in robots]
+        spans[indexes, :2] = np.minimum(spans[indexes, :2], boxes[:, :2]) - BOX_MARGIN
+        spans[indexes, 2:] = np.maximum(spans[indexes, 2:], boxes[:, 2:]) + BOX_MARGIN
+
+        overlap = (spans[:, None, 0] <= spans[None, :, 2]) & (spans[None, :, 0] <= spans[:, None, 2]) \
+            & (spans[:, None, 1] <= spans[None, :, 3]) & (spans[None, :, 1] <= spans[:, None, 3]) & alive[None, :]
+        np.fill_diagonal(overlap, False)
+        return ~np.any(overlap[indexes], axis=1)
+
+    def __update_scan_arcs(self, robots: List[RobotView], last: np.ndarray):
+        #: Same as RobotCore.update_scan_arc and the automatic scan of RobotCore.update, for all robots at once
+        #: (collisions only change the coordinates of the colliding robot, thus they're already resolved).
+        current = self.state[[robot.index for robot in robots]]
+
+        center_x, center_y = np.trunc(current[:, X]), np.trunc(current[:, Y])
+        start_x = np.trunc(center_x + rules.RADAR_RANGE * np.sin(last[:, RADAR_HEADING]))
+        start_y = np.trunc(center_y + rules.RADAR_RANGE * np.cos(last[:, RADAR_HEADING]))
+        end_x = np.trunc(center_x + rules.RADAR_RANGE * np.sin(current[:, RADAR_HEADING]))
+        end_y = np.trunc(center_y + rules.RADAR_RANGE * np.cos(current[:, RADAR_HEADING]))
+        arcs = np.stack((center_x, center_y, start_x, start_y, end_x, end_y), axis=1).astype(int).tolist()
+        sectors = np.stack(
+            (current[:, X], current[:, Y], last[:, RADAR_HEADING], current[:, RADAR_HEADING]), axis=1
+        ).tolist()
+        for robot, arc, sector in zip(robots, arcs, sectors):
+            robot.scan_arc = ((arc[0], arc[1]), (arc[2], arc[3]), (arc[4], arc[5]))
+            robot.scan_sector = (*sector, rules.RADAR_RANGE)
+
+        #: If the robot has executed any moving step,
+        #: then it executes a scan automatically.
+        columns = [HEADING, GUN_HEADING, RADAR_HEADING, X, Y]
+        scanning = np.any(current[:, columns] != last[:, columns], axis=1)
+        indexes = np.array([robot.index for robot in robots])
+        self.state[indexes[scanning], SCAN] = 1.0
+
+    def update_bullets(self, robots: Tuple[RobotView]):
+        self.bullet_store.update(robots)
@@ -0,0 +1,64 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from robopy.core.objects import RobotCore
+
+
+def _rays_intersect_boxes(x: np.ndarray, y: np.ndarray, dx: np.ndarray, dy: np.ndarray, length: np.ndarray,
+                          boxes: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]) -> np.ndarray:
+    #: Same test as geometry.ray_intersects_box, for each ray and box (broadcast).
+    t0, t1 = np.zeros((x.shape[0], boxes[0].shape[1])), np.broadcast_to(length, (x.shape[0], boxes[0].shape[1]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for origin, direction, low, high in ((x, dx, boxes[0], boxes[2]), (y, dy, boxes[1], boxes[3])):
+            a, b = (low - origin) / direction, (high - origin) / direction
+            parallel = direction == 0
+            outside = (origin < low) | (origin > high)
+            t0 = np.where(parallel, np.where(outside, np.inf, t0), np.maximum(t0, np.minimum(a, b)))
+            t1 = np.where(parallel, t1, np.minimum(t1, np.maximum(a, b)))
+    return t0 <= t1
+
+
+def scan(scanners: Tuple[RobotCore], robots: Tuple[RobotCore]) -> Dict[RobotCore, List[RobotCore]]:
+    #: Returns the robots within the scan sector of each scanner (in the given order),
+    #: testing every scanner against every robot at once, as geometry.sector_intersects_box does.
+    targets = tuple(robot for robot in robots if not robot.dead)
+    if len(scanners) == 0 or len(targets) == 0:
+        return {scanner: [] for scanner in scanners}
+
+    sectors = np.array([scanner.scan_sector for scanner in scanners])
+    x, y, start_angle, end_angle, radius = (sectors[:, k:k + 1] for k in range(5))
+    boxes = np.array([robot.box for robot in targets], dtype=float).T
+    boxes = tuple(boxes[k:k + 1] for k in range(4))
+
+    #: Range culling: the closest point of each box must be within the radius.
+    dx = np.minimum(np.maximum(x, boxes[0]), boxes[2]) - x
+    dy = np.minimum(np.maximum(y, boxes[1]), boxes[3]) - y
+    in_range = dx * dx + dy * dy <= radius * radius
+
+    #: Boxes whose closest point is within the angles of the sector (or is its apex).
+    sx, sy = np.sin(start_angle), np.cos(start_angle)
+    ex, ey = np.sin(end_angle), np.cos(end_angle)
+    cross = sx * ey - sy * ex
+    start_side = sx * dy - sy * dx
+    end_side = dx * ey - dy * ex
+    hit = (dx == 0) & (dy == 0)
+    hit |= (cross > 0) & (start_side >= 0) & (end_side >= 0)
+    hit |= (cross < 0) & (start_side <= 0) & (end_side <= 0)
+
+    #: Otherwise the closest point within the angles of the sector lies on one of its edges.
+    #: Only the boxes in range that aren't hit yet are tested.
+    rows, columns = np.nonzero(in_range & ~hit)
+    if len(rows) > 0:
+        edge_boxes = tuple(box[0, columns][:, None] for box in boxes)
+        for ux, uy in ((sx, sy), (ex, ey)):
+            edge_hit = _rays_intersect_boxes(
+                x[rows], y[rows], ux[rows], uy[rows], radius[rows], edge_boxes
+            )[:, 0]
+            hit[rows[edge_hit], columns[edge_hit]] = True
+    hit &= in_range
+
+    return {
+        scanner: [targets[column] for column in np.flatnonzero(hit[row]) if targets[column] is not scanner]
+        for row, scanner in enumerate(scanners)
+    }
@@ -23,6 +23,15 @@ RADAR_RANGE: int = 1200
 
 ROBOT_HIT_DAMAGE: float = 0.6
 
+#: CPU time (in seconds) a robot can take to compute each command, otherwise it skips the turn.
+MAX_TURN_CPU_TIME: float = 0.01
+
+#: Robots skipping this many turns in a row are disabled.
+MAX_SKIPPED_TURNS: int = 30
+
+#: Rounds of a match lasting this many turns end without winner (a draw).
+MAX_ROUND_TURNS: int = 10000
+
 
 def get_max_deceleration(velocity: float) -> float:
     deceleration_time = velocity / DECELERATION
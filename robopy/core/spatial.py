@@ -0,0 +1,149 @@
+import bisect
+import random
+from typing import Any, Dict, List, Tuple, Union
+
+
+class SpatialGrid:
+    #: Items are indexed by the cell of their center, thus any two items that
+    #: can overlap must have centers closer than a cell in each axis (i.e. the sum
+    #: of their half extents must not exceed the cell size). Then overlapping items
+    #: are always in the same or adjacent cells.
+    #: The largest sum is a robot (18) and the fastest bullet's line (10).
+    CELL_SIZE: int = 64
+
+    def __init__(self, width: int, height: int, rng: Union[random.Random, None] = None):
+        #: Draws the order of the queried items.
+        self.random: random.Random = rng if rng is not None else random.Random()
+
+        self.columns: int = width // SpatialGrid.CELL_SIZE + 1
+        self.rows: int = height // SpatialGrid.CELL_SIZE + 1
+
+        self.cells: List[List[Any]] = [[] for _ in range(self.columns * self.rows)]
+        self.items: Dict[Any, int] = {}
+
+        #: Cells in the neighborhood of each cell (including itself).
+        self.neighborhoods: List[Tuple[int, ...]] = [
+            tuple(
+                c * self.rows + r
+                for c in range(max(0, column - 1), min(self.columns, column + 2))
+                for r in range(max(0, row - 1), min(self.rows, row + 2))
+            )
+            for column in range(self.columns)
+            for row in range(self.rows)
+        ]
+
+    def cell(self, x: float, y: float) -> int:
+        #: Items out of the battlefield belong to the border cells.
+        column = min(self.columns - 1, max(0, int(x // SpatialGrid.CELL_SIZE)))
+        row = min(self.rows - 1, max(0, int(y // SpatialGrid.CELL_SIZE)))
+        return column * self.rows + row
+
+    def insert(self, item: Any, x: float, y: float):
+        assert item not in self.items
+
+        cell = self.cell(x, y)
+        self.cells[cell].append(item)
+        self.items[item] = cell
+
+    def move(self, item: Any, x: float, y: float):
+        cell = self.cell(x, y)
+        last_cell = self.items[item]
+        if cell != last_cell:
+            self.cells[last_cell].remove(item)
+            self.cells[cell].append(item)
+            self.items[item] = cell
+
+    def remove(self, item: Any):
+        self.cells[self.items.pop(item)].remove(item)
+
+    def clear(self):
+        for cell in set(self.items.values()):
+            self.cells[cell].clear()
+        self.items.clear()
+
+    def query(self, x: float, y: float) -> List[Any]:
+        #: Returns the items near the given point in a random order,
+        #: so the first item to collide isn't biased by the index.
+        items = []
+        for cell in self.neighborhoods[self.cell(x, y)]:
+            items.extend(self.cells[cell])
+        self.random.shuffle(items)
+        return items
+
+
+class SweepAndPrune:
+    #: Items are kept sorted by the start of their x-intervals, thus the items
+    #: whose x-intervals overlap a given one are found by bisection (sweeping
+    #: back by the widest interval). Items barely move between updates, so the
+    #: order is restored by swapping each moved item with its neighbors.
+
+    def __init__(self, width: float, rng: Union[random.Random, None] = None):
+        #: The widest x-interval of the items.
+        self.width: float = width
+        #: Draws the order of the queried items.
+        self.random: random.Random = rng if rng is not None else random.Random()
+
+        self.items: List[Any] = []
+        self.intervals: List[Tuple[float, float]] = []
+        self.starts: List[float] = []
+        self.indexes: Dict[Any, int] = {}
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.indexes
+
+    def __reindex(self, start: int):
+        for index in range(start, len(self.items)):
+            self.indexes[self.items[index]] = index
+
+    def __swap(self, a: int, b: int):
+        items, intervals, starts = self.items, self.intervals, self.starts
+        items[a], items[b] = items[b], items[a]
+        intervals[a], intervals[b] = intervals[b], intervals[a]
+        starts[a], starts[b] = starts[b], starts[a]
+        self.indexes[items[a]] = a
+        self.indexes[items[b]] = b
+
+    def insert(self, item: Any, min_x: float, max_x: float):
+        assert item not in self.indexes
+        assert max_x - min_x <= self.width
+
+        index = bisect.bisect_right(self.starts, min_x)
+        self.items.insert(index, item)
+        self.intervals.insert(index, (min_x, max_x))
+        self.starts.insert(index, min_x)
+        self.__reindex(index)
+
+    def move(self, item: Any, min_x: float, max_x: float):
+        assert max_x - min_x <= self.width
+
+        index = self.indexes[item]
+        if self.intervals[index] == (min_x, max_x):
+            return
+        self.intervals[index] = (min_x, max_x)
+        self.starts[index] = min_x
+
+        starts = self.starts
+        while index > 0 and starts[index - 1] > min_x:
+            self.__swap(index - 1, index)
+            index -= 1
+        while index < len(starts) - 1 and starts[index + 1] < min_x:
+            self.__swap(index, index + 1)
+            index += 1
+
+    def remove(self, item: Any):
+        index = self.indexes.pop(item)
+        del self.items[index]
+        del self.intervals[index]
+        del self.starts[index]
+        self.__reindex(index)
+
+    def query(self, min_x: float, max_x: float) -> List[Any]:
+        #: Returns the items whose x-intervals overlap the given one in a random order,
+        #: so the first item to collide isn't biased by the index.
+        start = bisect.bisect_left(self.starts, min_x - self.width)
+        end = bisect.bisect_right(self.starts, max_x)
+
+        intervals = self.intervals
+        items = [self.items[index] for index in range(start, end) if intervals[index][1] >= min_x]
+        self.random.shuffle(items)
+        return items
@@ -0,0 +1,89 @@
+import importlib
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Tuple, Type, Union
+
+import robopy.core.rules as rules
+from robopy.api.robot import Robot
+from robopy.core.execution import Scheduler
+from robopy.core.match import Match, RobotResults
+
+
+#: Robot classes already imported by the current (worker) process.
+_robot_classes: Dict[str, Type[Robot]] = {}
+
+
+def import_robot_class(path: str) -> Type[Robot]:
+    #: The path is the module path followed by the class name
+    #: (e.g. "robopy.sample.walls.Walls").
+    if path not in _robot_classes:
+        module_name, _, class_name = path.rpartition(".")
+        robot_class = getattr(importlib.import_module(module_name), class_name)
+        if not isinstance(robot_class, type) or not issubclass(robot_class, Robot):
+            raise TypeError(f"{path} is not a robot class")
+        _robot_classes[path] = robot_class
+    return _robot_classes[path]
+
+
+def _run_battle(task: tuple) -> Tuple[int, Dict[str, RobotResults]]:
+    index, battlefield_dimensions, robot_paths, scheduler, turn_time, cpu_time, seed, max_turns = task
+
+    robot_classes = [import_robot_class(path) for path in robot_paths]
+
+    match = Match(battlefield_dimensions, robot_classes, 1, scheduler, turn_time, cpu_time, seed, max_turns)
+    return index, match.run()
+
+
+class Tournament:
+    def __init__(self, battlefield_dimensions: Tuple[int, int], matchups: List[Tuple[str, ...]], rounds: int,
+                 workers: Union[int, None] = None, battles_per_worker: Union[int, None] = None,
+                 scheduler: Scheduler = Scheduler.BARRIER, turn_time: Union[float, None] = 0.1,
+                 cpu_time: Union[float, None] = rules.MAX_TURN_CPU_TIME, seed: Union[int, None] = None,
+                 max_turns: Union[int, None] = rules.MAX_ROUND_TURNS):
+        assert rounds > 0
+
+        self.battlefield_dimensions: Tuple[int, int] = battlefield_dimensions
+        self.matchups: List[Tuple[str, ...]] = [tuple(matchup) for matchup in matchups]
+        self.rounds: int = rounds
+
+        #: The amount of worker processes (defaults to the amount of cores),
+        #: and the amount of battles after which a worker is replaced by a new one
+        #: (defaults to never), so leaked robot threads and memory are reclaimed.
+        self.workers: Union[int, None] = workers
+        self.battles_per_worker: Union[int, None] = battles_per_worker
+
+        self.scheduler = scheduler  #: TODO how to typify enum?
+        self.turn_time: Union[float, None] = turn_time
+        self.cpu_time: Union[float, None] = cpu_time
+        #: Each battle is seeded by the following seed (if any), whichever worker runs it.
+        self.seed: Union[int, None] = seed
+        #: Battles lasting max_turns turns end as a draw.
+        self.max_turns: Union[int, None] = max_turns
+
+        self.results: Dict[Tuple[str, ...], Dict[str, RobotResults]] = {matchup: {} for matchup in self.matchups}
+
+        #: Fail early (on the main process) if any robot path can't be imported.
+        for matchup in self.matchups:
+            for path in matchup:
+                import_robot_class(path)
+
+    def run(self) -> Iterator[Tuple[Tuple[str, ...], Dict[str, RobotResults]]]:
+        #: Each battle (matchup × round) is an independent task.
+        #: Results are yielded as soon as each battle finishes.
+        tasks = [
+            (index, self.battlefield_dimensions, matchup, self.scheduler, self.turn_time, self.cpu_time, seed,
+             self.max_turns)
+            for index, matchup in enumerate(self.matchups)
+            for seed in (
+                range(self.seed + index * self.rounds, self.seed + (index + 1) * self.rounds)
+                if self.seed is not None else [None] * self.rounds
+            )
+        ]
+
+        with Pool(self.workers, maxtasksperchild=self.battles_per_worker) as pool:
+            for index, battle_results in pool.imap_unordered(_run_battle, tasks):
+                matchup = self.matchups[index]
+                for name, results in battle_results.items():
+                    if name not in self.results[matchup]:
+                        self.results[matchup][name] = RobotResults(name)
+                    self.results[matchup][name].merge(results)
+                yield matchup, battle_results
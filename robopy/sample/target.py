@@ -12,10 +12,8 @@ class Target(Robot):
         self.trigger: int = 80
 
     def _run(self):
-        #: Add a custom event named "trigger hit".
-        def condition() -> bool:
-            return self.energy <= self.trigger
-        self.add_custom_event("trigger hit", condition, execute=True)
+        #: Add a custom event named "trigger hit" (evaluated by the engine).
+        self.add_custom_event("trigger hit", f"energy <= {self.trigger}", execute=True)
         while True:
             self.execute()  #: Custom events are checked strictly during execution.
 
@@ -24,6 +22,7 @@ class Target(Robot):
             #: Our custom event "trigger hit" went off.
             #: Adjust the trigger value, or else the event will fire again and again and again...
             self.trigger -= 20
+            self.add_custom_event("trigger hit", f"energy <= {self.trigger}")
             print("Ouch, down to " + str(self.energy + 0.5) + " energy.")  #: TODO support robot print separately.
             #: Move around a bit.
             self.turn(-math.radians(65), execute=True)
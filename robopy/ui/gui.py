@@ -23,7 +23,8 @@ class GUI(Thread):
         screen = self.battle.battlefield.paint()
         for bullet in self.battle.bullets:
             screen = bullet.paint(screen)
-        for robot in self.battle.shuffled_robots:
+        #: The rendering order doesn't matter, thus the GUI doesn't draw (nor replace) the battle's orders.
+        for robot in self.battle.robots:
             if robot.dead:
                 continue
             screen = robot.paint(screen)
@@ -0,0 +1,52 @@
+import random
+from threading import get_ident
+from typing import Any, Dict, Iterator, List, Sequence, Union
+
+
+class PermutationView(Sequence):
+    #: Read-only view of the items in the order of the permutation (without copying them).
+
+    def __init__(self, items: Sequence, permutation: List[int]):
+        assert len(items) == len(permutation)
+
+        self.__items: Sequence = items
+        self.__permutation: List[int] = permutation
+
+    def __len__(self) -> int:
+        return len(self.__permutation)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self.__items[i] for i in self.__permutation[index])
+        return self.__items[self.__permutation[index]]
+
+    def __iter__(self) -> Iterator:
+        items = self.__items
+        for index in self.__permutation:
+            yield items[index]
+
+
+class Permutations:
+    #: A random permutation per key (e.g. each phase of a turn), drawn on its first use
+    #: and kept until reset, so every reader of the same key sees the same order.
+    #: A new permutation is drawn if the amount of items changes.
+
+    def __init__(self, rng: Union[random.Random, None] = None):
+        self.__permutations: Dict[Any, List[int]] = {}
+        self.__random: random.Random = rng if rng is not None else random.Random()
+        #: Thread reading the permutations (if set), as readers of other threads would draw new permutations
+        #: (advancing the generator) or replace the permutation of the current key.
+        self.owner: Union[int, None] = None
+
+    def view(self, key: Any, items: Sequence) -> PermutationView:
+        assert self.owner is None or self.owner == get_ident(), "permutations are read by their owner thread only"
+
+        permutation = self.__permutations.get(key)
+        if permutation is None or len(permutation) != len(items):
+            permutation = list(range(len(items)))
+            self.__random.shuffle(permutation)
+            self.__permutations[key] = permutation
+        return PermutationView(items, permutation)
+
+    def reset(self):
+        self.__permutations.clear()
@@ -1,4 +1,14 @@
-from threading import Semaphore
+import ctypes
+from threading import Condition, Semaphore, Thread
+from typing import Callable, Iterable, Iterator, List as TypingList, Tuple, Type, Union
+
+
+def interrupt(thread: Thread, exception: Type[BaseException]) -> bool:
+    #: Raises the exception asynchronously in the thread (once it runs Python code again, thus threads
+    #: blocked in a system call are interrupted only after it returns). Returns whether it was raised.
+    if thread.ident is None or not thread.is_alive():
+        return False
+    return ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread.ident), ctypes.py_object(exception)) == 1
 
 
 class List(list):
@@ -81,3 +91,90 @@ class List(list):
         self.__acquire()
         super().sort(key=key, reverse=reverse)
         self.__release()
+
+
+class Mailbox:
+    #: Double-buffered queue of a single writer and a single reader, without locks.
+    #: The writer appends to the back buffer, and the reader swaps it by a new one
+    #: (once per turn), then reads it. Both operations are atomic under the GIL,
+    #: but a write racing a swap may still land in the buffer swapped out,
+    #: thus the reader also takes the late items of that buffer on its next swap.
+
+    def __init__(self):
+        self.__back: list = []
+        self.__front: list = []
+        self.__read: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__front) - self.__read + len(self.__back)
+
+    def __iter__(self) -> Iterator:
+        #: Pending items (without taking them).
+        yield from self.__front[self.__read:]
+        yield from self.__back[:]
+
+    def append(self, item):
+        self.__back.append(item)
+
+    def swap(self) -> TypingList:
+        #: Takes the pending items (in the order they were appended).
+        back, self.__back = self.__back, []
+        items = self.__front[self.__read:]
+        read = len(back)
+        items.extend(back[:read])
+        self.__front, self.__read = back, read
+        return items
+
+
+class TurnBarrier:
+    def __init__(self):
+        self.__condition: Condition = Condition()
+        self.__arrived: set = set()
+        #: Parties that won't arrive anymore (e.g. their thread ended), thus they aren't waited for.
+        self.__departed: set = set()
+        #: Parties waited for that haven't arrived yet, so the waiter is only notified once the last one arrives.
+        self.__pending: set = set()
+
+    def arrive(self, party):
+        with self.__condition:
+            self.__arrived.add(party)
+            self.__settle(party)
+
+    def depart(self, party):
+        with self.__condition:
+            self.__departed.add(party)
+            self.__settle(party)
+
+    def __settle(self, party):
+        if party in self.__pending:
+            self.__pending.discard(party)
+            if len(self.__pending) == 0:
+                self.__condition.notify_all()
+
+    def wake(self):
+        #: Wakes up the waiter, so it checks whether it's interrupted.
+        with self.__condition:
+            self.__condition.notify_all()
+
+    def wait(self, parties: Tuple, timeout: Union[float, None] = None,
+             interrupted: Union[Callable[[], bool], None] = None) -> Tuple:
+        #: Block until every party has arrived (or departed), the timeout expires or it's interrupted
+        #: (checked when woken up), then return the parties that have arrived (in the given order).
+        with self.__condition:
+            self.__pending = {
+                party for party in parties if party not in self.__arrived and party not in self.__departed
+            }
+            self.__condition.wait_for(
+                lambda: len(self.__pending) == 0 or (interrupted is not None and interrupted()), timeout
+            )
+            self.__pending.clear()
+            return tuple(party for party in parties if party in self.__arrived)
+
+    def arrived(self, parties: Tuple) -> Tuple:
+        #: The parties that have arrived (in the given order), without waiting.
+        with self.__condition:
+            return tuple(party for party in parties if party in self.__arrived)
+
+    def reset(self, parties: Iterable):
+        with self.__condition:
+            self.__arrived.difference_update(parties)
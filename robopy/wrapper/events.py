@@ -1,79 +1,67 @@
-from typing import List
+import bisect
+import heapq
+from collections import deque
+from typing import Deque, Dict, List, Set, Tuple, Type
 
 from robopy.api.events import *  #: TODO name imports.
-from robopy.api.objects import Bullet
 from robopy.core.events import EventCore, EventKind
-from robopy.core.objects import BulletCore
-from robopy.utils.threading import List as ThreadingList
+from robopy.utils.threading import Mailbox
 from robopy.wrapper.execution import Statistics
 
 
-def wrapped_args(args_core: tuple) -> tuple:
-    args = []
-    for arg_core in args_core:
-        if isinstance(arg_core, BulletCore):
-            args.append(Bullet(arg_core))
-        else:
-            args.append(arg_core)
-    return tuple(args)
+#: Event built from each kind of core events.
+EVENT_CLASSES: Dict[EventKind, Type[Event]] = {kind: event_class for event_class, kind in EVENT_KINDS.items()}
 
 
 class EventManager:
     MAX_EVENT_STACK: int = 2
 
-    def __init__(self, statistics: Statistics, events: 'ThreadingList[EventCore]'):
+    def __init__(self, statistics: Statistics, events: Mailbox, subscriptions: Set[EventKind]):
         self.statistics: Statistics = statistics
-        self.events: ThreadingList[EventCore] = events
+        self.events: Mailbox = events
+        #: Events published before their kind was unsubscribed are dropped too.
+        self.subscriptions: Set[EventKind] = subscriptions
 
-        self.event_queue: List[EventCore] = []
+        #: Pending events are bucketed by time (in ascending order), each bucket being
+        #: a heap of (sort key, arrival, event), so events of the same kind keep their order.
+        self.event_times: Deque[int] = deque()
+        self.event_buckets: Dict[int, List[Tuple[int, int, EventCore]]] = {}
+        self.arrivals: int = 0
 
     @property
     def empty(self) -> bool:
-        return len(self.event_queue) == 0
+        return len(self.event_times) == 0
 
     def consume(self) -> Event:
-        event_core = self.event_queue.pop(0)
-        time, args = event_core.time, wrapped_args(event_core.args)
+        time = self.event_times[0]
+        bucket = self.event_buckets[time]
+        _, _, event_core = heapq.heappop(bucket)
+        if len(bucket) == 0:
+            self.event_times.popleft()
+            del self.event_buckets[time]
 
-        if event_core.kind is EventKind.BulletHit:
-            return BulletHitEvent(time, *args)
-        elif event_core.kind is EventKind.BulletHitBullet:
-            return BulletHitBulletEvent(time, *args)
-        elif event_core.kind is EventKind.BulletMissed:
-            return BulletMissedEvent(time, *args)
-        elif event_core.kind is EventKind.Death:
-            return DeathEvent(time, *args)
-        elif event_core.kind is EventKind.Custom:
-            return CustomEvent(time, *args)
-        elif event_core.kind is EventKind.HitByBullet:
-            return HitByBulletEvent(time, *args)
-        elif event_core.kind is EventKind.HitRobot:
-            return HitRobotEvent(time, *args)
-        elif event_core.kind is EventKind.HitWall:
-            return HitWallEvent(time, *args)
-        elif event_core.kind is EventKind.RobotDeath:
-            return RobotDeathEvent(time, *args)
-        elif event_core.kind is EventKind.ScannedRobot:
-            return ScannedRobotEvent(time, *args)
-        elif event_core.kind is EventKind.SkippedTurn:
-            return SkippedTurnEvent(time, *args)
-        elif event_core.kind is EventKind.Status:
-            return StatusEvent(time, *args)
-        elif event_core.kind is EventKind.Victory:
-            return VictoryEvent(time, *args)
-        else:
-            raise Exception("unknown event kind")
+        #: Bullets are wrapped by the events themselves (when read).
+        return EVENT_CLASSES[event_core.kind](event_core.time, *event_core.args)
 
     def process(self):
-        with self.events:
-            self.event_queue.extend(self.events)
-            self.events.clear()
+        for event in self.events.swap():
+            if event.kind not in self.subscriptions:
+                continue
+            bucket = self.event_buckets.get(event.time)
+            if bucket is None:
+                bucket = self.event_buckets[event.time] = []
+                if len(self.event_times) == 0 or self.event_times[-1] < event.time:
+                    self.event_times.append(event.time)
+                else:
+                    self.event_times.insert(bisect.bisect(self.event_times, event.time), event.time)
+            heapq.heappush(bucket, (event.sort_key, self.arrivals, event))
+            self.arrivals += 1
 
         #: Remove old events.
         self.clear()
 
-        self.event_queue.sort()
-
     def clear(self):
+        #: Old events are dropped by whole buckets.
         time = self.statistics.time
-        self.event_queue = [event for event in self.event_queue if time - event.time <= EventManager.MAX_EVENT_STACK]
+        while len(self.event_times) > 0 and time - self.event_times[0] > EventManager.MAX_EVENT_STACK:
+            del self.event_buckets[self.event_times.popleft()]
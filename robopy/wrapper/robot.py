@@ -1,9 +1,10 @@
-import copy
-from typing import Callable
+import random
+from typing import Any, Callable, Dict, List, Set, Union
 
 import robopy.core.rules as rules
 from robopy.api.objects import Battlefield
-from robopy.core.execution import Statistics, Command
+from robopy.core.events import EventKind
+from robopy.core.execution import RobotStatus, Step
 from robopy.core.objects import RobotCore
 from robopy.wrapper.events import EventManager
 from robopy.wrapper.execution import Statistics
@@ -13,12 +14,15 @@ class RobotWrapper:
     def __init__(self, core: RobotCore):
         self.__core: RobotCore = core
 
-        self.__command: Command = Command()
+        #: Fields of the command changed since the last execution.
+        self.__changes: Dict[str, Any] = {}
+        #: Plan of commands to be performed since the next execution.
+        self.__plan: Union[List[Step], None] = None
 
         self.battlefield: Battlefield = Battlefield(core.battlefield)
         self.statistics: Statistics = Statistics(core.statistics)
 
-        self.event_manager: EventManager = EventManager(self.statistics, core.events)
+        self.event_manager: EventManager = EventManager(self.statistics, core.events, core.subscriptions)
 
     @property
     def name(self) -> str:
@@ -61,73 +65,94 @@ class RobotWrapper:
         return self.__core.disabled
 
     @property
-    def status(self) -> dict:
+    def status(self) -> RobotStatus:
         return self.__core.status
 
-    def execute(self):
+    @property
+    def planning(self) -> bool:
+        return self.__core.planning
+
+    @property
+    def random(self) -> random.Random:
+        return self.__core.random
+
+    def execute(self, blocking: bool = True):
         #: Call the core execution.
-        self.__core.execute(self.__command)
+        changes, self.__changes = self.__changes, {}
+        plan, self.__plan = self.__plan, None
+        self.__core.execute(changes, blocking, plan)
 
-        self.__command = copy.deepcopy(self.__core.command)
+        #: Process new events (unless the command isn't processed yet).
+        if blocking:
+            self.event_manager.process()
 
-        #: Process new events.
-        self.event_manager.process()
+    def depart(self):
+        self.__core.depart()
 
     def move(self, distance: float):
         if distance == float("nan"):
             distance = 0.0
 
         if not self.__core.disabled:
-            self.__command.move = distance
+            self.__changes["move"] = distance
 
     def turn(self, radians: float):
         if radians == float("nan"):
             radians = 0.0
 
         if not self.__core.disabled:
-            self.__command.turn = radians
+            self.__changes["turn"] = radians
 
     def turn_gun(self, radians: float):
         if radians == float("nan"):
             radians = 0.0
 
-        self.__command.turn_gun = radians
+        self.__changes["turn_gun"] = radians
 
     def turn_radar(self, radians: float):
         if radians == float("nan"):
             radians = 0.0
 
-        self.__command.turn_radar = radians
+        self.__changes["turn_radar"] = radians
 
     def fire(self, power: float):
         if power == float("nan"):
             power = 0.0
 
-        self.__command.fire = power
+        self.__changes["fire"] = power
 
     def scan(self):
-        self.__command.scan = True
+        self.__changes["scan"] = True
 
     def set_max_velocity(self, velocity: float):
-        self.__command.max_velocity = min(abs(velocity), rules.MAX_VELOCITY)
+        self.__changes["max_velocity"] = min(abs(velocity), rules.MAX_VELOCITY)
 
     def set_max_turn_rate(self, turn_rate: float):
-        self.__command.max_turn_rate = min(abs(turn_rate), rules.MAX_TURN_RATE)
+        self.__changes["max_turn_rate"] = min(abs(turn_rate), rules.MAX_TURN_RATE)
 
     def lock_gun_body(self, locked: bool):
-        self.__command.lock_gun_body = locked
+        self.__changes["lock_gun_body"] = locked
 
     def lock_radar_gun(self, locked: bool):
-        self.__command.lock_radar_gun = locked
+        self.__changes["lock_radar_gun"] = locked
 
     def lock_radar_body(self, locked: bool):
-        self.__command.lock_radar_body = locked
+        self.__changes["lock_radar_body"] = locked
 
-    def wait(self, condition: Callable[[], bool]):
-        self.__command.wait = condition
+    def wait(self, condition: Union[Callable[[], bool], str]):
+        self.__changes["wait"] = condition
 
-    def add_custom_event(self, name: str, condition: Callable[[], bool]):
-        self.__core.custom_events[name] = condition
+    def perform(self, steps: List[Step]):
+        self.__plan = steps
+
+    def add_custom_event(self, name: str, condition: Union[str, Callable[[], bool]]):
+        self.__core.custom_events.add(name, condition)
 
     def remove_custom_event(self, name: str):
-        self.__core.custom_events.pop(name)
+        self.__core.custom_events.remove(name)
+
+    def subscribe(self, kinds: Set[EventKind]):
+        self.__core.subscriptions.update(kinds)
+
+    def unsubscribe(self, kinds: Set[EventKind]):
+        self.__core.subscriptions.difference_update(kinds)
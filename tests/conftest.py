@@ -0,0 +1,61 @@
+from typing import Callable, List, Tuple
+
+import pytest
+
+from robopy.api.robot import CooperativeRobot, Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import Scheduler
+from robopy.sample.crazy import Crazy
+from robopy.sample.fire import Fire
+from robopy.sample.ram_fire import RamFire
+from robopy.sample.spin_bot import SpinBot
+from robopy.sample.track_fire import TrackFire
+from robopy.sample.walls import Walls
+
+
+class Wanderer(Robot):
+    #: Draws its moves from its own generator, thus it's reproducible in seeded battles.
+    def _run(self):
+        while True:
+            self.turn_gun(self.random.uniform(-1, 1))
+            self.fire(self.random.choice([0.5, 1, 2]))
+            self.move(self.random.uniform(-200, 200), execute=True)
+
+
+class CooperativeWanderer(CooperativeRobot):
+    async def _run(self):
+        while True:
+            self.turn(self.random.uniform(-1, 1))
+            await self.move(self.random.uniform(-150, 150), execute=True)
+
+
+ROBOTS: Tuple[type, ...] = (Wanderer, CooperativeWanderer, TrackFire, Walls, Crazy, RamFire, SpinBot, Fire)
+
+
+class TracedBattle(Battle):
+    #: Records the state of every robot after each turn.
+    def _setup(self):
+        self.trace: List[list] = []
+        super()._setup()
+
+    def _logic(self, robots):
+        super()._logic(robots)
+        self.trace.append([
+            (
+                robot.name, robot.x, robot.y, robot.heading, robot.gun_heading, robot.radar_heading,
+                robot.energy, robot.velocity, robot.dead
+            )
+            for robot in self.robots
+        ])
+
+
+@pytest.fixture
+def trace() -> Callable[..., List[list]]:
+    #: Runs (on the current thread) a seeded battle of the SYNCHRONOUS scheduler and returns its trace.
+    def run(seed: int, vectorized: bool = False, turns: int = 500, robots: Tuple[type, ...] = ROBOTS) -> List[list]:
+        battle = TracedBattle(
+            (800, 600), list(robots), scheduler=Scheduler.SYNCHRONOUS, vectorized=vectorized, seed=seed, max_turns=turns
+        )
+        battle.run()
+        return battle.trace
+    return run
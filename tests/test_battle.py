@@ -0,0 +1,140 @@
+import threading
+import time
+
+import pytest
+
+from robopy.api.robot import CooperativeRobot, Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import BattleState, Scheduler
+from robopy.sample.spin_bot import SpinBot
+from robopy.sample.walls import Walls
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_seeded_battles_replay(trace, vectorized):
+    first, second = trace(7, vectorized), trace(7, vectorized)
+
+    assert len(first) > 100
+    assert first == second
+    assert trace(8, vectorized) != first
+
+
+class Once(Robot):
+    #: Its thread ends after its first command.
+    def _run(self):
+        self.execute()
+
+
+class Raising(Robot):
+    def _run(self):
+        self.execute()
+        raise RuntimeError("robot error")
+
+
+class Looping(Robot):
+    #: Never submits its second command.
+    def _run(self):
+        self.execute()
+        while True:
+            time.sleep(0.001)
+
+
+@pytest.mark.parametrize("robot_classes", [[Once, Once], [Raising, Walls]])
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_synchronous_battles_dont_wait_for_ended_robots(monkeypatch, robot_classes):
+    #: Robots whose thread ended skip their turns (until they're disabled) instead of stalling the battle.
+    monkeypatch.setattr(Battle, "STOP_TIME", 0.1)
+    monkeypatch.setattr(Battle, "FORCED_STOP_TIME", 0.1)
+    battle = Battle((800, 600), robot_classes, scheduler=Scheduler.SYNCHRONOUS, seed=1, max_turns=200)
+    #: A stalled battle must fail the test, not keep the process alive.
+    battle.daemon = True
+    battle.start()
+    battle.join(10)
+
+    assert not battle.is_alive()
+    assert battle.statistics.time > 1
+
+
+def test_stopping_a_synchronous_battle_wakes_it_up(monkeypatch):
+    monkeypatch.setattr(Battle, "STOP_TIME", 0.1)
+    monkeypatch.setattr(Battle, "FORCED_STOP_TIME", 0.1)
+    battle = Battle((800, 600), [Looping, Walls], scheduler=Scheduler.SYNCHRONOUS, seed=1)
+    battle.daemon = True
+    battle.start()
+    time.sleep(0.2)
+    assert battle.statistics.battle_state is BattleState.RUNNING
+
+    battle.stop()
+    battle.join(10)
+    assert not battle.is_alive()
+
+
+class Spinner(Robot):
+    #: Loops without executing anymore, thus it must be forced to stop.
+    def _run(self):
+        self.execute()
+        while True:
+            pass
+
+
+class Sleeper(Robot):
+    #: Blocked in a system call for longer than the battle waits for it to stop.
+    def _run(self):
+        self.execute()
+        time.sleep(1.0)
+
+
+class Generator(CooperativeRobot):
+    def _run(self):
+        while True:
+            yield from self.move(50, execute=True)
+            yield from self.turn(1.0, execute=True)
+
+
+def run_battle(robot_classes) -> Battle:
+    #: Runs a battle for a few turns, then stops it.
+    battle = Battle((800, 600), robot_classes, scheduler=Scheduler.BARRIER, turn_time=0.01)
+    battle.daemon = True
+    battle.start()
+    deadline = time.perf_counter() + 10
+    while battle.statistics.time < 20 and battle.statistics.battle_state is BattleState.RUNNING \
+            and time.perf_counter() < deadline:
+        time.sleep(0.001)
+    if battle.statistics.battle_state is not BattleState.STOPPED:
+        battle.stop()
+    battle.join(10)
+    assert not battle.is_alive()
+    return battle
+
+
+def test_teardown_stops_every_robot_thread(monkeypatch):
+    monkeypatch.setattr(Battle, "STOP_TIME", 0.05)
+    monkeypatch.setattr(Battle, "FORCED_STOP_TIME", 0.5)
+    threads = threading.active_count()
+
+    battle = run_battle([Spinner, Generator, Walls, SpinBot])
+
+    assert not any(thread.is_alive() for thread in battle.robot_threads.values())
+    assert not any(robot.robot_statistics.abandoned for robot in battle.robots)
+    assert threading.active_count() == threads
+
+
+def test_teardown_abandons_robots_that_dont_stop(monkeypatch):
+    monkeypatch.setattr(Battle, "STOP_TIME", 0.05)
+    monkeypatch.setattr(Battle, "FORCED_STOP_TIME", 0.05)
+
+    battle = run_battle([Sleeper, Walls, SpinBot])
+
+    for robot, thread in battle.robot_threads.items():
+        abandoned = isinstance(thread, Sleeper)
+        assert robot.robot_statistics.abandoned == abandoned
+        if abandoned:
+            assert robot.robot_statistics.survival == 0
+            assert robot.robot_statistics.bullet_damage == 0.0
+        else:
+            assert not thread.is_alive()
+
+    #: It's stopped once its system call returns.
+    for thread in battle.robot_threads.values():
+        thread.join(5)
+        assert not thread.is_alive()
@@ -0,0 +1,58 @@
+import time
+from typing import List
+
+import pytest
+
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import Command, Scheduler
+
+
+def test_commands_apply_changed_fields_only():
+    command = Command()
+    command.move, command.turn, command.fire = 100.0, 1.0, 2.0
+
+    command.apply({"turn": -0.5, "lock_gun_body": False})
+
+    assert (command.move, command.turn, command.fire, command.lock_gun_body) == (100.0, -0.5, 2.0, False)
+    assert command.lock_radar_gun
+
+
+class Idle(Robot):
+    #: Keeps the battle going.
+    def _run(self):
+        while True:
+            self.execute()
+
+
+class Mover(Robot):
+    #: Moves once, then only turns its radar, recording the distance remaining to move on every turn.
+    def __init__(self, wrapper):
+        super().__init__(wrapper)
+
+        self.remaining: List[float] = []
+
+    def _run(self):
+        self.move(1000)
+        while True:
+            self.execute()
+            self.remaining.append(self.status["action_status"]["move"])
+            self.turn_radar(0.1)
+            #: Slower than the turn time now and then, so some turns go by without its commands.
+            if len(self.remaining) % 5 == 0:
+                time.sleep(0.01)
+
+
+@pytest.mark.parametrize("scheduler", [Scheduler.SYNCHRONOUS, Scheduler.FIXED])
+def test_unchanged_fields_keep_the_engine_progress(scheduler):
+    battle = Battle((4000, 4000), [Mover, Idle], scheduler=scheduler, turn_time=0.005, seed=3, max_turns=60)
+    battle.daemon = True
+    battle.start()
+    battle.join(30)
+    assert not battle.is_alive()
+    robot = next(thread for thread in battle.robot_threads.values() if isinstance(thread, Mover))
+
+    #: Executions that don't move don't overwrite the distance the engine has moved the robot meanwhile.
+    assert len(robot.remaining) > 10
+    assert all(later < earlier for earlier, later in zip(robot.remaining, robot.remaining[1:]) if earlier > 0)
+    assert robot.remaining[-1] < 1000 - 8 * 10
@@ -0,0 +1,64 @@
+import sys
+import threading
+import time
+
+from robopy.core.conditions import MAX_STRIKES, TIME_BUDGET, CustomEvents
+
+
+def fast() -> bool:
+    #: Well within the budget, but long enough to be preempted while it's evaluated.
+    return sum(i for i in range(1000)) > 0
+
+
+def slow() -> bool:
+    deadline = time.thread_time() + 2 * TIME_BUDGET
+    while time.thread_time() < deadline:
+        pass
+    return False
+
+
+def test_fast_callables_are_kept_under_contention():
+    #: Another thread holding the GIL (for long, in C code) stalls the evaluation of the callables,
+    #: which must not count against them.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    stopped = threading.Event()
+
+    def contend():
+        while not stopped.is_set():
+            sum(range(100000))
+
+    contender = threading.Thread(target=contend, daemon=True)
+    contender.start()
+    custom_events = CustomEvents()
+    custom_events.add("fast", fast)
+    try:
+        for _ in range(1000):
+            met, dropped = custom_events.evaluate()
+            assert met == ["fast"] and dropped == []
+    finally:
+        stopped.set()
+        contender.join()
+        sys.setswitchinterval(interval)
+
+    assert "fast" in custom_events
+
+
+def test_only_overruns_in_a_row_drop_callables():
+    custom_events = CustomEvents()
+    overruns = iter([True] * (MAX_STRIKES - 1) + [False] + [True] * MAX_STRIKES)
+    custom_events.add("sometimes slow", lambda: slow() if next(overruns) else False)
+
+    for _ in range(2 * MAX_STRIKES - 1):
+        assert custom_events.evaluate() == ([], [])
+    assert custom_events.evaluate() == ([], ["sometimes slow"])
+    assert "sometimes slow" not in custom_events
+
+
+def test_failing_callables_are_dropped():
+    custom_events = CustomEvents()
+    custom_events.add("failing", lambda: 1 / 0)
+    custom_events.add("met", lambda: True)
+
+    assert custom_events.evaluate() == (["met"], ["failing"])
+    assert custom_events.evaluate() == (["met"], [])
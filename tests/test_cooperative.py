@@ -0,0 +1,115 @@
+from typing import List
+
+import pytest
+
+from robopy.api import events
+from robopy.api.robot import CooperativeRobot
+from robopy.core.battle import Battle
+from robopy.core.execution import BattleState, Scheduler
+
+
+class Recorder(CooperativeRobot):
+    #: Executes every turn, recording the turns its commands are processed on.
+    def __init__(self, wrapper):
+        super().__init__(wrapper)
+
+        self.turns: List[int] = []
+        self.closed: bool = False
+
+    def _run(self):
+        try:
+            self.add_custom_event("turn 20", lambda: self.statistics.time == 20)
+            while True:
+                yield from self.execute()
+                self.turns.append(self.statistics.time)
+        finally:
+            self.closed = True
+
+
+class ReturningHandler(Recorder):
+    def handle_custom(self, event: events.CustomEvent):
+        return self.wait(lambda: self.statistics.time >= 40)
+
+
+class GeneratorHandler(Recorder):
+    def handle_custom(self, event: events.CustomEvent):
+        yield from self.wait(lambda: self.statistics.time >= 40)
+
+
+class CoroutineHandler(Recorder):
+    async def handle_custom(self, event: events.CustomEvent):
+        await self.wait(lambda: self.statistics.time >= 40)
+
+
+class Coroutine(CooperativeRobot):
+    def __init__(self, wrapper):
+        super().__init__(wrapper)
+
+        self.turns: List[int] = []
+        self.closed: bool = False
+
+    async def _run(self):
+        try:
+            while True:
+                await self.execute()
+                self.turns.append(self.statistics.time)
+        finally:
+            self.closed = True
+
+
+class Raising(Recorder):
+    def _run(self):
+        while self.statistics.time < 10:
+            yield from self.execute()
+            self.turns.append(self.statistics.time)
+        raise RuntimeError("robot error")
+
+
+def run_battle(robot_classes, turns: int = 60) -> List[CooperativeRobot]:
+    #: Returns the robots in the order of their classes.
+    battle = Battle((2000, 2000), robot_classes, scheduler=Scheduler.SYNCHRONOUS, seed=3, max_turns=turns)
+    battle.daemon = True
+    battle.start()
+    battle.join(30)
+    assert not battle.is_alive()
+    assert battle.statistics.time == turns
+    robots = list(battle.robot_threads.values())
+    return [next(robot for robot in robots if type(robot) is robot_class) for robot_class in robot_classes]
+
+
+@pytest.mark.parametrize("robot_class", [ReturningHandler, GeneratorHandler, CoroutineHandler])
+def test_executions_of_handlers_are_performed(robot_class):
+    robot, _ = run_battle([robot_class, Recorder])
+
+    #: The custom event is handled within the execution processed on turn 20,
+    #: thus the robot is busy with its handler (and _run is resumed) until its wait is met.
+    assert robot.turns[:20] == list(range(1, 20)) + [40]
+    assert robot.turns[-1] == 60
+
+
+def test_errors_end_only_their_robot():
+    raising, other = run_battle([Raising, Coroutine])
+
+    assert raising.turns[-1] == 10
+    assert not raising.is_alive()
+    #: The battle doesn't wait for it anymore.
+    assert other.turns[-1] == 60
+
+
+def test_suspended_robots_are_closed_on_teardown():
+    #: Robots are suspended at their first execution, as robots that haven't been woken on the last turn.
+    battle = Battle((2000, 2000), [Recorder, Coroutine], scheduler=Scheduler.SYNCHRONOUS, seed=3)
+    battle.statistics.battle_state = BattleState.RUNNING
+    battle._setup()
+    robots = list(battle.robot_threads.values())
+    for robot in robots:
+        robot.start()
+        assert robot.is_alive()
+
+    battle.stop()
+    battle._teardown()
+
+    for robot in robots:
+        assert robot.closed
+        assert not robot.is_alive()
+        assert robot.turns == []
@@ -0,0 +1,76 @@
+import time
+from typing import List
+
+from robopy.api import events
+from robopy.api.robot import Robot
+from robopy.core import rules
+from robopy.core.battle import Battle
+from robopy.core.execution import Scheduler
+
+#: CPU time per command of the battles (robots exceeding it burn twice as much).
+CPU_TIME: float = 0.005
+
+
+class Idle(Robot):
+    #: Keeps the battle going.
+    def _run(self):
+        while True:
+            self.execute()
+
+
+class Slow(Robot):
+    #: Exceeds the CPU time on every command until it's disabled, then it never executes again.
+    def __init__(self, wrapper):
+        super().__init__(wrapper)
+
+        self.turns: List[int] = []
+        self.skipped: List[int] = []
+
+    def _run(self):
+        while not self.disabled:
+            deadline = time.thread_time() + 2 * CPU_TIME
+            while time.thread_time() < deadline:
+                pass
+            self.execute()
+            self.turns.append(self.statistics.time)
+
+        while True:
+            time.sleep(0.01)
+
+    def handle_skipped_turn(self, event: events.SkippedTurnEvent):
+        self.skipped.append(event.turn)
+
+
+def test_robots_exceeding_the_cpu_time_skip_turns(monkeypatch):
+    monkeypatch.setattr(Battle, "STOP_TIME", 0.05)
+    monkeypatch.setattr(Battle, "FORCED_STOP_TIME", 0.5)
+    turns = 2 * rules.MAX_SKIPPED_TURNS + 20
+    battle = Battle((2000, 2000), [Slow, Idle], scheduler=Scheduler.BARRIER, turn_time=1.0, cpu_time=CPU_TIME,
+                    seed=3, max_turns=turns)
+    battle.daemon = True
+
+    start = time.perf_counter()
+    battle.start()
+    battle.join(30)
+    assert not battle.is_alive()
+    elapsed = time.perf_counter() - start
+
+    robot = next(thread for thread in battle.robot_threads.values() if isinstance(thread, Slow))
+    core = next(core for core, thread in battle.robot_threads.items() if thread is robot)
+
+    #: Its first command isn't timed. Then each command skips a turn and it's processed on the next one
+    #: (the robot sees the time once it's ticked).
+    skipped = robot.skipped[:rules.MAX_SKIPPED_TURNS]
+    assert skipped == list(range(1, 2 * rules.MAX_SKIPPED_TURNS, 2))
+    assert robot.turns[:rules.MAX_SKIPPED_TURNS] == [1] + [turn + 2 for turn in skipped[:-1]]
+
+    #: Its commands don't end its streak of skipped turns, thus it's disabled on its last skipped turn.
+    assert core.energy == 0.0
+    assert not core.dead
+
+    #: Then it never executes again (its last command is processed on the next turn), and the battle
+    #: doesn't wait for it until the turn time anymore (while the robot's reads race with the battle).
+    disabled = skipped[-1] + 1
+    assert core.robot_statistics.skipped_turns == rules.MAX_SKIPPED_TURNS + turns - disabled - 1
+    assert battle.statistics.time == turns
+    assert elapsed < (turns - disabled) * 1.0 / 2
@@ -0,0 +1,138 @@
+import functools
+import math
+import random
+from typing import List
+
+from robopy.api import events
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.events import CRITICAL, PRIORITIES, EventCore, EventKind
+from robopy.core.execution import Scheduler
+from robopy.core.execution import Statistics as StatisticsCore
+from robopy.utils.threading import Mailbox
+from robopy.wrapper import events as wrapper_events
+from robopy.wrapper.events import EventManager
+from robopy.wrapper.execution import Statistics
+
+
+def old_less_than(a: EventCore, b: EventCore) -> bool:
+    #: The comparison the event queue used to be sorted by.
+    return (a.time, CRITICAL[b.kind], PRIORITIES[b.kind]) < (b.time, CRITICAL[a.kind], PRIORITIES[a.kind])
+
+
+OLD_SORT_KEY = functools.cmp_to_key(lambda a, b: -1 if old_less_than(a, b) else int(old_less_than(b, a)))
+
+
+def test_events_are_consumed_in_the_old_order(monkeypatch):
+    #: Events are built as their serial number, so they're identified when consumed.
+    for kind in EventKind:
+        monkeypatch.setitem(wrapper_events.EVENT_CLASSES, kind, lambda time, serial: serial)
+
+    rng = random.Random(0)
+    statistics = StatisticsCore(2)
+    mailbox = Mailbox()
+    manager = EventManager(Statistics(statistics), mailbox, set(EventKind))
+
+    #: Reference: a list extended and sorted (stable) on every process, then consumed from its head.
+    queue = []
+    serial = 0
+    consumed = 0
+    for turn in range(2000):
+        statistics.time = turn
+
+        published = []
+        for _ in range(rng.randint(0, 6)):
+            #: Events of past turns arrive late, some of them already too old to be kept.
+            event = EventCore(max(0, turn - rng.choice([0, 0, 0, 1, 2, 3])), rng.choice(list(EventKind)), (serial,))
+            serial += 1
+            published.append(event)
+            mailbox.append(event)
+
+        manager.process()
+        queue.extend(published)
+        queue = [event for event in queue if turn - event.time <= EventManager.MAX_EVENT_STACK]
+        queue.sort(key=OLD_SORT_KEY)
+
+        #: Robots don't always consume every pending event before the next process.
+        for _ in range(rng.randint(0, len(queue))):
+            assert not manager.empty
+            assert manager.consume() == queue.pop(0).args[0]
+            consumed += 1
+        assert manager.empty == (len(queue) == 0)
+
+    assert consumed > 1000
+
+
+def test_unsubscribed_events_are_dropped():
+    statistics = StatisticsCore(2)
+    mailbox = Mailbox()
+    subscriptions = {EventKind.HitWall, EventKind.Custom}
+    manager = EventManager(Statistics(statistics), mailbox, subscriptions)
+
+    mailbox.append(EventCore(0, EventKind.HitWall, (0.0,)))
+    mailbox.append(EventCore(0, EventKind.ScannedRobot, ("robot", 100.0, 0.0, 0.0, 0.0, 100.0)))
+    mailbox.append(EventCore(0, EventKind.Custom, ("custom",)))
+    #: Events published before their kind was unsubscribed are dropped as well.
+    subscriptions.discard(EventKind.Custom)
+    manager.process()
+
+    assert isinstance(manager.consume(), events.HitWallEvent)
+    assert manager.empty
+
+
+class Switcher(Robot):
+    #: Handles scanned robots from turn 20 to turn 40 only (its handler is set at runtime).
+    def __init__(self, wrapper):
+        super().__init__(wrapper)
+
+        self.scanned: List[int] = []
+
+    def record(self, event: events.ScannedRobotEvent):
+        self.scanned.append(event.time)
+
+    def _run(self):
+        while True:
+            if self.statistics.time == 20:
+                self.handle_scanned_robot = self.record
+                self.subscribe(events.ScannedRobotEvent)
+            elif self.statistics.time == 40:
+                self.unsubscribe(events.ScannedRobotEvent)
+            self.turn_radar(math.radians(45))
+            self.execute()
+
+
+class Idle(Robot):
+    #: Keeps the battle going.
+    def _run(self):
+        while True:
+            self.execute()
+
+
+class SubscriptionBattle(Battle):
+    #: Records the kinds of events published to the switcher on each turn.
+    def _setup(self):
+        super()._setup()
+        self.switcher = next(robot for robot, thread in self.robot_threads.items() if isinstance(thread, Switcher))
+        self.kinds: List[set] = []
+
+    def _logic(self, robots):
+        super()._logic(robots)
+        self.kinds.append({event.kind for event in self.switcher.events})
+
+
+def test_robots_subscribe_at_runtime():
+    battle = SubscriptionBattle((800, 600), [Switcher, Idle], scheduler=Scheduler.SYNCHRONOUS, seed=3, max_turns=60)
+    battle.daemon = True
+    battle.start()
+    battle.join(30)
+    assert not battle.is_alive()
+    robot = battle.robot_threads[battle.switcher]
+
+    #: Only the events of the overridden handlers are published (e.g. no Status event).
+    published = set().union(*battle.kinds)
+    assert EventKind.Status not in published
+    scanned = [turn for turn, kinds in enumerate(battle.kinds) if EventKind.ScannedRobot in kinds]
+    assert len(scanned) > 1
+    assert all(20 <= turn < 40 for turn in scanned)
+    assert len(robot.scanned) > 1
+    assert all(20 <= turn < 40 for turn in robot.scanned)
@@ -0,0 +1,126 @@
+import math
+import random
+
+import pytest
+
+from robopy.core import geometry, radar
+
+pytest.importorskip("shapely")
+
+#: Random cases checked against the reference implementations (backed by shapely).
+CASES: int = 20000
+
+
+def random_box(rng: random.Random) -> geometry.Box:
+    x, y = rng.randint(0, 100), rng.randint(0, 100)
+    return x, y, x + rng.randint(0, 30), y + rng.randint(0, 30)
+
+
+def random_segment(rng: random.Random, integer: bool) -> geometry.Segment:
+    #: Integer coordinates hit the boundaries (and degenerated cases) way more often.
+    coordinate = (lambda: rng.randint(0, 130)) if integer else (lambda: rng.uniform(-10, 140))
+    x, y = coordinate(), coordinate()
+    if rng.random() < 0.1:
+        return x, y, x, y
+    if rng.random() < 0.2:
+        return x, y, x, coordinate()
+    return x, y, coordinate(), coordinate()
+
+
+def on_segment(point, segment: geometry.Segment) -> bool:
+    (px, py), (ax, ay, bx, by) = point, segment
+    cross = (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+    return abs(cross) <= 1e-6 * max(1.0, math.hypot(bx - ax, by - ay)) \
+        and min(ax, bx) - 1e-6 <= px <= max(ax, bx) + 1e-6 and min(ay, by) - 1e-6 <= py <= max(ay, by) + 1e-6
+
+
+def test_boxes_intersect():
+    rng = random.Random(0)
+    for _ in range(CASES):
+        a, b = random_box(rng), random_box(rng)
+        assert geometry.boxes_intersect(a, b) == geometry.reference_boxes_intersect(a, b), (a, b)
+
+
+def test_segment_intersects_box():
+    rng = random.Random(1)
+    for i in range(CASES):
+        segment, box = random_segment(rng, i % 2 == 0), random_box(rng)
+        assert geometry.segment_intersects_box(segment, box) == \
+            geometry.reference_segment_intersects_box(segment, box), (segment, box)
+
+
+def test_segment_intersection():
+    rng = random.Random(2)
+    for i in range(CASES):
+        a, b = random_segment(rng, i % 2 == 0), random_segment(rng, i % 2 == 0)
+        if a[:2] == a[2:] or b[:2] == b[2:]:
+            continue
+
+        point, reference = geometry.segment_intersection(a, b), geometry.reference_segment_intersection(a, b)
+        assert (point is None) == (reference is None), (a, b)
+        #: Collinear segments overlap on many points, any of them is fine.
+        if point is not None and math.dist(point, reference) > 1e-6:
+            assert on_segment(point, a) and on_segment(point, b), (a, b, point)
+
+
+def test_triangle_intersects_box():
+    rng = random.Random(3)
+    for _ in range(CASES):
+        box = random_box(rng)
+        center = (rng.randint(0, 130), rng.randint(0, 130))
+        start = rng.uniform(0, 2 * math.pi)
+        end = start + rng.uniform(0, 0.8) * (rng.random() < 0.9)
+        triangle = (
+            center,
+            (int(center[0] + 1200 * math.sin(start)), int(center[1] + 1200 * math.cos(start))),
+            (int(center[0] + 1200 * math.sin(end)), int(center[1] + 1200 * math.cos(end)))
+        )
+        assert geometry.triangle_intersects_box(triangle, box) == \
+            geometry.reference_triangle_intersects_box(triangle, box), (triangle, box)
+
+
+def random_sector(rng: random.Random) -> geometry.Sector:
+    heading = rng.choice([rng.uniform(0, 2 * math.pi), rng.choice([0, math.pi / 2, math.pi, 3 * math.pi / 2])])
+    sweep = rng.choice([0, 0, rng.uniform(-1.3, 1.3), math.radians(45)])
+    return rng.uniform(0, 800), rng.uniform(0, 600), heading, (heading + sweep) % (2 * math.pi), rng.choice([1200, 300])
+
+
+def test_sector_intersects_box():
+    rng = random.Random(4)
+    for _ in range(CASES // 10):
+        sector = random_sector(rng)
+        x, y = rng.randint(-20, 800), rng.randint(-20, 600)
+        box = (x, y, x + 36, y + 36)
+
+        #: The reference approximates the arc by a polyline, thus boxes crossing the arc are skipped.
+        corners = [(box[0], box[1]), (box[0], box[3]), (box[2], box[1]), (box[2], box[3])]
+        distances = [math.hypot(cx - sector[0], cy - sector[1]) for cx, cy in corners]
+        if min(distances) - 36 <= sector[4] <= max(distances):
+            continue
+        assert geometry.sector_intersects_box(sector, box) == \
+            geometry.reference_sector_intersects_box(sector, box), (sector, box)
+
+
+class Target:
+    #: The fields of robots read by the radar.
+    dead = False
+
+    def __init__(self, box: geometry.Box, scan_sector: geometry.Sector = (0, 0, 0, 0, 0)):
+        self.box = box
+        self.scan_sector = scan_sector
+
+
+def test_radar_scan_matches_sector_test():
+    rng = random.Random(5)
+    for _ in range(20):
+        scanners = tuple(Target((0, 0, 0, 0), random_sector(rng)) for _ in range(20))
+        targets = []
+        for _ in range(40):
+            x, y = rng.randint(-20, 800), rng.randint(-20, 600)
+            targets.append(Target((x, y, x + 36, y + 36)))
+
+        scanned = radar.scan(scanners, tuple(targets))
+        for scanner in scanners:
+            assert scanned[scanner] == [
+                target for target in targets if geometry.sector_intersects_box(scanner.scan_sector, target.box)
+            ]
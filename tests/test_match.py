@@ -0,0 +1,58 @@
+from robopy.api.robot import Robot
+from robopy.core.execution import Scheduler
+from robopy.core.match import Match, RobotResults
+from robopy.sample.target import Target
+from robopy.sample.track_fire import TrackFire
+
+
+class Idle(Robot):
+    #: Never fires, thus rounds of idle robots last until the maximum amount of turns.
+    def _run(self):
+        while True:
+            self.execute()
+
+
+def test_wins_add_up_over_rounds():
+    match = Match((400, 400), [TrackFire, Target], rounds=3, scheduler=Scheduler.SYNCHRONOUS, seed=1, max_turns=1500)
+
+    wins = {"TrackFire": 0, "Target": 0}
+    turns = {"TrackFire": 0, "Target": 0}
+    for _ in range(match.rounds):
+        battle = match.run_round()
+        assert battle.statistics.alive_robots == 1
+        for robot in battle.robots:
+            wins[robot.name] += int(not robot.dead)
+            turns[robot.name] += robot.robot_statistics.turns
+
+    results = match.results
+    assert wins == {"TrackFire": 3, "Target": 0}
+    for name, robot_results in results.items():
+        assert robot_results.rounds == 3
+        assert robot_results.wins == wins[name]
+        assert robot_results.draws == 0
+        assert robot_results.turns == turns[name]
+
+
+def test_rounds_lasting_max_turns_are_draws():
+    match = Match((800, 600), [Idle, Idle], rounds=2, scheduler=Scheduler.SYNCHRONOUS, seed=1, max_turns=20)
+    results = match.run()
+
+    assert len(results) == 2
+    for robot_results in results.values():
+        assert robot_results.rounds == 2
+        assert robot_results.wins == 0
+        assert robot_results.draws == 2
+        assert robot_results.average_turns == 20
+
+
+def test_results_merge():
+    results, other = RobotResults("robot"), RobotResults("robot")
+    results.rounds, results.wins, results.draws, results.turns = 2, 1, 1, 300
+    other.rounds, other.wins, other.draws, other.turns = 3, 0, 2, 100
+    other.latency.record(0.001)
+
+    results.merge(other)
+
+    assert (results.rounds, results.wins, results.draws, results.turns) == (5, 1, 3, 400)
+    assert results.average_turns == 80
+    assert results.latency.count == 1
@@ -0,0 +1,62 @@
+import gc
+
+from robopy.api import events, objects
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.objects import BulletCore
+
+
+class Idle(Robot):
+    def _run(self):
+        while True:
+            self.execute()
+
+
+def setup_battle(vectorized: bool = False) -> Battle:
+    battle = Battle((800, 600), [Idle, Idle], vectorized=vectorized, seed=1)
+    battle._setup()
+    return battle
+
+
+def test_events_share_the_wrapper_of_each_bullet():
+    battle = setup_battle()
+    owner, other = battle.robots
+    bullet = BulletCore(battle.battlefield, 100, 100, 0.0, owner, 1.0)
+    hit_bullet = BulletCore(battle.battlefield, 100, 120, 3.0, other, 2.0)
+
+    hit = events.BulletHitBulletEvent(1, bullet, hit_bullet)
+    #: The event of the other robot refers to the same bullets (swapped).
+    other_hit = events.BulletHitBulletEvent(1, hit_bullet, bullet)
+    missed = events.BulletMissedEvent(2, bullet)
+
+    assert hit.bullet is hit.bullet
+    assert hit.bullet is other_hit.hit_bullet is missed.bullet
+    assert hit.hit_bullet is other_hit.bullet
+    assert hit.bullet is not hit.hit_bullet
+    assert objects.wrap_bullet(hit.bullet) is hit.bullet
+
+
+def test_bullet_views_share_their_wrapper():
+    battle = setup_battle(vectorized=True)
+    store = battle.physics.bullet_store
+    store.add(100, 100, 0.0, battle.robots[0], 1.0)
+    view = store.view(0)
+
+    wrapper = events.BulletMissedEvent(1, view).bullet
+    #: Views outlive their slots (detached), as they're still referenced by events.
+    view.detach()
+    assert events.BulletHitEvent(2, "robot", 100.0, view).bullet is wrapper
+    assert wrapper.x == 100 and wrapper.power == 1.0
+
+
+def test_wrappers_are_released_with_their_bullets():
+    battle = setup_battle()
+    bullet = BulletCore(battle.battlefield, 100, 100, 0.0, battle.robots[0], 1.0)
+    wrappers = len(objects._bullets)
+
+    wrapper = objects.wrap_bullet(bullet)
+    assert len(objects._bullets) == wrappers + 1
+
+    del wrapper
+    gc.collect()
+    assert len(objects._bullets) == wrappers
@@ -0,0 +1,24 @@
+import pytest
+
+from conftest import ROBOTS
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_engines_are_equivalent(trace, seed):
+    #: The scalar and the vectorized engines play the same seeded battle turn by turn.
+    scalar, vectorized = trace(seed), trace(seed, vectorized=True)
+
+    assert len(scalar) > 100
+    assert len(scalar) == len(vectorized)
+    for turn, (scalar_robots, vectorized_robots) in enumerate(zip(scalar, vectorized)):
+        assert scalar_robots == vectorized_robots, f"engines diverged on turn {turn}"
+
+
+def test_engines_are_equivalent_in_crowded_battles(trace):
+    #: Many bullets explode against each other (their lines stay put while they're exploded).
+    scalar = trace(1, turns=400, robots=ROBOTS * 4)
+    vectorized = trace(1, vectorized=True, turns=400, robots=ROBOTS * 4)
+
+    assert len(scalar) > 300
+    for turn, (scalar_robots, vectorized_robots) in enumerate(zip(scalar, vectorized)):
+        assert scalar_robots == vectorized_robots, f"engines diverged on turn {turn}"
@@ -0,0 +1,182 @@
+import math
+from typing import List, Union
+
+from robopy.api import events
+from robopy.api.plan import Plan
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.execution import Scheduler
+
+
+class Idle(Robot):
+    #: Keeps the battle going.
+    def _run(self):
+        while True:
+            self.execute()
+
+
+class Planner(Robot):
+    #: Performs its plan, recording the turns it's woken up on.
+    PLAN: Plan = Plan()
+
+    def __init__(self, wrapper):
+        super().__init__(wrapper)
+
+        self.turns: List[int] = []
+
+    def execute(self):
+        super().execute()
+        self.turns.append(self.statistics.time)
+
+    def _run(self):
+        self.perform(type(self).PLAN, execute=True)
+        while True:
+            self.execute()
+
+
+class PlannedBattle(Battle):
+    #: Records the state of the planner (the robot of the first class) after each turn,
+    #: and disables it (by draining its energy) on DISABLED_TIME, if any.
+    DISABLED_TIME: Union[int, None] = None
+
+    def _setup(self):
+        super()._setup()
+        self.planner = next(
+            robot for robot, thread in self.robot_threads.items() if isinstance(thread, self.robot_classes[0])
+        )
+        self.records: List[dict] = []
+
+    def _logic(self, robots):
+        if self.statistics.time == PlannedBattle.DISABLED_TIME:
+            self.planner.energy = 0.0
+        super()._logic(robots)
+        self.records.append(dict(
+            time=self.statistics.time,
+            heading=self.planner.heading,
+            gun_heading=self.planner.gun_heading,
+            gun_heat=self.planner.gun_heat,
+            energy=self.planner.energy,
+            move=self.planner.command.move,
+            planning=self.planner.planning,
+        ))
+
+
+def run_battle(robot_class, turns: int = 100):
+    battle = PlannedBattle((2000, 2000), [robot_class, Idle], scheduler=Scheduler.SYNCHRONOUS, seed=3,
+                           max_turns=turns)
+    battle.daemon = True
+    battle.start()
+    battle.join(30)
+    assert not battle.is_alive()
+    robot = next(thread for thread in battle.robot_threads.values() if isinstance(thread, robot_class))
+    return robot, battle.records
+
+
+class MoveThenTurn(Planner):
+    PLAN: Plan = Plan().move(100).turn(math.radians(90))
+
+
+def test_steps_last_until_their_field_is_done():
+    robot, records = run_battle(MoveThenTurn)
+
+    heading = records[0]["heading"]
+    moved = next(record["time"] for record in records if record["move"] == 0)
+    #: The turn step starts once the move step is done.
+    assert all(record["heading"] == heading for record in records if record["time"] <= moved)
+    assert records[-1]["heading"] != heading
+    assert moved > 100 / 8
+
+    #: The robot isn't woken up until the last turn of its plan.
+    assert robot.turns[0] == max(record["time"] for record in records if record["planning"])
+
+
+class CoolFire(Planner):
+    PLAN: Plan = Plan().fire(1)
+
+
+def test_fire_waits_for_a_cool_gun():
+    _, records = run_battle(CoolFire)
+
+    fired = next(record["time"] for record in records if record["energy"] < 100)
+    cooled = next(record["time"] for record in records if record["gun_heat"] == 0)
+    #: The gun is cool after a turn, then it fires on the next one.
+    assert fired == cooled + 1
+    assert cooled > 1
+
+
+class Replanner(Planner):
+    #: A custom event on turn 20 replaces its plan by the plan of the handler.
+    PLAN: Plan = Plan().move(200).turn(math.radians(90))
+    NEW_PLAN: Plan = Plan().turn_gun(math.radians(45))
+
+    def _run(self):
+        self.add_custom_event("turn 20", lambda: self.statistics.time == 20)
+        super()._run()
+
+    def handle_custom(self, event: events.CustomEvent):
+        self.perform(type(self).NEW_PLAN)
+
+
+class EmptyReplanner(Replanner):
+    NEW_PLAN: Plan = Plan()
+
+
+def test_new_plans_replace_the_current_one():
+    robot, records = run_battle(Replanner)
+
+    #: The turn step of the first plan never starts, while the gun turns.
+    assert all(record["heading"] == records[0]["heading"] for record in records)
+    assert records[-1]["gun_heading"] != records[0]["gun_heading"]
+    #: The robot is woken up by the event, then on the last turn of the new plan.
+    assert robot.turns[:2] == [20, max(record["time"] for record in records if record["planning"])]
+
+
+def test_empty_plans_cancel_the_current_one():
+    robot, records = run_battle(EmptyReplanner)
+
+    assert all(record["heading"] == records[0]["heading"] for record in records)
+    assert records[-1]["gun_heading"] == records[0]["gun_heading"]
+    #: The robot goes on executing every turn right after the event.
+    assert robot.turns[:3] == [20, 21, 22]
+    assert not any(record["planning"] for record in records if record["time"] > 20)
+
+
+class Woken(Planner):
+    #: A long plan, interrupted by a custom event on turn 20 (while the plan goes on).
+    PLAN: Plan = Plan().move(1000).turn(math.radians(90))
+
+    def __init__(self, wrapper):
+        super().__init__(wrapper)
+
+        self.custom_turns: List[int] = []
+
+    def _run(self):
+        self.add_custom_event("turn 20", lambda: self.statistics.time == 20)
+        super()._run()
+
+    def handle_custom(self, event: events.CustomEvent):
+        self.custom_turns.append(event.time)
+
+
+def test_planning_robots_are_woken_by_events():
+    robot, records = run_battle(Woken)
+
+    assert robot.custom_turns == [20]
+    #: Then it goes on with its plan, parked again.
+    assert robot.turns == [20]
+    assert records[-1]["planning"]
+
+
+class Disabled(Planner):
+    PLAN: Plan = Plan().move(1000).turn(math.radians(90))
+
+
+def test_plans_are_cleared_when_robots_are_disabled(monkeypatch):
+    monkeypatch.setattr(PlannedBattle, "DISABLED_TIME", 20)
+    robot, records = run_battle(Disabled)
+
+    disabled = next(record["time"] for record in records if record["energy"] == 0)
+    assert all(record["planning"] for record in records if record["time"] <= disabled)
+    #: Its plan is cleared once the command of the turn is processed, and it's woken up.
+    assert not any(record["planning"] for record in records if record["time"] > disabled)
+    assert robot.turns[0] == disabled
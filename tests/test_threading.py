@@ -0,0 +1,115 @@
+import sys
+import threading
+import time
+
+from robopy.utils.threading import Mailbox, TurnBarrier
+
+
+def later(delay: float, action, *args) -> threading.Timer:
+    #: Runs the action on another thread after the delay.
+    timer = threading.Timer(delay, action, args)
+    timer.daemon = True
+    timer.start()
+    return timer
+
+
+def test_barriers_wait_until_the_deadline():
+    barrier = TurnBarrier()
+    barrier.arrive("a")
+
+    start = time.perf_counter()
+    arrived = barrier.wait(("a", "b"), 0.05)
+    elapsed = time.perf_counter() - start
+
+    #: Only the parties that have arrived are returned, once the deadline expires.
+    assert arrived == ("a",)
+    assert 0.05 <= elapsed < 1.0
+
+
+def test_barriers_return_once_the_last_party_arrives():
+    barrier = TurnBarrier()
+    barrier.arrive("b")
+    later(0.05, barrier.arrive, "a")
+
+    start = time.perf_counter()
+    arrived = barrier.wait(("a", "b"), 10.0)
+
+    #: In the given order, way before the deadline.
+    assert arrived == ("a", "b")
+    assert time.perf_counter() - start < 5.0
+
+
+def test_barriers_dont_wait_for_departed_parties():
+    barrier = TurnBarrier()
+    barrier.arrive("a")
+    barrier.depart("b")
+
+    start = time.perf_counter()
+    later(0.05, barrier.depart, "c")
+    arrived = barrier.wait(("a", "b", "c"), 10.0)
+
+    #: Parties departed before or while waiting aren't waited for (nor returned).
+    assert arrived == ("a",)
+    assert time.perf_counter() - start < 5.0
+
+
+def test_barriers_are_interrupted_when_woken():
+    barrier = TurnBarrier()
+    interrupted = threading.Event()
+    later(0.05, lambda: (interrupted.set(), barrier.wake()))
+
+    start = time.perf_counter()
+    arrived = barrier.wait(("a",), 10.0, interrupted.is_set)
+
+    assert arrived == ()
+    assert time.perf_counter() - start < 5.0
+
+
+def test_reset_parties_must_arrive_again():
+    barrier = TurnBarrier()
+    barrier.arrive("a")
+    barrier.arrive("b")
+    barrier.reset(("a",))
+
+    assert barrier.arrived(("a", "b")) == ("b",)
+    assert barrier.wait(("a", "b"), 0.01) == ("b",)
+
+
+def test_mailbox_writes_racing_a_swap_are_delivered_in_order():
+    mailbox = Mailbox()
+    mailbox.append(0)
+
+    #: The writer looks up the back buffer, then the reader swaps it out before the writer appends to it.
+    back = mailbox._Mailbox__back
+    assert mailbox.swap() == [0]
+    back.append(1)
+    mailbox.append(2)
+
+    assert len(mailbox) == 2
+    assert list(mailbox) == [1, 2]
+    assert mailbox.swap() == [1, 2]
+    assert mailbox.swap() == []
+
+
+def test_mailbox_delivers_every_write_in_order_under_contention():
+    items = 100000
+    mailbox = Mailbox()
+
+    def write():
+        for item in range(items):
+            mailbox.append(item)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+        received = []
+        while writer.is_alive():
+            received.extend(mailbox.swap())
+        writer.join()
+        received.extend(mailbox.swap())
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert received == list(range(items))
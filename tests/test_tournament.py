@@ -0,0 +1,62 @@
+import os
+
+from robopy.api.robot import Robot
+from robopy.core.execution import Scheduler
+from robopy.core.tournament import Tournament
+
+
+class Recorder(Robot):
+    #: Records the process running its battle (in the file named by ROBOPY_PIDS).
+    def _run(self):
+        with open(os.environ["ROBOPY_PIDS"], "a") as file:
+            file.write(f"{os.getpid()}\n")
+        while True:
+            self.execute()
+
+
+MATCHUPS = [
+    ("test_tournament.Recorder", "robopy.sample.walls.Walls"),
+    ("test_tournament.Recorder", "robopy.sample.spin_bot.SpinBot"),
+]
+
+
+def run_tournament(battles_per_worker=None) -> Tournament:
+    return Tournament((800, 600), MATCHUPS, rounds=3, workers=2, battles_per_worker=battles_per_worker,
+                      scheduler=Scheduler.SYNCHRONOUS, seed=1, max_turns=30)
+
+
+def test_results_are_streamed(tmp_path, monkeypatch):
+    monkeypatch.setenv("ROBOPY_PIDS", str(tmp_path / "pids"))
+    tournament = run_tournament()
+    battles = tournament.run()
+
+    #: The results of the first battle are merged as soon as it's yielded.
+    matchup, results = next(battles)
+    assert all(robot_results.rounds == 1 for robot_results in results.values())
+    assert sum(robot_results.rounds for robot_results in tournament.results[matchup].values()) == 2
+
+    streamed = [(matchup, results)] + list(battles)
+    assert len(streamed) == 6
+    for matchup in MATCHUPS:
+        assert sum(1 for streamed_matchup, _ in streamed if streamed_matchup == matchup) == 3
+        for robot_results in tournament.results[matchup].values():
+            assert robot_results.rounds == 3
+
+
+def test_workers_are_replaced(tmp_path, monkeypatch):
+    monkeypatch.setenv("ROBOPY_PIDS", str(tmp_path / "pids"))
+    tournament = run_tournament(battles_per_worker=1)
+    list(tournament.run())
+
+    #: Every battle is run by a new worker, but the seeded battles are the same.
+    pids = (tmp_path / "pids").read_text().split()
+    assert len(pids) == 6
+    assert len(set(pids)) == 6
+
+    reference = run_tournament()
+    list(reference.run())
+    for matchup in MATCHUPS:
+        for name, robot_results in tournament.results[matchup].items():
+            expected = reference.results[matchup][name]
+            assert (robot_results.rounds, robot_results.turns, robot_results.bullet_damage) == \
+                (expected.rounds, expected.turns, expected.bullet_damage)
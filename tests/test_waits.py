@@ -0,0 +1,101 @@
+import time
+from typing import List
+
+from robopy.api import events
+from robopy.api.robot import Robot
+from robopy.core.battle import Battle
+from robopy.core.conditions import MAX_STRIKES, TIME_BUDGET
+from robopy.core.execution import Scheduler
+
+
+class Idle(Robot):
+    #: Keeps the battle going.
+    def _run(self):
+        while True:
+            self.execute()
+
+
+class Parked(Robot):
+    #: Records the turns it's woken up on.
+    def __init__(self, wrapper):
+        super().__init__(wrapper)
+
+        self.turns: List[int] = []
+        self.custom_turns: List[int] = []
+        self.dropped: List[str] = []
+
+    def execute(self):
+        super().execute()
+        self.turns.append(self.statistics.time)
+
+    def handle_custom(self, event: events.CustomEvent):
+        self.custom_turns.append(event.time)
+
+    def handle_condition_dropped(self, event: events.ConditionDroppedEvent):
+        self.dropped.append(event.name)
+
+
+class FieldWait(Parked):
+    def _run(self):
+        self.move(100, execute=True)
+        self.moved = self.status["action_status"]["move"]
+
+
+class CallableWait(Parked):
+    def _run(self):
+        self.wait(lambda: self.statistics.time >= 50)
+
+
+class EventWait(Parked):
+    def _run(self):
+        self.add_custom_event("turn 30", lambda: self.statistics.time == 30)
+        self.wait(lambda: False)
+
+
+class SlowWait(Parked):
+    def _run(self):
+        def slow() -> bool:
+            deadline = time.thread_time() + 2 * TIME_BUDGET
+            while time.thread_time() < deadline:
+                pass
+            return False
+        self.wait(slow)
+
+
+def run_battle(robot_class, scheduler=Scheduler.SYNCHRONOUS, turns: int = 100) -> Parked:
+    battle = Battle((2000, 2000), [robot_class, Idle], scheduler=scheduler, turn_time=0.01, seed=3, max_turns=turns)
+    battle.daemon = True
+    battle.start()
+    battle.join(30)
+    assert not battle.is_alive()
+    return next(thread for thread in battle.robot_threads.values() if isinstance(thread, robot_class))
+
+
+def test_robots_waiting_for_a_field_are_parked():
+    robot = run_battle(FieldWait)
+
+    #: Its first command is processed on the first turn, and it isn't woken up again until it's moved.
+    assert len(robot.turns) == 1
+    assert robot.turns[0] > 100 / 8
+    assert robot.moved == 0
+
+
+def test_robots_waiting_for_a_callable_are_parked():
+    robot = run_battle(CallableWait)
+
+    assert robot.turns == [50]
+
+
+def test_parked_robots_are_woken_by_events():
+    robot = run_battle(EventWait)
+
+    assert robot.custom_turns == [30]
+    assert robot.turns == [30]
+
+
+def test_robots_are_told_when_their_wait_is_dropped():
+    robot = run_battle(SlowWait, Scheduler.BARRIER)
+
+    #: Then it evaluates its wait on its own, thus it's woken up every turn.
+    assert robot.dropped == ["wait"]
+    assert len(robot.turns) > 100 - 2 * MAX_STRIKES - 10